@@ -5,17 +5,20 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import ContentSwitcher, Footer, Header, ListItem, ListView, Static, TextLog
 
 from .services.paths import CORE_DIR
+from .services.search import launch_command
 from .views import (
     ChallengesView,
+    CommandPalette,
     DashboardView,
     ExamView,
     LearnView,
+    LessonScreen,
     PracticeView,
     SandboxView,
     SettingsView,
     TestView,
 )
-from .views.messages import RunCommand, UpdateContext
+from .views.messages import OpenSearchResult, RunCommand, UpdateContext
 from .widgets import CommandConsole
 
 
@@ -30,6 +33,15 @@ NAV_ITEMS = [
     ("settings", "Settings"),
 ]
 
+# View that hosts each kind of search result
+RESULT_VIEWS = {
+    "lesson": "learn",
+    "exercise": "practice",
+    "objective": "test",
+    "challenge": "test",
+    "scenario": "challenges",
+}
+
 
 class LpicEnterpriseApp(App):
     CSS_PATH = "styles.css"
@@ -37,6 +49,7 @@ class LpicEnterpriseApp(App):
         ("q", "quit", "Quit"),
         ("r", "refresh", "Refresh"),
         ("f1", "help", "Help"),
+        ("ctrl+p", "palette", "Search"),
     ]
 
     def compose(self) -> ComposeResult:
@@ -77,8 +90,11 @@ class LpicEnterpriseApp(App):
             return
         if event.item is None:
             return
-        view_id = event.item.id
+        self._show_view(event.item.id)
+
+    def _show_view(self, view_id: str) -> None:
         self.query_one("#content", ContentSwitcher).current = view_id
+        self.query_one("#nav-list", ListView).index = [key for key, _ in NAV_ITEMS].index(view_id)
         self.query_one("#context-info", Static).update(f"View: {view_id}")
         self.query_one("#activity-log", TextLog).write(f"Switched to {view_id}.")
 
@@ -91,12 +107,35 @@ class LpicEnterpriseApp(App):
         self.query_one("#context-info", Static).update(message.text)
         self.query_one("#activity-log", TextLog).write(message.text)
 
+    def on_open_search_result(self, message: OpenSearchResult) -> None:
+        doc = message.doc
+        self._show_view(RESULT_VIEWS.get(doc.kind, "dashboard"))
+        self.query_one("#activity-log", TextLog).write(f"Opened: {doc.title}")
+        if doc.kind == "challenge":
+            self.query_one(TestView).start_skill_session([doc.ref], doc.ref)
+            return
+        if doc.kind == "lesson":
+            section = doc.title.split(" › ", 1)[-1]
+            self.push_screen(LessonScreen(doc.ref, query=section))
+            return
+        if doc.kind == "scenario":
+            # Scenarios change the system, so they are only selected here
+            self.query_one(ChallengesView).select_scenario(doc.ref)
+            return
+        cmd = launch_command(doc)
+        self.query_one(CommandConsole).run(cmd, cwd=str(CORE_DIR))
+
+    def action_palette(self) -> None:
+        self.push_screen(CommandPalette())
+
     def action_refresh(self) -> None:
         self.query_one("#activity-log", TextLog).write("Refreshed.")
 
     def action_help(self) -> None:
         self.query_one("#context-info", Static).update(
-            "Help: Use the left nav to switch views. Console accepts input for running commands."
+            "Help: Use the left nav to switch views. Ctrl+P searches all training content. "
+            "Lessons open in a paged reader; use n/p to turn pages and l to run them live. "
+            "Console accepts input for running commands."
         )
 
 
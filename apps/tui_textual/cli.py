@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import argparse
+import shlex
+import sys
+from typing import List, Optional
+
+from .services.challenges import load_bank
+from .services.drills import DrillSession, latency_stats, load_drills
+from .services.inventory import INSTALL_SCRIPTS, build_inventory, command_sources, script_drift, table_drift
+from .services.lessons import lesson_status, lesson_topics, load_lesson, practice_fingerprint, strip_ansi
+from .services.search import KIND_LABELS, SEARCH_INDEX, launch_command, load_index
+
+
+def cmd_challenge(args: argparse.Namespace) -> int:
+    bank = load_bank()
+    if args.action == "list":
+        for challenge_id in bank.select(args.target or "all"):
+            challenge = bank.challenges[challenge_id]
+            print(f"{challenge.id}\t{challenge.objective}\t{challenge.description}")
+        return 0
+    if args.action == "pick":
+        challenge = bank.pick(args.target or "all")
+        if challenge is None:
+            return 1
+        print(challenge.id)
+        return 0
+    if args.action == "check":
+        if not args.target or bank.get(args.target) is None:
+            print(f"Unknown challenge: {args.target}", file=sys.stderr)
+            return 2
+        return 0 if bank.check(args.target, args.answer or "") else 1
+    return 2
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    if args.rebuild:
+        SEARCH_INDEX.unlink(missing_ok=True)
+    index = load_index()
+    hits = index.search(" ".join(args.query), limit=args.limit, kinds=args.kind or None)
+    if not hits:
+        print("No matches.", file=sys.stderr)
+        return 1
+    for number, hit in enumerate(hits, 1):
+        print(f"{number:3d}. {hit.label}")
+        print(f"     {shlex.join(launch_command(hit.doc))}")
+    return 0
+
+
+def cmd_lessons(args: argparse.Namespace) -> int:
+    topics = args.topics or lesson_topics()
+    unknown = sorted(set(topics) - set(lesson_topics()))
+    if unknown:
+        print(f"Unknown lesson: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    if args.action == "status":
+        practice = practice_fingerprint()
+        for topic in topics:
+            print(f"{topic}\t{lesson_status(topic, practice)}")
+        return 0
+    if args.action == "compile":
+        failed = 0
+        for topic in topics:
+            try:
+                lesson = load_lesson(topic, force=args.force)
+            except (OSError, RuntimeError) as exc:
+                print(f"{topic}\tfailed: {exc}", file=sys.stderr)
+                failed += 1
+                continue
+            examples = sum(len(s.examples) for s in lesson.sections)
+            print(f"{topic}\t{len(lesson.pages)} pages\t{examples} examples\t{lesson.duration * 1000:.0f} ms")
+        return 1 if failed else 0
+    if args.action == "show":
+        for topic in topics:
+            try:
+                lesson = load_lesson(topic)
+            except (OSError, RuntimeError) as exc:
+                print(f"{topic}: {exc}", file=sys.stderr)
+                return 1
+            print(lesson.title)
+            for section in lesson.sections:
+                print(f"\n== {section.title} ==")
+                for page in section.pages:
+                    print(page if args.color else strip_ansi(page))
+        return 0
+    return 2
+
+
+def _ms(value: Optional[int]) -> str:
+    return "-" if value is None else f"{value} ms"
+
+
+def cmd_drill(args: argparse.Namespace) -> int:
+    bank = load_drills()
+    if args.action == "list":
+        for question_id in bank.select(args.topic):
+            question = bank.questions[question_id]
+            print(f"{question.id}\t{question.prompt}\t{question.answer}")
+        return 0
+    if args.action == "stats":
+        stats = latency_stats(args.topic if args.topic != "all" else None, days=args.days)
+        if not stats:
+            print("No drill attempts recorded yet.", file=sys.stderr)
+            return 1
+        print(f"{'topic':<10} {'count':>5} {'acc':>4} {'p50':>8} {'p90':>8} {'p99':>8}  trend")
+        for stat in stats:
+            trend = "-" if stat.trend_ms is None else f"{stat.trend_ms:+d} ms"
+            print(
+                f"{stat.topic:<10} {stat.count:>5} {stat.accuracy:>3}% {_ms(stat.p50):>8} "
+                f"{_ms(stat.p90):>8} {_ms(stat.p99):>8}  {trend}"
+            )
+        return 0
+    session = DrillSession(bank, args.topic, rounds=args.rounds)
+    if session.done:
+        print(f"No drill questions for: {args.topic}", file=sys.stderr)
+        return 1
+    number = 0
+    while not session.done:
+        number += 1
+        question = session.next_question()
+        print(f"Q{number}: {question.prompt}")
+        try:
+            answer = input(">>> ")
+        except EOFError:
+            break
+        result = session.answer(answer)
+        if result.correct:
+            print(f"✓ {result.latency_ms} ms")
+        else:
+            print(f"✗ Answer: {question.answer} ({result.latency_ms} ms)")
+        print()
+    total = len(session.results)
+    if not total:
+        return 1
+    latencies = sorted(result.latency_ms for result in session.results)
+    print(f"Results: {session.correct}/{total} correct, median {latencies[total // 2]} ms per answer")
+    if session.correct == total:
+        print(f"Perfect! Your {args.topic} recall is solid.")
+    elif session.correct * 10 >= total * 7:
+        print("Good! Keep practicing to build speed.")
+    else:
+        print(f"Review the basics: lpic-train learn {args.topic}")
+    return 0 if session.correct == total else 1
+
+
+def cmd_inventory(args: argparse.Namespace) -> int:
+    if args.action == "check-table":
+        sources = command_sources(args.commands)
+        drift = [(family, row) for family in INSTALL_SCRIPTS for row in table_drift(family, sources)]
+        for family, (command, package) in drift:
+            print(f"{family}\t{command}\t{package}\tnot installed by {INSTALL_SCRIPTS[family].name}")
+        return 1 if drift else 0
+    inventory = build_inventory(args.commands, force=args.force)
+    if args.action == "which":
+        statuses = {status.command: status for status in inventory.commands}
+        for command in args.commands:
+            status = statuses[command]
+            print(f"{command}\t{status.package or '-'}\t{status.path or 'missing'}")
+        return 0 if all(statuses[command].found for command in args.commands) else 1
+    if args.action == "install":
+        if inventory.install_command:
+            print(inventory.install_command)
+        return 1 if inventory.missing else 0
+    required = [status for status in inventory.commands if status.required]
+    found = sum(1 for status in required if status.found)
+    source = "cached" if inventory.cached else "rebuilt"
+    print(f"ℹ Checked {len(required)} commands in {inventory.duration * 1000:.0f} ms "
+          f"(package index {source}, {inventory.family or 'no package database'})")
+    print(f"✓ Found: {found}")
+    if args.verbose:
+        for status in required:
+            mark = "✓" if status.found else "✗"
+            print(f"  {mark} {status.command:<20} {status.package or '-':<24} {','.join(status.sources)}")
+    if inventory.optional_missing:
+        names = " ".join(status.command for status in inventory.optional_missing)
+        print(f"ℹ Optional, not installed ({len(inventory.optional_missing)}): {names}")
+    if not inventory.missing:
+        print("✓ All essential commands available!")
+        return 0
+    print(f"✗ Missing: {len(inventory.missing)}")
+    print()
+    print("Missing commands:")
+    for status in inventory.missing:
+        print(f"  - {status.command:<20} {status.package or 'unknown package':<24} ({', '.join(status.sources)})")
+    print()
+    if inventory.install_command:
+        print("Install with:")
+        print(f"  {inventory.install_command}")
+    if inventory.unresolved:
+        names = " ".join(status.command for status in inventory.unresolved)
+        print(f"⚠ No package known for: {names}")
+    drift = script_drift(inventory)
+    if drift:
+        print(f"⚠ Not installed by the distro install script: {' '.join(drift)}")
+    return 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lpic1-engine", description="LPIC-1 training engine helpers")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    challenge = sub.add_parser("challenge", help="Query the compiled skill-checker challenge bank")
+    challenge.add_argument("action", choices=["list", "pick", "check"])
+    challenge.add_argument("target", nargs="?", help="Topic, objective or challenge ID")
+    challenge.add_argument("answer", nargs="?", help="Answer to check (check only)")
+    challenge.set_defaults(func=cmd_challenge)
+
+    search = sub.add_parser("search", help="Search lessons, exercises, objectives, challenges and scenarios")
+    search.add_argument("query", nargs="+")
+    search.add_argument("-k", "--kind", action="append", choices=sorted(KIND_LABELS), help="Restrict to a content kind")
+    search.add_argument("-n", "--limit", type=int, default=10)
+    search.add_argument("--rebuild", action="store_true", help="Discard the on-disk index first")
+    search.set_defaults(func=cmd_search)
+
+    drill = sub.add_parser("drill", help="Quick-fire recall drills with per-question timing")
+    drill.add_argument("action", choices=["run", "stats", "list"])
+    drill.add_argument("topic", nargs="?", default="all")
+    drill.add_argument("-n", "--rounds", type=int, default=10)
+    drill.add_argument("--days", type=int, default=14, help="Stats window in days")
+    drill.set_defaults(func=cmd_drill)
+
+    lessons = sub.add_parser("lessons", help="Compile and read pre-rendered lessons")
+    lessons.add_argument("action", choices=["compile", "status", "show"])
+    lessons.add_argument("topics", nargs="*", help="Lesson topics (default: all)")
+    lessons.add_argument("--force", action="store_true", help="Recompile even if the cache is fresh")
+    lessons.add_argument("--color", action="store_true", help="Keep ANSI colors (show only)")
+    lessons.set_defaults(func=cmd_lessons)
+
+    inventory = sub.add_parser("inventory", help="Check the LPIC-1 command surface against PATH and the package database")
+    inventory.add_argument("action", choices=["verify", "which", "install", "check-table"])
+    inventory.add_argument("commands", nargs="*", help="Essential commands to check in addition to the validators")
+    inventory.add_argument("-v", "--verbose", action="store_true", help="List every checked command")
+    inventory.add_argument("--force", action="store_true", help="Rebuild the package index even if it is fresh")
+    inventory.set_defaults(func=cmd_inventory)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import json
+import random
+import re
+import shlex
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from .paths import CACHE_DIR, SKILL_CHECKER
+
+
+CACHE_VERSION = 3
+BANK_CACHE = CACHE_DIR / "challenge-bank.json"
+
+_CHALLENGE_RE = re.compile(r'^CHALLENGES\["([a-z0-9_-]+)"\]="(.*)"\s*$', re.MULTILINE)
+_OBJECTIVE_RE = re.compile(r'^CHALLENGE_OBJECTIVES\["([a-z0-9_-]+)"\]="([0-9.]+)"\s*$', re.MULTILINE)
+_NUMERIC_FLAG_RE = re.compile(r"^-\d+$")
+
+# Placeholders in expected answers that match any argument. The wildcard is a
+# control character so it can never collide with a real token such as cron's *.
+PLACEHOLDERS: FrozenSet[str] = frozenset({"FILE", "HOST", "USERNAME", "SCRIPT"})
+WILDCARD = "\x00"
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    arg_flags: str = ""
+    bundle_args: Optional[str] = None
+    expression: bool = False
+    script: bool = False
+
+
+# Short flags that consume an argument, per command. Everything not listed
+# here is treated as a boolean flag. ``bundle_args`` marks commands that also
+# accept a dashless flag bundle (``tar czvf``, ``ps aux``).
+COMMAND_SPECS: Dict[str, CommandSpec] = {
+    "grep": CommandSpec(arg_flags="efmABCd"),
+    "egrep": CommandSpec(arg_flags="efmABCd"),
+    "sed": CommandSpec(arg_flags="ef", script=True),
+    "awk": CommandSpec(arg_flags="Ffv", script=True),
+    "tar": CommandSpec(arg_flags="fCTX", bundle_args="fCTX"),
+    "ps": CommandSpec(arg_flags="pCuUgGtoO", bundle_args=""),
+    "kill": CommandSpec(arg_flags="sn"),
+    "ping": CommandSpec(arg_flags="cwWiIsltQ"),
+    "useradd": CommandSpec(arg_flags="cdegGkKsuUp"),
+    "usermod": CommandSpec(arg_flags="cdegGlsuLp"),
+    "passwd": CommandSpec(arg_flags="nxwi"),
+    "ln": CommandSpec(arg_flags="tS"),
+    "cut": CommandSpec(arg_flags="dfcb"),
+    "sort": CommandSpec(arg_flags="tko"),
+    "head": CommandSpec(arg_flags="nc"),
+    "tail": CommandSpec(arg_flags="nc"),
+    "find": CommandSpec(expression=True),
+}
+
+# find predicates that take no argument
+_FIND_UNARY = {
+    "-print", "-print0", "-delete", "-empty", "-ls", "-prune", "-quit",
+    "-depth", "-mount", "-xdev", "-true", "-false", "-readable", "-writable",
+    "-executable", "-nouser", "-nogroup", "-not", "-o", "-or", "-a", "-and",
+}
+
+_SIGNALS = {"1": "HUP", "2": "INT", "3": "QUIT", "9": "KILL", "15": "TERM", "18": "CONT", "19": "STOP"}
+
+# ip objects may be abbreviated to any prefix; "show"/"list" is the default verb
+_IP_OBJECTS = ("address", "route", "link", "neighbour", "rule", "maddress")
+_IP_SHOW = {"s", "sh", "sho", "show", "l", "li", "lis", "list", "ls"}
+_OCTAL_MODE_RE = re.compile(r"^0*([0-7]{3,4})$")
+
+
+@dataclass(frozen=True)
+class Canonical:
+    command: str
+    options: Tuple[str, ...]
+    positionals: Tuple[str, ...]
+
+    def key(self, mask: Sequence[int] = ()) -> str:
+        args = list(self.positionals)
+        for index in mask:
+            if index < len(args):
+                args[index] = WILDCARD
+        return "\x1f".join([self.command, " ".join(self.options), "\x1e".join(args)])
+
+    @property
+    def mask(self) -> Tuple[int, ...]:
+        return tuple(i for i, arg in enumerate(self.positionals) if arg == WILDCARD)
+
+
+@dataclass(frozen=True)
+class Challenge:
+    id: str
+    topic: str
+    objective: str
+    description: str
+    answer: str
+    hint: str
+    accepted: FrozenSet[str]
+    masks: FrozenSet[Tuple[int, ...]]
+
+    def check(self, user_answer: str) -> bool:
+        canonical = canonicalize(user_answer)
+        if canonical is None:
+            return False
+        return any(canonical.key(mask) in self.accepted for mask in self.masks)
+
+
+def _signal_option(value: str) -> str:
+    value = value.lstrip("-").upper()
+    if value.isdigit():
+        return "-s=" + _SIGNALS.get(value, value)
+    if value.startswith("SIG"):
+        value = value[3:]
+    return "-s=" + value
+
+
+def signal_name(value: str) -> Optional[str]:
+    # "15", "-15", "term", "SIGTERM" -> "TERM"; None for anything else
+    name = _signal_option(value)[3:]
+    return name if name in _SIGNALS.values() else None
+
+
+def _ip_object(value: str) -> str:
+    for name in _IP_OBJECTS:
+        if name.startswith(value):
+            return name
+    return value
+
+
+def canonicalize(text: str, placeholders: bool = False) -> Optional[Canonical]:
+    try:
+        tokens = shlex.split(text.strip(), comments=False)
+    except ValueError:
+        return None
+    if not tokens:
+        return None
+
+    if tokens[0] == "sudo":
+        tokens = tokens[1:] or tokens
+    command = tokens[0]
+    spec = COMMAND_SPECS.get(command, CommandSpec())
+    options: List[str] = []
+    positionals: List[str] = []
+    rest = tokens[1:]
+
+    if spec.bundle_args is not None and rest and rest[0].isalpha():
+        for ch in rest.pop(0):
+            if ch in spec.bundle_args and rest:
+                options.append(f"-{ch}={rest.pop(0)}")
+            else:
+                options.append(f"-{ch}")
+
+    index = 0
+    only_positionals = False
+    while index < len(rest):
+        token = rest[index]
+        index += 1
+        if only_positionals or token == "-" or not token.startswith("-"):
+            if placeholders and token in PLACEHOLDERS:
+                token = WILDCARD
+            elif spec.script and not positionals and not any(o[:3] in ("-e=", "-f=") for o in options):
+                # Whitespace inside an awk/sed program is insignificant
+                token = re.sub(r"\s+", "", token)
+            positionals.append(token)
+            continue
+        if token == "--":
+            only_positionals = True
+            continue
+        if spec.expression:
+            if token in _FIND_UNARY or index >= len(rest):
+                options.append(token)
+            else:
+                options.append(f"{token}={rest[index]}")
+                index += 1
+            continue
+        if token.startswith("--"):
+            options.append(token)
+            continue
+        if command == "ps" and set(token[1:]) == set("aux"):
+            # procps reads -aux as the BSD bundle aux, not -a -u x
+            options.extend(f"-{ch}" for ch in token[1:])
+            continue
+        if command == "kill":
+            if token == "-s" and index < len(rest):
+                options.append(_signal_option(rest[index]))
+                index += 1
+            else:
+                options.append(_signal_option(token))
+            continue
+        if _NUMERIC_FLAG_RE.match(token):
+            options.append(token)
+            continue
+        flags = token[1:]
+        for pos, ch in enumerate(flags):
+            if ch in spec.arg_flags:
+                value = flags[pos + 1:]
+                if not value and index < len(rest):
+                    value = rest[index]
+                    index += 1
+                options.append(f"-{ch}={value}")
+                break
+            options.append(f"-{ch}")
+
+    if command == "kill" and not any(o.startswith("-s=") for o in options):
+        options.append("-s=TERM")
+    scripts = [o for o in options if o[:3] in ("-e=", "-f=")]
+    if command == "sed" and len(scripts) == 1 and scripts[0].startswith("-e="):
+        # A single sed -e SCRIPT is the bare SCRIPT form
+        options.remove(scripts[0])
+        positionals.insert(0, re.sub(r"\s+", "", scripts[0][3:]))
+    if spec.expression and not positionals:
+        positionals.append(".")
+    if command == "grep" and ("-r" in options or "-R" in options) and len(positionals) == 1:
+        positionals.append(".")
+    if command == "chmod" and positionals:
+        octal = _OCTAL_MODE_RE.match(positionals[0])
+        if octal:
+            positionals[0] = octal.group(1)
+    if command == "ip" and positionals:
+        positionals[0] = _ip_object(positionals[0])
+        if len(positionals) == 2 and positionals[1] in _IP_SHOW:
+            positionals.pop()
+    return Canonical(command, tuple(sorted(set(options))), tuple(positionals))
+
+
+@dataclass
+class ChallengeBank:
+    challenges: Dict[str, Challenge]
+    by_topic: Dict[str, Tuple[str, ...]]
+    by_objective: Dict[str, Tuple[str, ...]]
+
+    def get(self, challenge_id: str) -> Optional[Challenge]:
+        return self.challenges.get(challenge_id)
+
+    def topics(self) -> List[str]:
+        return sorted(self.by_topic.keys())
+
+    def select(self, selector: str = "all") -> Tuple[str, ...]:
+        if not selector or selector == "all":
+            return tuple(sorted(self.challenges.keys()))
+        if selector in self.by_topic:
+            return self.by_topic[selector]
+        if selector in self.by_objective:
+            return self.by_objective[selector]
+        if selector in self.challenges:
+            return (selector,)
+        # Topic-area selectors such as "103" cover every objective below them
+        ids: List[str] = []
+        for objective, members in sorted(self.by_objective.items()):
+            if objective.split(".")[0] == selector:
+                ids.extend(members)
+        return tuple(ids)
+
+    def pick(self, selector: str = "all", rng: Optional[random.Random] = None) -> Optional[Challenge]:
+        ids = self.select(selector)
+        if not ids:
+            return None
+        return self.challenges[(rng or random).choice(ids)]
+
+    def check(self, challenge_id: str, user_answer: str) -> bool:
+        challenge = self.challenges.get(challenge_id)
+        return challenge.check(user_answer) if challenge else False
+
+
+def _unescape(value: str) -> str:
+    return value.replace('\\"', '"').replace("\\$", "$").replace("\\\\", "\\")
+
+
+def parse_challenges(source: str) -> Tuple[Dict[str, Tuple[str, str, str]], Dict[str, str]]:
+    raw: Dict[str, Tuple[str, str, str]] = {}
+    for match in _CHALLENGE_RE.finditer(source):
+        description, answer, hint = (_unescape(match.group(2)).split("|", 2) + ["", ""])[:3]
+        raw[match.group(1)] = (description, answer, hint)
+    objectives = {m.group(1): m.group(2) for m in _OBJECTIVE_RE.finditer(source)}
+    return raw, objectives
+
+
+def compile_challenge(challenge_id: str, description: str, answer: str, hint: str, objective: str) -> Challenge:
+    accepted = set()
+    masks = set()
+    for alternative in answer.split(" OR "):
+        canonical = canonicalize(alternative, placeholders=True)
+        if canonical is None:
+            continue
+        accepted.add(canonical.key(canonical.mask))
+        masks.add(canonical.mask)
+    return Challenge(
+        id=challenge_id,
+        topic=challenge_id.split("-", 1)[0],
+        objective=objective,
+        description=description,
+        answer=answer,
+        hint=hint,
+        accepted=frozenset(accepted),
+        masks=frozenset(masks) or frozenset({()}),
+    )
+
+
+def _index(challenges: Iterable[Challenge]) -> ChallengeBank:
+    by_id: Dict[str, Challenge] = {}
+    by_topic: Dict[str, List[str]] = {}
+    by_objective: Dict[str, List[str]] = {}
+    for challenge in sorted(challenges, key=lambda c: c.id):
+        by_id[challenge.id] = challenge
+        by_topic.setdefault(challenge.topic, []).append(challenge.id)
+        if challenge.objective:
+            by_objective.setdefault(challenge.objective, []).append(challenge.id)
+    return ChallengeBank(
+        challenges=by_id,
+        by_topic={k: tuple(v) for k, v in by_topic.items()},
+        by_objective={k: tuple(v) for k, v in by_objective.items()},
+    )
+
+
+def compile_bank(source: str) -> ChallengeBank:
+    raw, objectives = parse_challenges(source)
+    return _index(
+        compile_challenge(cid, desc, answer, hint, objectives.get(cid.split("-", 1)[0], ""))
+        for cid, (desc, answer, hint) in raw.items()
+    )
+
+
+def _source_stamp(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_cache(cache: Path, stamp: List[int]) -> Optional[ChallengeBank]:
+    try:
+        data = json.loads(cache.read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != CACHE_VERSION or data.get("source") != stamp:
+        return None
+    return _index(
+        Challenge(
+            id=item["id"],
+            topic=item["topic"],
+            objective=item["objective"],
+            description=item["description"],
+            answer=item["answer"],
+            hint=item["hint"],
+            accepted=frozenset(item["accepted"]),
+            masks=frozenset(tuple(mask) for mask in item["masks"]),
+        )
+        for item in data.get("challenges", [])
+    )
+
+
+def _write_cache(cache: Path, stamp: List[int], bank: ChallengeBank) -> None:
+    payload = {
+        "version": CACHE_VERSION,
+        "source": stamp,
+        "challenges": [
+            {
+                "id": c.id,
+                "topic": c.topic,
+                "objective": c.objective,
+                "description": c.description,
+                "answer": c.answer,
+                "hint": c.hint,
+                "accepted": sorted(c.accepted),
+                "masks": sorted(list(mask) for mask in c.masks),
+            }
+            for c in bank.challenges.values()
+        ],
+    }
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(cache)
+    except OSError:
+        pass
+
+
+_BANK: Optional[ChallengeBank] = None
+_BANK_STAMP: Optional[List[int]] = None
+
+
+def load_bank(source: Path = SKILL_CHECKER, cache: Path = BANK_CACHE) -> ChallengeBank:
+    global _BANK, _BANK_STAMP
+    try:
+        stamp = _source_stamp(source)
+    except OSError:
+        return _index([])
+    if _BANK is not None and _BANK_STAMP == stamp:
+        return _BANK
+    bank = _read_cache(cache, stamp)
+    if bank is None:
+        bank = compile_bank(source.read_text(errors="ignore"))
+        _write_cache(cache, stamp, bank)
+    _BANK, _BANK_STAMP = bank, stamp
+    return bank
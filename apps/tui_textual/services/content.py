@@ -18,7 +18,9 @@ def load_topics() -> List[Topic]:
     topics: Dict[str, str] = {}
     if LPIC_TRAIN.exists():
         content = LPIC_TRAIN.read_text(errors="ignore")
-        for match in re.finditer(r"\[\"([a-z0-9_-]+)\"\]="\"([^\"]+)\"", content):
+        # Only the TOPICS table; TOPIC_ALIASES shares the same entry syntax
+        block = re.search(r"^TOPICS=\((.*?)^\)", content, re.MULTILINE | re.DOTALL)
+        for match in re.finditer(r'\["([a-z0-9_-]+)"\]="([^"]+)"', block.group(1) if block else ""):
             topics[match.group(1)] = match.group(2)
     if not topics:
         for lesson in LESSONS_DIR.glob("*.sh"):
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import re
+import sqlite3
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .challenges import signal_name
+from .paths import DB_FILE, LEARNING_HELPERS
+from .progress import ensure_schema
+
+
+DEFAULT_TOPIC = "default"
+
+# Lesson/practice topics that have a dedicated drill set under another name
+TOPIC_ALIASES = {"permissions": "chmod", "processes": "ps"}
+
+# Words in drill answers that stand for any single argument ("-u username")
+PLACEHOLDERS = frozenset({"username"})
+
+_FUNCTION_RE = re.compile(r"^_get_drill_question\(\) \{\n(.*?)^\}", re.MULTILINE | re.DOTALL)
+_CASE_RE = re.compile(r"^\s*([a-z0-9_|*-]+)\)\s*$")
+_DRILL_RE = re.compile(r'^\s*"([^"|]*)\|([^"]*)"\s*$')
+
+
+@dataclass(frozen=True)
+class DrillQuestion:
+    id: str
+    topic: str
+    prompt: str
+    answer: str
+
+    def check(self, user_answer: str) -> bool:
+        tokens = user_answer.split()
+        # The topic's own command may lead the answer ("grep -i" for "-i")
+        if len(tokens) > 1 and tokens[0] == self.topic and self.topic != DEFAULT_TOPIC:
+            tokens = tokens[1:]
+        if not tokens:
+            return False
+        return any(_matches(alt.split(), tokens) for alt in self.answer.split(" or "))
+
+
+def _matches(expected: List[str], tokens: List[str]) -> bool:
+    # Token for token: flags are case-sensitive (-E is not -e) and extra
+    # tokens are wrong; words ignore case and signals match by name
+    if len(expected) != len(tokens):
+        return False
+    if len(expected) == 1 and not expected[0].isdigit() and signal_name(expected[0]):
+        return signal_name(tokens[0]) == signal_name(expected[0])
+    for want, got in zip(expected, tokens):
+        if want in PLACEHOLDERS:
+            continue
+        if want.startswith("-") or got.startswith("-"):
+            if want != got:
+                return False
+        elif want.lower() != got.lower():
+            return False
+    return True
+
+
+def question_id(topic: str, prompt: str) -> str:
+    # Stable across reordering the drill table, unlike a position
+    return f"{topic}-{hashlib.sha1(prompt.encode()).hexdigest()[:8]}"
+
+
+@dataclass
+class DrillBank:
+    questions: Dict[str, DrillQuestion]
+    by_topic: Dict[str, Tuple[str, ...]]
+
+    def topics(self) -> List[str]:
+        return sorted(self.by_topic.keys())
+
+    def resolve(self, topic: str) -> str:
+        if not topic or topic == "all":
+            return "all"
+        topic = TOPIC_ALIASES.get(topic, topic)
+        return topic if topic in self.by_topic else DEFAULT_TOPIC
+
+    def select(self, topic: str) -> Tuple[str, ...]:
+        resolved = self.resolve(topic)
+        if resolved == "all":
+            return tuple(sorted(self.questions.keys()))
+        return self.by_topic.get(resolved, ())
+
+
+def parse_drills(source: str) -> DrillBank:
+    questions: Dict[str, DrillQuestion] = {}
+    by_topic: Dict[str, List[str]] = {}
+    body = _FUNCTION_RE.search(source)
+    labels: List[str] = []
+    for line in (body.group(1) if body else "").splitlines():
+        case = _CASE_RE.match(line)
+        if case:
+            labels = [DEFAULT_TOPIC if label == "*" else label for label in case.group(1).split("|")]
+            continue
+        drill = _DRILL_RE.match(line)
+        if not drill or not labels:
+            continue
+        for topic in labels:
+            ids = by_topic.setdefault(topic, [])
+            question = DrillQuestion(question_id(topic, drill.group(1)), topic, drill.group(1), drill.group(2))
+            if question.id in questions:
+                continue
+            questions[question.id] = question
+            ids.append(question.id)
+    return DrillBank(questions, {k: tuple(v) for k, v in by_topic.items()})
+
+
+_BANK: Optional[DrillBank] = None
+_BANK_STAMP: Optional[Tuple[int, int]] = None
+
+
+def load_drills(source: Path = LEARNING_HELPERS) -> DrillBank:
+    global _BANK, _BANK_STAMP
+    try:
+        stat = source.stat()
+    except OSError:
+        return DrillBank({}, {})
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if _BANK is None or _BANK_STAMP != stamp:
+        _BANK, _BANK_STAMP = parse_drills(source.read_text(errors="ignore")), stamp
+    return _BANK
+
+
+def record_drill_attempt(
+    question: DrillQuestion,
+    correct: bool,
+    latency_ms: int,
+    first_key_ms: Optional[int] = None,
+    db_path: Path = DB_FILE,
+) -> None:
+    if not db_path.exists():
+        return
+    try:
+        with sqlite3.connect(str(db_path)) as conn:
+            ensure_schema(conn, db_path)
+            conn.execute(
+                "INSERT INTO drill_attempts (question_id, topic, correct, latency_ms, first_key_ms) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (question.id, question.topic, 1 if correct else 0, latency_ms, first_key_ms),
+            )
+    except sqlite3.Error:
+        pass
+
+
+@dataclass
+class QuestionHistory:
+    attempts: int = 0
+    correct: int = 0
+    latency_ms: float = 0.0
+
+    def update(self, correct: bool, latency_ms: int) -> None:
+        # Exponentially weighted so recent speed-ups show quickly
+        self.latency_ms = latency_ms if not self.attempts else 0.7 * self.latency_ms + 0.3 * latency_ms
+        self.attempts += 1
+        self.correct += 1 if correct else 0
+
+
+def load_history(question_ids: Iterable[str], db_path: Path = DB_FILE) -> Dict[str, QuestionHistory]:
+    history: Dict[str, QuestionHistory] = {}
+    question_ids = sorted(set(question_ids))
+    if not question_ids or not db_path.exists():
+        return history
+    marks = ",".join("?" * len(question_ids))
+    try:
+        with sqlite3.connect(str(db_path)) as conn:
+            ensure_schema(conn, db_path)
+            rows = conn.execute(
+                f"SELECT question_id, COUNT(*), SUM(correct), AVG(latency_ms) FROM drill_attempts "
+                f"WHERE question_id IN ({marks}) GROUP BY question_id",
+                question_ids,
+            ).fetchall()
+    except sqlite3.Error:
+        return history
+    for question_id, attempts, correct, latency in rows:
+        history[question_id] = QuestionHistory(attempts, correct or 0, latency or 0.0)
+    return history
+
+
+@dataclass(frozen=True)
+class DrillResult:
+    question: DrillQuestion
+    answer: str
+    correct: bool
+    latency_ms: int
+    first_key_ms: Optional[int]
+
+
+@dataclass
+class DrillSession:
+    bank: DrillBank
+    topic: str
+    rounds: int = 10
+    db_path: Path = DB_FILE
+    rng: random.Random = field(default_factory=random.Random)
+    results: List[DrillResult] = field(default_factory=list)
+    current: Optional[DrillQuestion] = None
+
+    def __post_init__(self) -> None:
+        self._ids = self.bank.select(self.topic)
+        self._history = load_history(self._ids, self.db_path)
+        self._asked: Dict[str, int] = {}
+        self._shown_ns = 0
+        self._first_key_ns: Optional[int] = None
+
+    @property
+    def done(self) -> bool:
+        return not self._ids or len(self.results) >= self.rounds
+
+    @property
+    def correct(self) -> int:
+        return sum(1 for result in self.results if result.correct)
+
+    def _priority(self, question_id: str, median_ms: float) -> float:
+        if self.current is not None and question_id == self.current.id and len(self._ids) > 1:
+            return 0.0
+        history = self._history.get(question_id)
+        if history is None or not history.attempts:
+            score = 3.0
+        else:
+            error_rate = 1 - (history.correct + 1) / (history.attempts + 2)
+            slowness = history.latency_ms / median_ms if median_ms else 1.0
+            score = 1.0 + 2.0 * error_rate + slowness
+        return score / (1 + 2 * self._asked.get(question_id, 0))
+
+    def next_question(self) -> Optional[DrillQuestion]:
+        if self.done:
+            self.current = None
+            return None
+        latencies = [h.latency_ms for qid, h in self._history.items() if h.attempts and qid in self._ids]
+        median_ms = statistics.median(latencies) if latencies else 0.0
+        weights = [self._priority(qid, median_ms) for qid in self._ids]
+        if not any(weights):
+            weights = [1.0] * len(self._ids)
+        question_id = self.rng.choices(self._ids, weights=weights)[0]
+        self.current = self.bank.questions[question_id]
+        self._asked[question_id] = self._asked.get(question_id, 0) + 1
+        self._first_key_ns = None
+        self._shown_ns = time.monotonic_ns()
+        return self.current
+
+    def keystroke(self) -> None:
+        if self._first_key_ns is None:
+            self._first_key_ns = time.monotonic_ns()
+
+    def answer(self, text: str) -> Optional[DrillResult]:
+        if self.current is None:
+            return None
+        now = time.monotonic_ns()
+        question = self.current
+        latency_ms = (now - self._shown_ns) // 1_000_000
+        first_key_ms = None if self._first_key_ns is None else (self._first_key_ns - self._shown_ns) // 1_000_000
+        correct = question.check(text)
+        result = DrillResult(question, text, correct, latency_ms, first_key_ms)
+        self.results.append(result)
+        self._history.setdefault(question.id, QuestionHistory()).update(correct, latency_ms)
+        record_drill_attempt(question, correct, latency_ms, first_key_ms, self.db_path)
+        return result
+
+
+def percentile(values: List[int], pct: float) -> Optional[int]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    # Nearest-rank percentile
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    topic: str
+    count: int
+    accuracy: int
+    p50: Optional[int]
+    p90: Optional[int]
+    p99: Optional[int]
+    daily: Tuple[Optional[int], ...]
+    trend_ms: Optional[int]
+
+
+def latency_stats(topic: Optional[str] = None, days: int = 14, db_path: Path = DB_FILE) -> List[LatencyStats]:
+    if not db_path.exists():
+        return []
+    query = (
+        "SELECT topic, CAST(julianday('now') - julianday(answered_at) AS INTEGER), correct, latency_ms "
+        "FROM drill_attempts WHERE answered_at >= datetime('now', ?)"
+    )
+    params: List[object] = [f"-{days} days"]
+    if topic:
+        query += " AND topic = ?"
+        params.append(load_drills().resolve(topic))
+    try:
+        with sqlite3.connect(str(db_path)) as conn:
+            ensure_schema(conn, db_path)
+            rows = conn.execute(query, params).fetchall()
+    except sqlite3.Error:
+        return []
+
+    grouped: Dict[str, List[Tuple[int, int, int]]] = {}
+    for row_topic, age, correct, latency in rows:
+        grouped.setdefault(row_topic, []).append((min(age, days - 1), correct, latency))
+
+    stats: List[LatencyStats] = []
+    for row_topic, entries in sorted(grouped.items()):
+        latencies = [latency for _, _, latency in entries]
+        by_day: Dict[int, List[int]] = {}
+        for age, _, latency in entries:
+            by_day.setdefault(age, []).append(latency)
+        daily = tuple(percentile(by_day.get(age, []), 50) for age in range(days - 1, -1, -1))
+        half = days // 2
+        recent = [latency for age, _, latency in entries if age < half]
+        earlier = [latency for age, _, latency in entries if age >= half]
+        trend = None
+        if recent and earlier:
+            trend = int(statistics.median(recent) - statistics.median(earlier))
+        stats.append(
+            LatencyStats(
+                topic=row_topic,
+                count=len(entries),
+                accuracy=sum(correct for _, correct, _ in entries) * 100 // len(entries),
+                p50=percentile(latencies, 50),
+                p90=percentile(latencies, 90),
+                p99=percentile(latencies, 99),
+                daily=daily,
+                trend_ms=trend,
+            )
+        )
+    return stats
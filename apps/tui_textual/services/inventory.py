@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .paths import CACHE_DIR, DB_FILE, ENVIRONMENT_DIR, OBJECTIVES_DIR
+
+
+CACHE_VERSION = 1
+INVENTORY_CACHE = CACHE_DIR / "package-owners.json"
+COMMAND_PACKAGES = ENVIRONMENT_DIR / "command-packages.tsv"
+
+# sbin directories are not on every user's PATH but hold most admin tools
+SYSTEM_DIRS = ("/usr/local/sbin", "/usr/local/bin", "/usr/sbin", "/usr/bin", "/sbin", "/bin")
+BIN_DIRS = frozenset(SYSTEM_DIRS)
+
+# Package database files whose mtime changes on every install/remove
+PACKAGE_DBS: Dict[str, Tuple[str, ...]] = {
+    "deb": ("/var/lib/dpkg/status",),
+    "rpm": ("/usr/lib/sysimage/rpm/rpmdb.sqlite", "/var/lib/rpm/rpmdb.sqlite", "/var/lib/rpm/Packages"),
+}
+# One bulk query listing every packaged file in a bin directory
+OWNER_QUERIES: Dict[str, List[str]] = {
+    "deb": ["dpkg-query", "-S", "*bin/*"],
+    "rpm": ["rpm", "-qa", "--qf", "[%{FILENAMES}\t%{NAME}\n]"],
+}
+INSTALL_COMMANDS: Dict[str, str] = {
+    "deb": "sudo apt-get install -y",
+    "rpm": "sudo dnf install -y",
+}
+INSTALL_SCRIPTS: Dict[str, Path] = {
+    "deb": ENVIRONMENT_DIR / "install-packages-debian.sh",
+    "rpm": ENVIRONMENT_DIR / "install-packages-fedora.sh",
+}
+
+# Practised in the commands table but not programs on PATH
+SHELL_BUILTINS: FrozenSet[str] = frozenset(
+    "alias bg bind break builtin cd command continue declare dirs disown echo enable eval exec exit export "
+    "fc fg function getopts hash help history jobs let local logout popd printf pushd read readonly return "
+    "set shift shopt source suspend test times trap type typeset ulimit umask unalias unset wait".split()
+)
+
+_CHECK_RE = re.compile(r'check "[^"]*" "command -v ([^ "]+)"')
+_GUARD_RE = re.compile(r'(?:\b(?:if|elif)|\|\||&&)\s+!?\s*command -v ([^ ;&|]+)')
+_OPEN_RE = re.compile(r"^(?:if|case|for|while|until)\b")
+_CLOSE_RE = re.compile(r"^(?:fi|esac|done)\b|;\s*(?:fi|done)$")
+_INSTALL_RE = re.compile(r"(?:apt-get|dnf) install -y([^\n|&;]*)")
+_PACKAGE_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9.+_-]*$")
+
+SOURCE_ESSENTIAL = "essential"
+SOURCE_OBJECTIVE = "objective"
+SOURCE_PRACTICE = "practice"
+SOURCE_OPTIONAL = "optional"
+
+
+@dataclass(frozen=True)
+class CommandStatus:
+    command: str
+    sources: Tuple[str, ...]
+    path: Optional[str]
+    package: Optional[str]
+    applicable: bool = True
+
+    @property
+    def found(self) -> bool:
+        return self.path is not None
+
+    @property
+    def required(self) -> bool:
+        return self.applicable and self.sources != (SOURCE_OPTIONAL,)
+
+
+@dataclass(frozen=True)
+class Inventory:
+    family: Optional[str]
+    commands: Tuple[CommandStatus, ...]
+    duration: float
+    cached: bool
+
+    @property
+    def missing(self) -> List[CommandStatus]:
+        return [status for status in self.commands if status.required and not status.found]
+
+    @property
+    def optional_missing(self) -> List[CommandStatus]:
+        return [status for status in self.commands if not status.required and status.applicable and not status.found]
+
+    @property
+    def unresolved(self) -> List[CommandStatus]:
+        return [status for status in self.missing if not status.package]
+
+    @property
+    def packages(self) -> List[str]:
+        return sorted({status.package for status in self.missing if status.package})
+
+    @property
+    def install_command(self) -> Optional[str]:
+        if not self.packages or self.family not in INSTALL_COMMANDS:
+            return None
+        return f"{INSTALL_COMMANDS[self.family]} {' '.join(self.packages)}"
+
+
+def scan_path(path: Optional[str] = None) -> Dict[str, str]:
+    # One directory listing per PATH entry; the first hit wins like the shell
+    found: Dict[str, str] = {}
+    seen: Set[str] = set()
+    entries = (path if path is not None else os.environ.get("PATH", "")).split(os.pathsep)
+    for directory in [d for d in entries if d] + list(SYSTEM_DIRS):
+        real = os.path.realpath(directory)
+        if real in seen:
+            continue
+        seen.add(real)
+        try:
+            with os.scandir(directory) as listing:
+                for entry in listing:
+                    if entry.name in found:
+                        continue
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            found[entry.name] = entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return found
+
+
+def package_database() -> Tuple[Optional[str], Optional[Path]]:
+    for family, candidates in PACKAGE_DBS.items():
+        for candidate in candidates:
+            path = Path(candidate)
+            if path.exists():
+                return family, path
+    return None, None
+
+
+def _query_owners(family: str) -> Dict[str, str]:
+    try:
+        output = subprocess.run(
+            OWNER_QUERIES[family],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=60,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    owners: Dict[str, str] = {}
+    for line in output.splitlines():
+        if family == "deb":
+            # "pkg1, pkg2: /usr/bin/name" (diversion lines have no ": /")
+            packages, sep, path = line.partition(": /")
+            if not sep:
+                continue
+            path = "/" + path
+            package = packages.split(",")[0].split(":")[0].strip()
+        else:
+            path, sep, package = line.partition("\t")
+            if not sep:
+                continue
+        if os.path.dirname(path) in BIN_DIRS and package:
+            owners[path] = package
+    return owners
+
+
+def _write_cache(family: str, stamp: Dict[str, object], owners: Dict[str, str]) -> None:
+    payload = {"version": CACHE_VERSION, "family": family, "stamp": stamp, "owners": owners}
+    try:
+        INVENTORY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = INVENTORY_CACHE.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(INVENTORY_CACHE)
+    except OSError:
+        pass
+
+
+def load_owners(force: bool = False) -> Tuple[Optional[str], Dict[str, str], bool]:
+    # path -> package for everything installed in a bin directory, rebuilt
+    # only when the package database changes
+    family, db_path = package_database()
+    if family is None or db_path is None:
+        return None, {}, False
+    stat = db_path.stat()
+    stamp = {"db": str(db_path), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if not force:
+        try:
+            data = json.loads(INVENTORY_CACHE.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") == CACHE_VERSION and data.get("stamp") == stamp:
+            return family, data.get("owners", {}), True
+    owners = _query_owners(family)
+    _write_cache(family, stamp, owners)
+    return family, owners, False
+
+
+def _owner_names(owners: Dict[str, str]) -> Dict[str, str]:
+    # /bin and /usr/bin are the same directory on merged-/usr systems, so
+    # match on the file name; /usr entries win over the legacy symlinks
+    names: Dict[str, str] = {}
+    for path in sorted(owners, key=lambda p: not p.startswith("/usr/")):
+        names.setdefault(os.path.basename(path), owners[path])
+    return names
+
+
+def load_package_map(family: Optional[str], path: Path = COMMAND_PACKAGES) -> Dict[str, Optional[str]]:
+    # command -> package for the host's family; None means not applicable
+    column = {"deb": 1, "rpm": 2}.get(family or "")
+    if column is None:
+        return {}
+    mapping: Dict[str, Optional[str]] = {}
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return {}
+    for line in lines:
+        if not line or line.startswith("#"):
+            continue
+        fields = line.split("\t")
+        if len(fields) > column:
+            mapping[fields[0]] = None if fields[column] == "-" else fields[column]
+    return mapping
+
+
+def validator_commands(directory: Path = OBJECTIVES_DIR) -> Tuple[Set[str], Set[str]]:
+    # Checks at the top level of a validator are required; checks inside a
+    # conditional (distro or "if installed" guards) are optional
+    required: Set[str] = set()
+    optional: Set[str] = set()
+    for script in sorted(directory.glob("*.sh")):
+        depth = 0
+        try:
+            lines = script.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            text = line.strip()
+            if _OPEN_RE.match(text):
+                depth += 1
+            optional.update(_GUARD_RE.findall(text))
+            for command in _CHECK_RE.findall(text):
+                (required if depth == 0 else optional).add(command)
+            if _CLOSE_RE.search(text):
+                depth -= 1
+    return required, optional - required
+
+
+def practice_commands(db_path: Path = DB_FILE) -> Set[str]:
+    if not db_path.exists():
+        return set()
+    try:
+        with sqlite3.connect(str(db_path)) as conn:
+            rows = conn.execute("SELECT command FROM commands").fetchall()
+    except sqlite3.Error:
+        return set()
+    return {row[0] for row in rows if row[0] and " " not in row[0]} - SHELL_BUILTINS
+
+
+def command_sources(essential: Iterable[str] = (), db_path: Path = DB_FILE) -> Dict[str, Tuple[str, ...]]:
+    required, optional = validator_commands()
+    sources: Dict[str, List[str]] = {}
+    for source, commands in (
+        (SOURCE_ESSENTIAL, set(essential)),
+        (SOURCE_OBJECTIVE, required),
+        (SOURCE_PRACTICE, practice_commands(db_path)),
+        (SOURCE_OPTIONAL, optional),
+    ):
+        for command in commands:
+            sources.setdefault(command, []).append(source)
+    for command, found in sources.items():
+        if len(found) > 1 and SOURCE_OPTIONAL in found:
+            found.remove(SOURCE_OPTIONAL)
+    return {command: tuple(found) for command, found in sources.items()}
+
+
+def build_inventory(essential: Sequence[str] = (), force: bool = False) -> Inventory:
+    start = time.perf_counter()
+    executables = scan_path()
+    family, owners, cached = load_owners(force)
+    owner_names = _owner_names(owners)
+    package_map = load_package_map(family)
+    statuses: List[CommandStatus] = []
+    for command, sources in sorted(command_sources(essential).items()):
+        path = executables.get(command)
+        applicable = package_map.get(command, "") is not None
+        package: Optional[str] = None
+        if path is not None:
+            real = os.path.realpath(path)
+            package = owners.get(path) or owners.get(real) or owner_names.get(command) or owner_names.get(
+                os.path.basename(real)
+            )
+        if package is None:
+            package = package_map.get(command)
+        statuses.append(CommandStatus(command, sources, path, package, applicable or path is not None))
+    return Inventory(family, tuple(statuses), time.perf_counter() - start, cached)
+
+
+def install_script_packages(family: Optional[str]) -> Set[str]:
+    script = INSTALL_SCRIPTS.get(family or "")
+    if script is None:
+        return set()
+    try:
+        text = script.read_text()
+    except OSError:
+        return set()
+    packages: Set[str] = set()
+    # Continuation lines are joined first so "|| apt-get install -y other"
+    # fallbacks are read as installs of their own
+    for block in _INSTALL_RE.findall(text.replace("\\\n", " ")):
+        for token in block.split():
+            if token.startswith("2>"):
+                break
+            if _PACKAGE_RE.match(token):
+                packages.add(token)
+    return packages
+
+
+def script_drift(inventory: Inventory) -> List[str]:
+    # Missing packages the distro install script would not install either
+    listed = install_script_packages(inventory.family)
+    if not listed:
+        return []
+    return [package for package in inventory.packages if package not in listed]
+
+
+def table_drift(
+    family: Optional[str], sources: Dict[str, Tuple[str, ...]], path: Path = COMMAND_PACKAGES
+) -> List[Tuple[str, str]]:
+    # (command, package) rows of the table whose package the distro install
+    # script does not install; tools the validators only check when present
+    # are left to the user
+    listed = install_script_packages(family)
+    if not listed:
+        return []
+    return sorted(
+        (command, package)
+        for command, package in load_package_map(family, path).items()
+        if package and package not in listed and sources.get(command) != (SOURCE_OPTIONAL,)
+    )
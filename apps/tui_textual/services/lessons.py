@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .paths import CACHE_DIR, COMMON_SH, CORE_DIR, LESSONS_DIR, PRACTICE_DIR
+
+
+LESSON_CACHE_VERSION = 1
+LESSON_CACHE_DIR = CACHE_DIR / "lessons"
+COMPILE_TIMEOUT = 120
+
+_MARK = "\x1e"
+_SEP = "\x1f"
+_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_COMMAND_RE = re.compile(r"^\s*Command:\s*(.+?)\s*$")
+
+# Runs a lesson non-interactively: section headers and wait_for_user pauses
+# become markers in the captured output instead of terminal decoration/prompts.
+_DRIVER = f"""
+source "$LPIC_COMMON"
+PRACTICE_DIR="$LPIC_PRACTICE_DIR"
+print_header() {{ printf '{_MARK}TITLE{_SEP}%s\\n' "$1"; }}
+print_subheader() {{ printf '{_MARK}SECTION{_SEP}%s\\n' "$1"; }}
+wait_for_user() {{ printf '{_MARK}PAGE\\n'; }}
+confirm() {{ return 1; }}
+source "$LPIC_LESSON"
+"lesson_$LPIC_TOPIC"
+"""
+
+
+@dataclass(frozen=True)
+class LessonExample:
+    description: str
+    command: str
+    output: str
+
+
+@dataclass(frozen=True)
+class LessonSection:
+    title: str
+    pages: Tuple[str, ...]
+    examples: Tuple[LessonExample, ...]
+
+
+@dataclass(frozen=True)
+class CompiledLesson:
+    topic: str
+    title: str
+    sections: Tuple[LessonSection, ...]
+    compiled_at: float
+    duration: float
+
+    @property
+    def pages(self) -> List[Tuple[str, str]]:
+        return [(section.title, page) for section in self.sections for page in section.pages]
+
+    def find(self, query: str, start: int = 0) -> Optional[int]:
+        needle = query.lower()
+        pages = self.pages
+        for offset in range(len(pages)):
+            index = (start + offset) % len(pages)
+            section, text = pages[index]
+            if needle in section.lower() or needle in strip_ansi(text).lower():
+                return index
+        return None
+
+
+def strip_ansi(text: str) -> str:
+    return _ANSI_RE.sub("", text)
+
+
+def lesson_topics() -> List[str]:
+    return sorted(p.stem for p in LESSONS_DIR.glob("*.sh"))
+
+
+def _file_stamp(path: Path) -> List[int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return []
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def practice_fingerprint(root: Path = PRACTICE_DIR) -> str:
+    if not root.is_dir():
+        return "missing"
+    digest = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.lstat(path)
+            except OSError:
+                continue
+            digest.update(f"{os.path.relpath(path, root)}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def lesson_stamp(topic: str, practice: Optional[str] = None) -> Dict[str, object]:
+    return {
+        "lesson": _file_stamp(LESSONS_DIR / f"{topic}.sh"),
+        "common": _file_stamp(COMMON_SH),
+        "practice": practice if practice is not None else practice_fingerprint(),
+    }
+
+
+def _examples(page: str) -> List[LessonExample]:
+    examples: List[LessonExample] = []
+    lines = strip_ansi(page).split("\n")
+    index = 0
+    while index < len(lines):
+        match = _COMMAND_RE.match(lines[index])
+        index += 1
+        if not match:
+            continue
+        description = ""
+        for previous in reversed(lines[:index - 1]):
+            if previous.strip():
+                description = previous.strip() if previous.strip().startswith("Example") else ""
+                break
+        output: List[str] = []
+        while index < len(lines) and lines[index].strip() and not _COMMAND_RE.match(lines[index]):
+            if lines[index].strip().startswith("Example"):
+                break
+            if lines[index].strip() != "Output:":
+                output.append(lines[index])
+            index += 1
+        examples.append(LessonExample(description, match.group(1), "\n".join(output)))
+    return examples
+
+
+def parse_capture(topic: str, captured: str) -> Tuple[str, List[LessonSection]]:
+    title = topic
+    sections: List[LessonSection] = []
+    section_title = "Introduction"
+    pages: List[str] = []
+    page: List[str] = []
+
+    def flush_page() -> None:
+        text = "\n".join(page).strip("\n")
+        if text.strip():
+            pages.append(text)
+        page.clear()
+
+    def flush_section() -> None:
+        flush_page()
+        if pages:
+            examples = [example for text in pages for example in _examples(text)]
+            sections.append(LessonSection(section_title, tuple(pages), tuple(examples)))
+        pages.clear()
+
+    # str.splitlines() would also split on the \x1e/\x1f marker bytes
+    for line in captured.split("\n"):
+        if not line.startswith(_MARK):
+            page.append(line)
+            continue
+        kind, _, value = line[1:].partition(_SEP)
+        if kind == "TITLE":
+            title = value
+        elif kind == "SECTION":
+            flush_section()
+            section_title = value
+        elif kind == "PAGE":
+            flush_page()
+    flush_section()
+    return title, sections
+
+
+def compile_lesson(topic: str, practice: Optional[str] = None) -> CompiledLesson:
+    lesson_file = LESSONS_DIR / f"{topic}.sh"
+    if not lesson_file.exists():
+        raise FileNotFoundError(lesson_file)
+    stamp = lesson_stamp(topic, practice)
+    env = dict(os.environ)
+    env.update(
+        LPIC_COMMON=str(COMMON_SH),
+        LPIC_PRACTICE_DIR=str(PRACTICE_DIR),
+        LPIC_LESSON=str(lesson_file),
+        LPIC_TOPIC=topic,
+        LANG=env.get("LANG") or "C.UTF-8",
+        COLUMNS="100",
+    )
+    started = time.monotonic()
+    try:
+        result = subprocess.run(
+            ["bash", "-c", _DRIVER],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=str(PRACTICE_DIR if PRACTICE_DIR.is_dir() else CORE_DIR),
+            env=env,
+            timeout=COMPILE_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"{topic} lesson timed out after {COMPILE_TIMEOUT} s") from None
+    duration = time.monotonic() - started
+    captured = result.stdout.decode(errors="replace")
+    # A failed run leaves a partial capture; never cache it as fresh
+    if result.returncode != 0:
+        message = f"{topic} lesson exited with status {result.returncode}"
+        lines = strip_ansi(captured).strip().splitlines()
+        raise RuntimeError(f"{message}: {lines[-1]}" if lines else message)
+    title, sections = parse_capture(topic, captured)
+    lesson = CompiledLesson(topic, title, tuple(sections), time.time(), duration)
+    _write_cache(lesson, stamp)
+    return lesson
+
+
+def _cache_file(topic: str) -> Path:
+    return LESSON_CACHE_DIR / f"{topic}.json"
+
+
+def _write_cache(lesson: CompiledLesson, stamp: Dict[str, object]) -> None:
+    payload = {
+        "version": LESSON_CACHE_VERSION,
+        "stamp": stamp,
+        "topic": lesson.topic,
+        "title": lesson.title,
+        "compiled_at": lesson.compiled_at,
+        "duration": lesson.duration,
+        "sections": [
+            {
+                "title": section.title,
+                "pages": list(section.pages),
+                "examples": [[e.description, e.command, e.output] for e in section.examples],
+            }
+            for section in lesson.sections
+        ],
+    }
+    try:
+        LESSON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _cache_file(lesson.topic).with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(_cache_file(lesson.topic))
+    except OSError:
+        pass
+
+
+def _read_cache(topic: str) -> Optional[Tuple[CompiledLesson, Dict[str, object]]]:
+    try:
+        data = json.loads(_cache_file(topic).read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != LESSON_CACHE_VERSION:
+        return None
+    sections = tuple(
+        LessonSection(
+            s["title"],
+            tuple(s["pages"]),
+            tuple(LessonExample(*example) for example in s["examples"]),
+        )
+        for s in data.get("sections", [])
+    )
+    lesson = CompiledLesson(data["topic"], data["title"], sections, data["compiled_at"], data["duration"])
+    return lesson, data.get("stamp", {})
+
+
+def cached_lesson(topic: str, practice: Optional[str] = None) -> Optional[CompiledLesson]:
+    cached = _read_cache(topic)
+    if cached is None:
+        return None
+    lesson, stamp = cached
+    return lesson if stamp == lesson_stamp(topic, practice) else None
+
+
+def lesson_status(topic: str, practice: Optional[str] = None) -> str:
+    cached = _read_cache(topic)
+    if cached is None:
+        return "missing"
+    return "fresh" if cached[1] == lesson_stamp(topic, practice) else "stale"
+
+
+def load_lesson(topic: str, force: bool = False) -> CompiledLesson:
+    lesson = None if force else cached_lesson(topic)
+    return lesson or compile_lesson(topic)
@@ -10,11 +10,19 @@ TRAINING_DIR = CORE_DIR / "training"
 LESSONS_DIR = TRAINING_DIR / "lessons"
 EXERCISES_DIR = TRAINING_DIR / "exercises"
 SCENARIOS_DIR = REPO_ROOT / "content" / "scenarios"
+ENVIRONMENT_DIR = REPO_ROOT / "content" / "environment"
+OBJECTIVES_DIR = CORE_DIR / "objectives"
+COMMON_SH = TRAINING_DIR / "common.sh"
+LEARNING_HELPERS = TRAINING_DIR / "learning-helpers.sh"
 
 LPIC_DIR = Path(os.environ.get("LPIC_DIR", "/opt/LPIC-1/data"))
 DB_FILE = LPIC_DIR / "progress.db"
+PRACTICE_DIR = Path(os.environ.get("LPIC_PRACTICE_DIR", "/opt/LPIC-1/practice"))
+CACHE_DIR = Path(os.environ.get("LPIC_CACHE_DIR", Path.home() / ".lpic1" / "cache"))
 
 LPIC_CHECK = CORE_DIR / "lpic-check"
 LPIC_TRAIN = CORE_DIR / "lpic-train"
 SKILL_CHECKER = CORE_DIR / "skill-checker.sh"
 INIT_PROGRESS = CORE_DIR / "init-progress.sh"
+PROGRESS_SCHEMA = CORE_DIR / "progress-schema.sql"
+PROGRESS_ROLLUP = CORE_DIR / "progress-rollup.sql"
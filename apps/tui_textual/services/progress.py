@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
 
-from .paths import DB_FILE
+from .paths import DB_FILE, PROGRESS_ROLLUP, PROGRESS_SCHEMA
 
 
 @dataclass(frozen=True)
@@ -14,6 +16,145 @@ class ProgressSummary:
     percent: int
 
 
+_SCHEMA_READY: Set[str] = set()
+
+
+def ensure_schema(conn: sqlite3.Connection, db_path: Path = DB_FILE) -> None:
+    # progress-schema.sql is idempotent; apply it once per database per process
+    if str(db_path) in _SCHEMA_READY:
+        return
+    try:
+        conn.executescript(PROGRESS_SCHEMA.read_text())
+    except OSError:
+        return
+    _SCHEMA_READY.add(str(db_path))
+
+
+@dataclass(frozen=True)
+class DueReview:
+    exercise_id: str
+    topic: str
+    due_at: str
+    attempts: int
+    successes: int
+
+    @property
+    def exercise(self) -> str:
+        return self.exercise_id.split(":", 1)[-1]
+
+
+def load_due_reviews(limit: int = 5, db_path: Path = DB_FILE) -> List[DueReview]:
+    if not db_path.exists():
+        return []
+    try:
+        with sqlite3.connect(str(db_path)) as conn:
+            ensure_schema(conn, db_path)
+            rows = conn.execute(
+                "SELECT exercise_id, topic, due_at, attempts, successes FROM review_queue "
+                "WHERE due_at <= datetime('now') ORDER BY due_at LIMIT ?",
+                (limit,),
+            ).fetchall()
+    except sqlite3.Error:
+        return []
+    return [DueReview(*row) for row in rows]
+
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values: Sequence[int]) -> str:
+    top = max(values, default=0)
+    if top <= 0:
+        return "·" * len(values)
+    return "".join("·" if value <= 0 else SPARK_BLOCKS[(value - 1) * len(SPARK_BLOCKS) // top] for value in values)
+
+
+@dataclass
+class ActivitySeries:
+    key: str
+    attempts: List[int] = field(default_factory=list)
+    successes: List[int] = field(default_factory=list)
+    sessions: List[int] = field(default_factory=list)
+    latency_ms: List[Optional[int]] = field(default_factory=list)
+
+    @property
+    def activity(self) -> List[int]:
+        return [a + s for a, s in zip(self.attempts, self.sessions)]
+
+    @property
+    def accuracy(self) -> Optional[int]:
+        total = sum(self.attempts)
+        return int(sum(self.successes) * 100 / total) if total else None
+
+    @property
+    def mean_latency_ms(self) -> Optional[int]:
+        known = [value for value in self.latency_ms if value is not None]
+        return int(sum(known) / len(known)) if known else None
+
+
+def refresh_rollups(db_path: Path = DB_FILE) -> None:
+    # Incremental: only rows added since the last refresh are folded in. This
+    # takes a write lock, so callers refresh once and then read the series.
+    if not db_path.exists():
+        return
+    try:
+        script = PROGRESS_ROLLUP.read_text()
+        with sqlite3.connect(str(db_path)) as conn:
+            ensure_schema(conn, db_path)
+            conn.executescript(script)
+    except (OSError, sqlite3.Error):
+        return
+
+
+def _load_series(table: str, column: str, scope: str, periods: List[str], db_path: Path) -> Dict[str, ActivitySeries]:
+    if not db_path.exists() or not periods:
+        return {}
+    try:
+        with sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True) as conn:
+            rows = conn.execute(
+                f"SELECT key, {column}, attempts, successes, sessions, latency_ms_total, latency_count "
+                f"FROM {table} WHERE scope = ? AND {column} >= ? ORDER BY key",
+                (scope, periods[0]),
+            ).fetchall()
+    except sqlite3.Error:
+        return {}
+    index = {period: position for position, period in enumerate(periods)}
+    series: Dict[str, ActivitySeries] = {}
+    for key, period, attempts, successes, sessions, latency_total, latency_count in rows:
+        position = index.get(period)
+        if position is None:
+            continue
+        entry = series.get(key)
+        if entry is None:
+            entry = series[key] = ActivitySeries(
+                key,
+                [0] * len(periods),
+                [0] * len(periods),
+                [0] * len(periods),
+                [None] * len(periods),
+            )
+        entry.attempts[position] = attempts
+        entry.successes[position] = successes
+        entry.sessions[position] = sessions
+        if latency_count:
+            entry.latency_ms[position] = int(latency_total / latency_count)
+    return series
+
+
+def load_daily_series(scope: str = "topic", days: int = 14, db_path: Path = DB_FILE) -> Dict[str, ActivitySeries]:
+    # Day buckets are UTC like the datetime('now') stamps they come from
+    today = datetime.now(timezone.utc).date()
+    periods = [(today - timedelta(days=offset)).isoformat() for offset in range(days - 1, -1, -1)]
+    return _load_series("progress_daily", "day", scope, periods, db_path)
+
+
+def load_weekly_series(scope: str = "topic", weeks: int = 12, db_path: Path = DB_FILE) -> Dict[str, ActivitySeries]:
+    today = datetime.now(timezone.utc).date()
+    monday = today - timedelta(days=today.weekday())
+    periods = [(monday - timedelta(weeks=offset)).isoformat() for offset in range(weeks - 1, -1, -1)]
+    return _load_series("progress_weekly", "week", scope, periods, db_path)
+
+
 def load_progress(db_path: Path = DB_FILE) -> ProgressSummary:
     if not db_path.exists():
         return ProgressSummary(0, 0, 0)
@@ -25,3 +166,17 @@ def load_progress(db_path: Path = DB_FILE) -> ProgressSummary:
         return ProgressSummary(completed, total, percent)
     except sqlite3.Error:
         return ProgressSummary(0, 0, 0)
+
+
+def record_command_attempt(command: str, success: bool, db_path: Path = DB_FILE) -> None:
+    if not db_path.exists():
+        return
+    try:
+        with sqlite3.connect(str(db_path)) as conn:
+            conn.execute(
+                "UPDATE commands SET attempts = attempts + 1, successes = successes + ?, "
+                "last_practiced = datetime('now') WHERE command = ?",
+                (1 if success else 0, command),
+            )
+    except sqlite3.Error:
+        pass
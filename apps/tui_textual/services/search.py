@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .challenges import parse_challenges
+from .paths import (
+    CACHE_DIR,
+    EXERCISES_DIR,
+    INIT_PROGRESS,
+    LESSONS_DIR,
+    LPIC_CHECK,
+    LPIC_TRAIN,
+    REPO_ROOT,
+    SCENARIOS_DIR,
+    SKILL_CHECKER,
+)
+
+
+INDEX_VERSION = 1
+SEARCH_INDEX = CACHE_DIR / "search-index.json"
+
+TITLE_WEIGHT = 3
+KIND_LABELS = {
+    "lesson": "Lesson",
+    "exercise": "Exercise",
+    "objective": "Objective",
+    "challenge": "Challenge",
+    "scenario": "Scenario",
+}
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "if", "in",
+    "is", "it", "its", "of", "on", "or", "that", "the", "this", "to", "use", "with",
+    "you", "your", "what", "will", "can", "do", "not", "all",
+}
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9_.+-]*")
+_ANSI_RE = re.compile(r"\\033\[[0-9;]*m|\$\{[A-Za-z_][A-Za-z0-9_]*(?::-[^}]*)?\}|\$[A-Za-z_][A-Za-z0-9_]*")
+_DOUBLE_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_SINGLE_RE = re.compile(r"'([^']*)'")
+_HEREDOC_RE = re.compile(r"<<-?\s*['\"]?([A-Z_]+)['\"]?")
+_DISPLAY_RE = re.compile(r"^\s*(echo|printf|print_\w+|show_\w+)\b")
+_FUNCTION_RE = re.compile(r"^([a-z_][a-z0-9_]*)\(\)\s*\{", re.MULTILINE)
+_OBJECTIVE_ROW_RE = re.compile(r"\('(\d{3}\.\d)',\s*'\d{3}',\s*'[\d.]+',\s*'([^']+)',\s*\d+\)")
+_COMMAND_ROW_RE = re.compile(r"\('([A-Za-z0-9_.+-]+)',\s*'(\d{3}\.\d)'\)")
+_SCENARIO_RE = re.compile(r'^SCENARIOS\["([a-z0-9_-]+)"\]="([^"]*)"', re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class SearchDoc:
+    id: str
+    kind: str
+    ref: str
+    title: str
+    source: str
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    doc: SearchDoc
+    score: float
+
+    @property
+    def label(self) -> str:
+        return f"{KIND_LABELS.get(self.doc.kind, self.doc.kind)}: {self.doc.title}"
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        token = token.rstrip(".-+")
+        if len(token) > 1 and token not in _STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def _clean(text: str) -> str:
+    text = _ANSI_RE.sub(" ", text)
+    return text.replace("\\n", " ").replace("\\t", " ").replace('\\"', '"')
+
+
+def _display_text(lines: Iterable[str]) -> str:
+    # Text a script shows the user: echo/print_* strings and heredoc bodies
+    parts: List[str] = []
+    heredoc: Optional[str] = None
+    for line in lines:
+        if heredoc is not None:
+            if line.strip() == heredoc:
+                heredoc = None
+            else:
+                parts.append(line)
+            continue
+        match = _HEREDOC_RE.search(line)
+        if match and "sqlite3" not in line:
+            heredoc = match.group(1)
+            continue
+        if _DISPLAY_RE.match(line):
+            parts.extend(_DOUBLE_RE.findall(line))
+            parts.extend(_SINGLE_RE.findall(line))
+    return _clean(" ".join(parts))
+
+
+def _first_string(line: str) -> str:
+    match = _DOUBLE_RE.search(line) or _SINGLE_RE.search(line)
+    return _clean(match.group(1)).strip() if match else ""
+
+
+def _functions(source: str) -> List[Tuple[str, List[str]]]:
+    matches = list(_FUNCTION_RE.finditer(source))
+    bodies = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(source)
+        bodies.append((match.group(1), source[match.end():end].splitlines()))
+    return bodies
+
+
+Extracted = List[Tuple[SearchDoc, str]]
+
+
+def _extract_lesson(path: Path, rel: str) -> Extracted:
+    topic = path.stem
+    docs: Extracted = []
+    title = topic
+    section = "Introduction"
+    lines: List[str] = []
+
+    def flush() -> None:
+        if lines:
+            n = len(docs)
+            doc = SearchDoc(f"lesson:{topic}:{n}", "lesson", topic, f"{topic} › {section}", rel)
+            docs.append((doc, f"{title} {section} {_display_text(lines)}"))
+
+    for line in path.read_text(errors="ignore").splitlines():
+        stripped = line.strip()
+        if stripped.startswith("print_header "):
+            title = _first_string(stripped) or title
+            continue
+        if stripped.startswith("print_subheader "):
+            flush()
+            section = _first_string(stripped) or section
+            lines = []
+            continue
+        lines.append(line)
+    flush()
+    return docs
+
+
+def _extract_exercises(path: Path, rel: str) -> Extracted:
+    topic = path.name.replace("-exercises.sh", "")
+    docs: Extracted = []
+    for name, body in _functions(path.read_text(errors="ignore")):
+        if not name.startswith("exercise_"):
+            continue
+        title = name
+        for line in body:
+            if line.strip().startswith("print_exercise "):
+                title = _first_string(line) or name
+                break
+        doc = SearchDoc(f"exercise:{topic}:{name}", "exercise", f"{topic}:{name}", title, rel)
+        docs.append((doc, f"{topic} {title} {_display_text(body)}"))
+    return docs
+
+
+def _extract_objectives(path: Path, rel: str) -> Extracted:
+    source = path.read_text(errors="ignore")
+    commands: Dict[str, List[str]] = {}
+    for command, objective in _COMMAND_ROW_RE.findall(source):
+        commands.setdefault(objective, []).append(command)
+    docs: Extracted = []
+    for objective, title in _OBJECTIVE_ROW_RE.findall(source):
+        doc = SearchDoc(f"objective:{objective}", "objective", objective, f"{objective} {title}", rel)
+        docs.append((doc, f"{objective} {title} {' '.join(commands.get(objective, []))}"))
+    return docs
+
+
+def _extract_challenges(path: Path, rel: str) -> Extracted:
+    raw, objectives = parse_challenges(path.read_text(errors="ignore"))
+    docs: Extracted = []
+    for challenge_id, (description, answer, _hint) in sorted(raw.items()):
+        topic = challenge_id.split("-", 1)[0]
+        doc = SearchDoc(f"challenge:{challenge_id}", "challenge", challenge_id, description, rel)
+        docs.append((doc, f"{challenge_id} {topic} {objectives.get(topic, '')} {description} {answer}"))
+    return docs
+
+
+def _extract_scenario(path: Path, rel: str) -> Extracted:
+    source = path.read_text(errors="ignore")
+    header = ""
+    for line in source.splitlines()[1:4]:
+        if line.startswith("# LPIC-1"):
+            header = line.split(":", 1)[-1].strip()
+    folder = path.parent.name
+    base = f"{folder}/{path.name}"
+    variants = _SCENARIO_RE.findall(source)
+    if variants:
+        return [
+            (
+                SearchDoc(f"scenario:{base}:{variant}", "scenario", f"{base}:{variant}", f"{header}: {desc}", rel),
+                f"{header} {variant} {desc} {folder}",
+            )
+            for variant, desc in variants
+        ]
+    body = _display_text(source.splitlines())
+    return [(SearchDoc(f"scenario:{base}", "scenario", base, header or path.stem, rel), f"{header} {folder} {body}")]
+
+
+def content_sources() -> List[Tuple[Path, str]]:
+    sources: List[Tuple[Path, str]] = []
+    sources += [(p, "lesson") for p in sorted(LESSONS_DIR.glob("*.sh"))]
+    sources += [(p, "exercise") for p in sorted(EXERCISES_DIR.glob("*-exercises.sh"))]
+    sources += [(INIT_PROGRESS, "objective"), (SKILL_CHECKER, "challenge")]
+    for folder in ("break-fix", "build"):
+        sources += [(p, "scenario") for p in sorted((SCENARIOS_DIR / folder).glob("*.sh"))]
+    return [(p, kind) for p, kind in sources if p.exists()]
+
+
+_EXTRACTORS = {
+    "lesson": _extract_lesson,
+    "exercise": _extract_exercises,
+    "objective": _extract_objectives,
+    "challenge": _extract_challenges,
+    "scenario": _extract_scenario,
+}
+
+
+def _relative(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    # Optimal string alignment distance (a transposition counts as one edit)
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(term: str) -> List[str]:
+    return [term[:i] + term[i + 1:] for i in range(len(term))]
+
+
+class SearchIndex:
+    def __init__(self) -> None:
+        self.sources: Dict[str, List[int]] = {}
+        self.docs: Dict[str, SearchDoc] = {}
+        self.doc_terms: Dict[str, Dict[str, int]] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self._neighbours: Optional[Dict[str, List[str]]] = None
+
+    def _add(self, doc: SearchDoc, text: str) -> None:
+        terms = Counter(tokenize(text))
+        for term in tokenize(doc.title):
+            terms[term] += TITLE_WEIGHT
+        self.docs[doc.id] = doc
+        self.doc_terms[doc.id] = dict(terms)
+        for term, weight in terms.items():
+            self.postings.setdefault(term, {})[doc.id] = weight
+
+    def _remove_source(self, rel: str) -> None:
+        for doc_id in [d.id for d in self.docs.values() if d.source == rel]:
+            for term in self.doc_terms.pop(doc_id, {}):
+                postings = self.postings.get(term)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self.postings[term]
+            del self.docs[doc_id]
+        self.sources.pop(rel, None)
+
+    def refresh(self, sources: Optional[List[Tuple[Path, str]]] = None) -> int:
+        # Re-extract only the sources whose mtime/size changed
+        sources = content_sources() if sources is None else sources
+        seen = set()
+        changed = 0
+        for path, kind in sources:
+            rel = _relative(path)
+            seen.add(rel)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            if self.sources.get(rel) == stamp:
+                continue
+            self._remove_source(rel)
+            for doc, text in _EXTRACTORS[kind](path, rel):
+                self._add(doc, text)
+            self.sources[rel] = stamp
+            changed += 1
+        for rel in [r for r in self.sources if r not in seen]:
+            self._remove_source(rel)
+            changed += 1
+        if changed:
+            self._vocabulary = None
+            self._neighbours = None
+        return changed
+
+    def to_json(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "sources": self.sources,
+            "docs": {
+                doc_id: [d.kind, d.ref, d.title, d.source, self.doc_terms.get(doc_id, {})]
+                for doc_id, d in self.docs.items()
+            },
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "SearchIndex":
+        index = cls()
+        if data.get("version") != INDEX_VERSION:
+            return index
+        index.sources = {k: list(v) for k, v in data.get("sources", {}).items()}
+        for doc_id, (kind, ref, title, source, terms) in data.get("docs", {}).items():
+            index.docs[doc_id] = SearchDoc(doc_id, kind, ref, title, source)
+            index.doc_terms[doc_id] = terms
+        index.postings = data.get("postings", {})
+        return index
+
+    def save(self, path: Path = SEARCH_INDEX) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.to_json()))
+            tmp.replace(path)
+        except OSError:
+            pass
+
+    @property
+    def vocabulary(self) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    @property
+    def neighbours(self) -> Dict[str, List[str]]:
+        # Single-deletion neighbourhood of every term, so typo lookups are a
+        # handful of dict hits instead of a scan over the vocabulary
+        if self._neighbours is None:
+            neighbours: Dict[str, List[str]] = {}
+            for term in self.postings:
+                for variant in [term] + _deletes(term):
+                    neighbours.setdefault(variant, []).append(term)
+            self._neighbours = neighbours
+        return self._neighbours
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        # Exact, prefix and (as a fallback) fuzzy vocabulary matches for one query term
+        vocabulary = self.vocabulary
+        matches: List[Tuple[str, float]] = []
+        if term in self.postings:
+            matches.append((term, 1.0))
+        start = bisect.bisect_left(vocabulary, term)
+        for candidate in vocabulary[start:start + 200]:
+            if not candidate.startswith(term):
+                break
+            if candidate != term:
+                matches.append((candidate, 0.4 + 0.4 * len(term) / len(candidate)))
+        if not matches and len(term) >= 4:
+            limit = 1 if len(term) < 8 else 2
+            candidates = set()
+            for variant in [term] + _deletes(term):
+                candidates.update(self.neighbours.get(variant, ()))
+            for candidate in sorted(candidates):
+                if _edit_distance(term, candidate, limit) <= limit:
+                    matches.append((candidate, 0.5))
+        return matches
+
+    def search(self, query: str, limit: int = 20, kinds: Optional[Iterable[str]] = None) -> List[SearchHit]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+        allowed = set(kinds) if kinds else None
+        total = max(len(self.docs), 1)
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+        for term in dict.fromkeys(terms):
+            best: Dict[str, float] = {}
+            for candidate, factor in self._expand(term):
+                postings = self.postings[candidate]
+                idf = math.log(1 + total / len(postings))
+                for doc_id, weight in postings.items():
+                    value = factor * idf * (1 + math.log(weight))
+                    if value > best.get(doc_id, 0.0):
+                        best[doc_id] = value
+            for doc_id, value in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + value
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+        wanted = len(dict.fromkeys(terms))
+        hits = [
+            SearchHit(self.docs[doc_id], score * (1.0 if matched[doc_id] == wanted else 0.25))
+            for doc_id, score in scores.items()
+            if allowed is None or self.docs[doc_id].kind in allowed
+        ]
+        hits.sort(key=lambda hit: (-hit.score, hit.doc.id))
+        return hits[:limit]
+
+
+def launch_command(doc: SearchDoc) -> List[str]:
+    # Shell command that opens a search result outside the TUI
+    if doc.kind == "lesson":
+        return [str(LPIC_TRAIN), "learn", doc.ref]
+    if doc.kind == "exercise":
+        topic, name = doc.ref.split(":", 1)
+        return [str(LPIC_TRAIN), "exercise", topic, name]
+    if doc.kind == "objective":
+        return [str(LPIC_CHECK), "objective", doc.ref]
+    if doc.kind == "challenge":
+        return [str(SKILL_CHECKER), "challenge", doc.ref]
+    script, _, variant = doc.ref.partition(":")
+    cmd = ["bash", str(SCENARIOS_DIR / script), "--start"]
+    return cmd + [variant] if variant else cmd
+
+
+_INDEX: Optional[SearchIndex] = None
+
+
+def load_index(path: Path = SEARCH_INDEX, refresh: bool = True) -> SearchIndex:
+    global _INDEX
+    if _INDEX is None:
+        try:
+            _INDEX = SearchIndex.from_json(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            _INDEX = SearchIndex()
+    if refresh and _INDEX.refresh():
+        _INDEX.save(path)
+    return _INDEX
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+from tui_textual.services.paths import INIT_PROGRESS
+
+
+def progress_db(directory: Path) -> Path:
+    # A fresh database built by the same script users run
+    subprocess.run(
+        ["bash", str(INIT_PROGRESS)],
+        env={**os.environ, "LPIC_DIR": str(directory)},
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return directory / "progress.db"
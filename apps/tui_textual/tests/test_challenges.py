@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import shlex
+import unittest
+
+from tui_textual.services.challenges import canonicalize, compile_bank
+from tui_textual.services.paths import SKILL_CHECKER
+
+
+BANK = compile_bank(SKILL_CHECKER.read_text())
+
+
+class BankTest(unittest.TestCase):
+    def test_accepts_own_answers(self) -> None:
+        for challenge in BANK.challenges.values():
+            for alternative in challenge.answer.split(" OR "):
+                with self.subTest(challenge=challenge.id, answer=alternative):
+                    self.assertTrue(challenge.check(alternative))
+
+    def test_accepts_own_hints(self) -> None:
+        # Hints that stop short of the arguments ("chmod 754") only name the
+        # key elements; every complete hint must be a correct answer
+        for challenge in BANK.challenges.values():
+            hint = shlex.split(challenge.hint)
+            if any(shlex.split(alt)[: len(hint)] == hint for alt in challenge.answer.split(" OR ")):
+                continue
+            with self.subTest(challenge=challenge.id, hint=challenge.hint):
+                self.assertTrue(challenge.check(challenge.hint))
+
+
+class AnswerTest(unittest.TestCase):
+    def assertAccepted(self, challenge_id: str, *answers: str) -> None:
+        for answer in answers:
+            with self.subTest(challenge=challenge_id, answer=answer):
+                self.assertTrue(BANK.check(challenge_id, answer))
+
+    def assertRejected(self, challenge_id: str, *answers: str) -> None:
+        for answer in answers:
+            with self.subTest(challenge=challenge_id, answer=answer):
+                self.assertFalse(BANK.check(challenge_id, answer))
+
+    def test_equivalent_forms(self) -> None:
+        self.assertAccepted("grep-recursive", "grep -rn TODO", "grep -r TODO", "grep -rn TODO .")
+        self.assertAccepted("ss-listen", "ss -tln", "ss -ltn", "ss -t -l -n -p")
+        self.assertAccepted("ip-addr", "ip address", "ip a s", "ip addr show", "ip a")
+        self.assertAccepted("ip-route", "ip r", "ip route list")
+        self.assertAccepted("sed-replace", "sed -e s/old/new/g f.txt", "sed 's/old/new/g' f.txt")
+        self.assertAccepted("ln-symbolic", "ln -sf target link", "ln -fs target link")
+        self.assertAccepted("chmod-numeric", "chmod 0754 f.txt", "chmod 754 f.txt")
+        self.assertAccepted("ps-all", "ps -aux", "ps aux")
+        self.assertAccepted("find-mtime", "find -mtime -7", "find . -mtime -7")
+        self.assertAccepted("kill-force", "kill -KILL 1234", "kill -s 9 1234")
+
+    def test_placeholders_match_any_argument(self) -> None:
+        self.assertAccepted("grep-basic", "grep error /var/log/syslog", "grep error FILE")
+        self.assertAccepted("ping-count", "ping -c 3 example.com")
+        self.assertAccepted("cron-minute", "*/5 * * * * /opt/backup.sh")
+
+    def test_wrong_answers(self) -> None:
+        self.assertRejected("cron-minute", "*/5 1 1 1 1 /x")
+        self.assertRejected("cron-daily", "30 3 9 9 9 x")
+        self.assertRejected("grep-recursive", "grep -r foo .", "grep TODO .")
+        self.assertRejected("grep-basic", "grep FILE x")
+        self.assertRejected("ss-listen", "ss -tn")
+        self.assertRejected("ip-addr", "ip link")
+        self.assertRejected("chmod-numeric", "chmod 755 f.txt", "chmod 07540 f.txt")
+        self.assertRejected("sed-replace", "sed -e s/old/new/ f.txt")
+
+    def test_user_input_placeholders_are_literal(self) -> None:
+        canonical = canonicalize("grep FILE x")
+        self.assertIsNotNone(canonical)
+        self.assertEqual(canonical.positionals, ("FILE", "x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
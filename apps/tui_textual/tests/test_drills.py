@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from tui_textual.services.drills import DrillSession, load_drills, load_history, parse_drills, record_drill_attempt
+
+from .support import progress_db
+
+
+SOURCE = """_get_drill_question() {
+    case "$topic" in
+        grep)
+            local drills=(
+%s
+            )
+            ;;
+    esac
+}
+"""
+
+
+def drill_source(*lines: str) -> str:
+    return SOURCE % "\n".join(f'                "{line}"' for line in lines)
+
+
+class CheckTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.by_answer = {(q.topic, q.answer): q for q in load_drills().questions.values()}
+
+    def check(self, topic: str, answer: str, user_answer: str) -> bool:
+        return self.by_answer[(topic, answer)].check(user_answer)
+
+    def test_accepts_equivalent_answers(self) -> None:
+        for topic, answer, user_answer in (
+            ("grep", "-i", "-i"),
+            ("grep", "-i", "grep -i"),
+            ("find", "-type f", "find -type f"),
+            ("ps", "-u username", "-u alice"),
+            ("ps", "15 or TERM", "15"),
+            ("ps", "15 or TERM", "SIGTERM"),
+            ("ps", "15 or TERM", "term"),
+            ("ps", "15 or TERM", "-15"),
+            ("ps", "9 or KILL", "sigkill"),
+            ("chmod", "u+x or 100", "100"),
+            ("chmod", "4 2 1", "4  2 1"),
+        ):
+            with self.subTest(answer=answer, user_answer=user_answer):
+                self.assertTrue(self.check(topic, answer, user_answer))
+
+    def test_rejects_wrong_answers(self) -> None:
+        for topic, answer, user_answer in (
+            ("grep", "-E", "-e"),
+            ("grep", "-i", "-ivnrc"),
+            ("grep", "-i", ""),
+            ("ps", "15 or TERM", "151"),
+            ("ps", "15 or TERM", "KILL"),
+            ("ps", "-u username", "-u"),
+            ("chmod", "755", "7550"),
+            ("find", "-type f", "-type d -type f"),
+            ("find", "-mtime -1", "-mtime -HUP"),
+        ):
+            with self.subTest(answer=answer, user_answer=user_answer):
+                self.assertFalse(self.check(topic, answer, user_answer))
+
+
+class QuestionIdTest(unittest.TestCase):
+    def test_ids_survive_reordering_and_inserts(self) -> None:
+        before = parse_drills(drill_source("Case insensitive flag?|-i", "Count matches only?|-c"))
+        after = parse_drills(drill_source("Show line numbers?|-n", "Count matches only?|-c", "Case insensitive flag?|-i"))
+        ids = {q.prompt: q.id for q in before.questions.values()}
+        for question in after.questions.values():
+            if question.prompt in ids:
+                self.assertEqual(question.id, ids[question.prompt])
+        self.assertEqual(len(set(q.id for q in after.questions.values())), 3)
+
+
+class HistoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = progress_db(Path(tmp.name))
+        self.bank = parse_drills(drill_source("Case insensitive flag?|-i", "Count matches only?|-c"))
+
+    def test_history_is_scoped_to_requested_questions(self) -> None:
+        first, second = sorted(self.bank.questions.values(), key=lambda q: q.prompt)
+        record_drill_attempt(first, True, 1200, db_path=self.db)
+        record_drill_attempt(first, False, 1800, db_path=self.db)
+        record_drill_attempt(second, True, 900, db_path=self.db)
+        history = load_history([first.id], self.db)
+        self.assertEqual(list(history), [first.id])
+        self.assertEqual((history[first.id].attempts, history[first.id].correct), (2, 1))
+        self.assertEqual(history[first.id].latency_ms, 1500)
+        self.assertEqual(load_history([], self.db), {})
+
+    def test_session_records_answers(self) -> None:
+        session = DrillSession(self.bank, "grep", rounds=2, db_path=self.db, rng=random.Random(1))
+        while not session.done:
+            question = session.next_question()
+            session.answer(question.answer)
+        self.assertEqual(session.correct, 2)
+        with sqlite3.connect(str(self.db)) as conn:
+            rows = conn.execute("SELECT question_id, correct FROM drill_attempts").fetchall()
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(all(correct == 1 and qid in self.bank.questions for qid, correct in rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tui_textual.services import inventory
+from tui_textual.services.inventory import (
+    INSTALL_SCRIPTS,
+    SOURCE_OBJECTIVE,
+    SOURCE_OPTIONAL,
+    CommandStatus,
+    Inventory,
+    command_sources,
+    load_package_map,
+    scan_path,
+    table_drift,
+    validator_commands,
+)
+
+from .support import progress_db
+
+
+TABLE = """# comment
+lsof\tlsof\tlsof
+apt\tapt\t-
+ntpq\tntpsec\tntpsec
+"""
+
+SCRIPT = """apt-get install -y \\
+    lsof \\
+    util-linux
+apt-get install -y tigervnc-standalone-server 2>/dev/null || \\
+    apt-get install -y tightvncserver 2>/dev/null || \\
+    log_warn "VNC server not installed"
+"""
+
+VALIDATOR = """check "lsof available" "command -v lsof"
+if command -v ntpq &>/dev/null || command -v ntpd &>/dev/null; then
+    check "ntpq available" "command -v ntpq"
+fi
+"""
+
+
+class TableTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.table = self.dir / "command-packages.tsv"
+        self.table.write_text(TABLE)
+        script = self.dir / "install.sh"
+        script.write_text(SCRIPT)
+        patcher = mock.patch.dict(inventory.INSTALL_SCRIPTS, {"deb": script})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_package_map(self) -> None:
+        self.assertEqual(load_package_map("deb", self.table), {"lsof": "lsof", "apt": "apt", "ntpq": "ntpsec"})
+        self.assertIsNone(load_package_map("rpm", self.table)["apt"])
+        self.assertEqual(load_package_map(None, self.table), {})
+
+    def test_install_script_packages_skip_fallbacks(self) -> None:
+        self.assertEqual(inventory.install_script_packages("deb"), {"lsof", "util-linux", "tigervnc-standalone-server", "tightvncserver"})
+
+    def test_table_drift_exempts_only_optional_tools(self) -> None:
+        sources = {"lsof": (SOURCE_OBJECTIVE,), "apt": (SOURCE_OBJECTIVE,), "ntpq": (SOURCE_OPTIONAL,)}
+        self.assertEqual(table_drift("deb", sources, self.table), [("apt", "apt")])
+        sources["ntpq"] = (SOURCE_OBJECTIVE,)
+        self.assertEqual(table_drift("deb", sources, self.table), [("apt", "apt"), ("ntpq", "ntpsec")])
+
+    def test_validator_guards_are_optional(self) -> None:
+        (self.dir / "101.1.sh").write_text(VALIDATOR)
+        self.assertEqual(validator_commands(self.dir), ({"lsof"}, {"ntpq", "ntpd"}))
+
+
+class ShippedTableTest(unittest.TestCase):
+    def test_table_agrees_with_install_scripts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            sources = command_sources(db_path=progress_db(Path(tmp)))
+        for family in INSTALL_SCRIPTS:
+            with self.subTest(family=family):
+                self.assertEqual(table_drift(family, sources), [])
+
+
+class ResolveTest(unittest.TestCase):
+    def test_scan_path_first_hit_wins(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            first, second = Path(tmp, "a"), Path(tmp, "b")
+            for directory in (first, second):
+                directory.mkdir()
+                tool = directory / "lpic-test-tool"
+                tool.write_text("#!/bin/sh\n")
+                tool.chmod(0o755)
+            (first / "lpic-test-data").write_text("")
+            found = scan_path(os.pathsep.join([str(first), str(second)]))
+        self.assertEqual(found["lpic-test-tool"], str(first / "lpic-test-tool"))
+        self.assertNotIn("lpic-test-data", found)
+
+    def test_owner_names_prefer_usr(self) -> None:
+        owners = {"/bin/ping": "legacy", "/usr/bin/ping": "iputils-ping", "/sbin/ifup": "ifupdown"}
+        self.assertEqual(inventory._owner_names(owners), {"ping": "iputils-ping", "ifup": "ifupdown"})
+
+    def test_install_command_deduplicates_packages(self) -> None:
+        statuses = (
+            CommandStatus("mount", (SOURCE_OBJECTIVE,), None, "mount"),
+            CommandStatus("umount", (SOURCE_OBJECTIVE,), None, "mount"),
+            CommandStatus("lsof", (SOURCE_OBJECTIVE,), "/usr/bin/lsof", "lsof"),
+            CommandStatus("ntpq", (SOURCE_OPTIONAL,), None, "ntpsec"),
+            CommandStatus("yum", (SOURCE_OBJECTIVE,), None, None, applicable=False),
+        )
+        result = Inventory("deb", statuses, 0.0, False)
+        self.assertEqual([status.command for status in result.missing], ["mount", "umount"])
+        self.assertEqual(result.install_command, "sudo apt-get install -y mount")
+        self.assertEqual([status.command for status in result.optional_missing], ["ntpq"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import functools
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tui_textual.services import lessons
+
+
+LESSON = """lesson_demo() {
+    print_header "Demo Lesson"
+    print_subheader "Listing"
+    echo "Example 1: list files"
+    echo "Command: ls /tmp"
+    echo "a.txt"
+    wait_for_user
+    echo "second page"
+    print_subheader "Copying"
+    echo "cp a b"
+}
+"""
+
+
+class ParseCaptureTest(unittest.TestCase):
+    def test_sections_pages_and_examples(self) -> None:
+        mark, sep = lessons._MARK, lessons._SEP
+        captured = "\n".join([
+            f"{mark}TITLE{sep}Demo",
+            "intro text",
+            f"{mark}SECTION{sep}Listing",
+            "Example 1: list files",
+            "Command: ls /tmp",
+            "Output:",
+            "a.txt",
+            f"{mark}PAGE",
+            "second page",
+        ])
+        title, sections = lessons.parse_capture("demo", captured)
+        self.assertEqual(title, "Demo")
+        self.assertEqual([s.title for s in sections], ["Introduction", "Listing"])
+        self.assertEqual(len(sections[1].pages), 2)
+        example = sections[1].examples[0]
+        self.assertEqual((example.description, example.command, example.output), ("Example 1: list files", "ls /tmp", "a.txt"))
+
+
+class CompileCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        self.lessons_dir = root / "lessons"
+        self.lessons_dir.mkdir()
+        (root / "practice").mkdir()
+        (root / "common.sh").write_text("")
+        for name, value in (
+            ("LESSONS_DIR", self.lessons_dir),
+            ("LESSON_CACHE_DIR", root / "cache"),
+            ("COMMON_SH", root / "common.sh"),
+            ("PRACTICE_DIR", root / "practice"),
+            ("practice_fingerprint", functools.partial(lessons.practice_fingerprint, root / "practice")),
+        ):
+            patcher = mock.patch.object(lessons, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.practice = root / "practice"
+
+    def write_lesson(self, body: str) -> None:
+        (self.lessons_dir / "demo.sh").write_text(body)
+
+    def test_compiled_lesson_is_cached_until_sources_change(self) -> None:
+        self.write_lesson(LESSON)
+        self.assertEqual(lessons.lesson_status("demo"), "missing")
+        lesson = lessons.compile_lesson("demo")
+        self.assertEqual(lesson.title, "Demo Lesson")
+        self.assertEqual([s.title for s in lesson.sections], ["Listing", "Copying"])
+        self.assertEqual(lessons.lesson_status("demo"), "fresh")
+        self.assertEqual(lessons.cached_lesson("demo"), lesson)
+
+        (self.practice / "new.txt").write_text("x")
+        self.assertEqual(lessons.lesson_status("demo"), "stale")
+        self.assertIsNone(lessons.cached_lesson("demo"))
+
+    def test_failed_compile_is_not_cached(self) -> None:
+        self.write_lesson(LESSON.replace('    echo "cp a b"\n', '    echo "cp a b"\n    exit 3\n'))
+        with self.assertRaisesRegex(RuntimeError, "status 3"):
+            lessons.compile_lesson("demo")
+        self.assertEqual(lessons.lesson_status("demo"), "missing")
+
+    def test_failed_recompile_keeps_previous_cache(self) -> None:
+        self.write_lesson(LESSON)
+        lessons.compile_lesson("demo")
+        stamp = os.stat(lessons._cache_file("demo")).st_mtime_ns
+        with mock.patch.object(lessons, "_DRIVER", "exit 1"):
+            with self.assertRaises(RuntimeError):
+                lessons.load_lesson("demo", force=True)
+        self.assertEqual(os.stat(lessons._cache_file("demo")).st_mtime_ns, stamp)
+
+    def test_timeout_is_reported(self) -> None:
+        self.write_lesson(LESSON)
+        with mock.patch.object(lessons, "COMPILE_TIMEOUT", 0.2), mock.patch.object(lessons, "_DRIVER", "sleep 5"):
+            with self.assertRaisesRegex(RuntimeError, "timed out"):
+                lessons.compile_lesson("demo")
+        self.assertEqual(lessons.lesson_status("demo"), "missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from tui_textual.services.progress import ensure_schema, load_due_reviews
+
+from .support import progress_db
+
+
+class ReviewQueueTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = progress_db(Path(tmp.name))
+        self.conn = sqlite3.connect(str(self.db))
+        self.addCleanup(self.conn.close)
+        ensure_schema(self.conn, self.db)
+
+    def attempt(self, correct: bool, hints: int = 0, at: str = "2026-01-01 10:00:00", exercise: str = "grep:ex_one") -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO attempt_events (exercise_id, topic, correct, latency_ms, hints_used, attempted_at) "
+                "VALUES (?, 'grep', ?, 1000, ?, ?)",
+                (exercise, 1 if correct else 0, hints, at),
+            )
+
+    def schedule(self, exercise: str = "grep:ex_one") -> tuple:
+        return self.conn.execute(
+            "SELECT repetitions, interval_days, ease, attempts, successes, due_at FROM review_queue WHERE exercise_id = ?",
+            (exercise,),
+        ).fetchone()
+
+    def test_sm2_intervals(self) -> None:
+        self.attempt(True, at="2026-01-01 10:00:00")
+        self.assertEqual(self.schedule()[:2], (1, 1))
+        self.assertEqual(self.schedule()[5], "2026-01-02 10:00:00")
+        self.attempt(True, at="2026-01-02 10:00:00")
+        self.assertEqual(self.schedule()[:2], (2, 6))
+        self.attempt(True, at="2026-01-08 10:00:00")
+        repetitions, interval, ease, attempts, successes, _ = self.schedule()
+        self.assertEqual((repetitions, attempts, successes), (3, 3, 3))
+        self.assertAlmostEqual(ease, 2.8)
+        self.assertAlmostEqual(interval, round(6 * 2.7, 1))
+
+    def test_failure_resets_and_lowers_ease(self) -> None:
+        self.attempt(True)
+        self.attempt(True)
+        self.attempt(False, at="2026-01-03 09:00:00")
+        repetitions, interval, ease, attempts, successes, due_at = self.schedule()
+        self.assertEqual((repetitions, interval, attempts, successes), (0, 1, 3, 2))
+        self.assertAlmostEqual(ease, 2.7 - 0.54)
+        self.assertEqual(due_at, "2026-01-04 09:00:00")
+
+    def test_hints_lower_ease_but_count_as_success(self) -> None:
+        self.attempt(True, hints=2)
+        repetitions, _, ease, _, successes, _ = self.schedule()
+        self.assertEqual((repetitions, successes), (1, 1))
+        self.assertAlmostEqual(ease, 2.36)
+        self.attempt(True, hints=0, exercise="grep:ex_two")
+        self.assertAlmostEqual(self.schedule("grep:ex_two")[2], 2.6)
+
+    def test_events_are_append_only(self) -> None:
+        self.attempt(True)
+        with self.assertRaises(sqlite3.DatabaseError):
+            with self.conn:
+                self.conn.execute("UPDATE attempt_events SET correct = 0")
+
+    def test_due_reviews(self) -> None:
+        self.attempt(True, at="2000-01-01 00:00:00", exercise="grep:ex_due")
+        self.attempt(True, at="2999-01-01 00:00:00", exercise="grep:ex_later")
+        due = load_due_reviews(db_path=self.db)
+        self.assertEqual([review.exercise for review in due], ["ex_due"])
+
+
+if __name__ == "__main__":
+    unittest.main()
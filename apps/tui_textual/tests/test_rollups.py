@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from tui_textual.services.paths import LPIC_CHECK
+from tui_textual.services.progress import ensure_schema, load_daily_series, refresh_rollups
+
+from .support import progress_db
+
+
+class RollupTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.db = progress_db(self.dir)
+        self.conn = sqlite3.connect(str(self.db))
+        self.addCleanup(self.conn.close)
+        ensure_schema(self.conn, self.db)
+
+    def execute(self, sql: str, *params: object) -> None:
+        with self.conn:
+            self.conn.execute(sql, params)
+
+    def attempt(self, age_days: int, correct: bool = True, exercise: str = "grep:ex_one") -> None:
+        self.execute(
+            "INSERT INTO attempt_events (exercise_id, topic, correct, latency_ms, attempted_at) "
+            "VALUES (?, 'grep', ?, 1000, datetime('now', ?))",
+            exercise, 1 if correct else 0, f"-{age_days} days",
+        )
+
+    def session(self, age_days: int) -> None:
+        self.execute(
+            "INSERT INTO sessions (started_at, objectives_practiced) VALUES (datetime('now', ?), 'lesson-grep')",
+            f"-{age_days} days",
+        )
+
+    def drill(self, age_days: int) -> None:
+        self.execute(
+            "INSERT INTO drill_attempts (question_id, topic, correct, latency_ms, answered_at) "
+            "VALUES ('grep-1', 'grep', 1, 800, datetime('now', ?))",
+            f"-{age_days} days",
+        )
+
+    def totals(self, table: str = "progress_daily") -> tuple:
+        return self.conn.execute(
+            f"SELECT COALESCE(SUM(attempts), 0), COALESCE(SUM(successes), 0), COALESCE(SUM(sessions), 0) "
+            f"FROM {table} WHERE scope IN ('topic', 'drill')"
+        ).fetchone()
+
+    def count(self, table: str) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def lpic_check(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["bash", str(LPIC_CHECK), *args],
+            env={**os.environ, "LPIC_DIR": str(self.dir)},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+
+    def test_refresh_is_incremental_and_idempotent(self) -> None:
+        self.attempt(0)
+        self.attempt(1, correct=False)
+        self.session(0)
+        self.drill(0)
+        refresh_rollups(self.db)
+        refresh_rollups(self.db)
+        self.assertEqual(self.totals(), (3, 2, 1))
+        self.assertEqual(self.totals("progress_weekly"), (3, 2, 1))
+        self.attempt(0)
+        refresh_rollups(self.db)
+        self.assertEqual(self.totals(), (4, 3, 1))
+
+    def test_series_reads_do_not_refresh(self) -> None:
+        self.attempt(0)
+        self.assertEqual(load_daily_series("topic", days=7, db_path=self.db), {})
+        refresh_rollups(self.db)
+        series = load_daily_series("topic", days=7, db_path=self.db)["grep"]
+        self.assertEqual(series.attempts[-1], 1)
+
+    def test_compact_keeps_event_logs_and_totals(self) -> None:
+        for age in (200, 100, 5):
+            self.attempt(age)
+            self.session(age)
+            self.drill(age)
+        result = self.lpic_check("compact", "30")
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertEqual(self.count("sessions"), 1)
+        self.assertEqual(self.count("attempt_events"), 3)
+        self.assertEqual(self.count("drill_attempts"), 3)
+        self.assertEqual(self.totals(), (6, 6, 3))
+
+    def test_compact_skips_rows_not_rolled_up(self) -> None:
+        self.session(200)
+        self.execute("UPDATE rollup_state SET last_id = 0")
+        with self.conn:
+            self.conn.executescript(
+                "CREATE TRIGGER hold_rollup BEFORE UPDATE ON rollup_state "
+                "BEGIN SELECT RAISE(IGNORE); END;"
+            )
+        self.lpic_check("compact", "30")
+        self.assertEqual(self.count("sessions"), 1)
+
+    def test_progress_does_not_delete_history(self) -> None:
+        self.session(400)
+        self.attempt(400)
+        result = self.lpic_check("progress")
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertEqual(self.count("sessions"), 1)
+        self.assertEqual(self.totals()[2], 1)
+
+    def test_attempt_events_reject_deletes(self) -> None:
+        self.attempt(0)
+        with self.assertRaises(sqlite3.DatabaseError):
+            self.execute("DELETE FROM attempt_events")
+        self.assertEqual(self.count("attempt_events"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from tui_textual.services.search import SearchIndex, launch_command, tokenize
+
+
+SCENARIO = """#!/bin/bash
+# LPIC-1 Break/Fix Scenario: Boot Problems
+declare -A SCENARIOS
+SCENARIOS["fstab-typo"]="Typo in /etc/fstab prevents mounting"
+"""
+
+
+class SearchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.index = SearchIndex()
+        cls.index.refresh()
+
+    def refs(self, query: str, kind: str) -> list:
+        return [hit.doc.ref for hit in self.index.search(query, limit=10, kinds=[kind])]
+
+    def test_exact_and_typo_queries(self) -> None:
+        self.assertIn("grep-recursive", self.refs("grep recursive", "challenge"))
+        self.assertEqual(self.refs("fstab", "exercise")[:1], self.refs("fsatb", "exercise")[:1])
+        self.assertTrue(self.refs("permisions", "lesson") or self.refs("permisions", "exercise"))
+
+    def test_unknown_terms_match_nothing(self) -> None:
+        self.assertEqual(self.index.search("zzqxj"), [])
+        self.assertEqual(self.index.search(""), [])
+
+    def test_unchanged_sources_are_not_reextracted(self) -> None:
+        self.assertEqual(self.index.refresh(), 0)
+
+    def test_json_round_trip_keeps_results(self) -> None:
+        copy = SearchIndex.from_json(self.index.to_json())
+        for query in ("chmod", "fsatb", "grep recursive"):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    [hit.doc.id for hit in copy.search(query)],
+                    [hit.doc.id for hit in self.index.search(query)],
+                )
+
+    def test_tokenize_keeps_command_words(self) -> None:
+        self.assertIn("mkfs.ext4", tokenize("Run mkfs.ext4 on the device"))
+
+
+class IncrementalRefreshTest(unittest.TestCase):
+    def test_changed_and_removed_sources(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "break-fix" / "broken-boot.sh"
+            script.parent.mkdir()
+            script.write_text(SCENARIO)
+            index = SearchIndex()
+            self.assertEqual(index.refresh([(script, "scenario")]), 1)
+            hits = index.search("fstab typo")
+            self.assertEqual([hit.doc.ref for hit in hits], ["break-fix/broken-boot.sh:fstab-typo"])
+
+            script.write_text(SCENARIO.replace("fstab-typo", "grub-missing").replace("/etc/fstab", "grub.cfg"))
+            self.assertEqual(index.refresh([(script, "scenario")]), 1)
+            self.assertEqual(index.search("fstab"), [])
+            self.assertEqual(len(index.search("grub")), 1)
+
+            self.assertEqual(index.refresh([]), 1)
+            self.assertEqual(index.docs, {})
+            self.assertEqual(index.postings, {})
+
+    def test_scenario_launch_command(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "break-fix" / "broken-boot.sh"
+            script.parent.mkdir()
+            script.write_text(SCENARIO)
+            index = SearchIndex()
+            index.refresh([(script, "scenario")])
+            doc = index.search("fstab")[0].doc
+        self.assertEqual(launch_command(doc)[-2:], ["--start", "fstab-typo"])
+
+
+if __name__ == "__main__":
+    unittest.main()
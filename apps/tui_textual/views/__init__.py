@@ -6,6 +6,9 @@ from .exam import ExamView
 from .challenges import ChallengesView
 from .sandbox import SandboxView
 from .settings import SettingsView
+from .palette import CommandPalette
+from .lesson import LessonScreen
+from .drill import DrillScreen
 
 __all__ = [
     "DashboardView",
@@ -16,4 +19,7 @@ __all__ = [
     "ChallengesView",
     "SandboxView",
     "SettingsView",
+    "CommandPalette",
+    "LessonScreen",
+    "DrillScreen",
 ]
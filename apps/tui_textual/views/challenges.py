@@ -27,6 +27,7 @@ class ChallengesView(Vertical):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._selected: Path | None = None
+        self._variant = ""
 
     def compose(self) -> ComposeResult:
         yield Static("Challenges", classes="view-title")
@@ -43,8 +44,23 @@ class ChallengesView(Vertical):
         if event.item is None:
             return
         self._selected = Path(event.item.id)
+        self._variant = ""
         self.post_message(UpdateContext(f"Selected scenario: {self._selected.name}"))
 
+    def select_scenario(self, ref: str) -> None:
+        # Search results only select a scenario; launching stays a button press
+        script, _, variant = ref.partition(":")
+        path = SCENARIOS_DIR / script
+        keys = [item for _, item in _scenario_items()]
+        if path not in keys:
+            self.post_message(UpdateContext(f"Scenario not found: {script}"))
+            return
+        self.query_one("#challenge-list", ListView).index = keys.index(path)
+        self._selected = path
+        self._variant = variant
+        label = f"{path.name} --start {variant}" if variant else path.name
+        self.post_message(UpdateContext(f"Selected scenario: {label}. Press Launch Scenario to start it."))
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "challenge-refresh":
             self.query_one("#challenge-list", ListView).clear()
@@ -53,6 +69,9 @@ class ChallengesView(Vertical):
             self.post_message(UpdateContext("Scenario list refreshed."))
             return
         if event.button.id == "challenge-start" and self._selected:
-            self.post_message(RunCommand(["bash", str(self._selected)], cwd=str(self._selected.parent)))
+            cmd = ["bash", str(self._selected)]
+            if self._variant:
+                cmd += ["--start", self._variant]
+            self.post_message(RunCommand(cmd, cwd=str(self._selected.parent)))
             return
         self.post_message(UpdateContext("Select a scenario first."))
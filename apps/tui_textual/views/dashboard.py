@@ -8,7 +8,7 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Static
 
 from ..services.paths import CORE_DIR, LPIC_CHECK
-from ..services.progress import load_progress
+from ..services.progress import load_daily_series, load_progress, load_weekly_series, refresh_rollups, sparkline
 from .messages import RunCommand, UpdateContext
 
 
@@ -16,11 +16,13 @@ class DashboardView(Vertical):
     def compose(self) -> ComposeResult:
         yield Static("Dashboard", classes="view-title")
         yield Static(self._summary_text(), id="progress-summary")
+        yield Static(self._activity_text(), id="progress-activity")
         with Horizontal(classes="button-row"):
             yield Button("Refresh", id="dash-refresh")
             yield Button("Verify Packages", id="dash-verify")
             yield Button("Self-Test", id="dash-selftest")
             yield Button("Export Progress", id="dash-export")
+            yield Button("Compact History", id="dash-compact")
 
     def _summary_text(self) -> str:
         summary = load_progress()
@@ -28,9 +30,31 @@ class DashboardView(Vertical):
             return "Progress database not found or empty. Run setup to initialize progress tracking."
         return f"Progress: {summary.completed}/{summary.total} objectives ({summary.percent}%)."
 
+    def _activity_text(self) -> str:
+        refresh_rollups()
+        daily = load_daily_series("topic", days=14)
+        if not daily:
+            return "No practice activity recorded yet."
+        lines = ["Activity, last 14 days:"]
+        for key, series in daily.items():
+            accuracy = f"{series.accuracy}%" if series.accuracy is not None else "-"
+            lines.append(f"  {key:<14} {sparkline(series.activity)}  {sum(series.attempts):>3} attempts  {accuracy:>4} correct")
+        weekly = load_weekly_series("topic", weeks=12).values()
+        totals = [sum(week) for week in zip(*(series.activity for series in weekly))]
+        if totals:
+            lines.append(f"  {'weekly':<14} {sparkline(totals)}  {sum(totals):>3} total (12 weeks)")
+        drills = load_daily_series("drill", days=14)
+        if drills:
+            lines.append("Drill latency, last 14 days:")
+            for key, series in drills.items():
+                latencies = [value or 0 for value in series.latency_ms]
+                lines.append(f"  {key:<14} {sparkline(latencies)}  avg {series.mean_latency_ms} ms")
+        return "\n".join(lines)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "dash-refresh":
             self.query_one("#progress-summary", Static).update(self._summary_text())
+            self.query_one("#progress-activity", Static).update(self._activity_text())
             self.post_message(UpdateContext("Dashboard refreshed."))
         elif event.button.id == "dash-verify":
             self.post_message(RunCommand([str(LPIC_CHECK), "verify-packages"], cwd=str(CORE_DIR)))
@@ -40,3 +64,5 @@ class DashboardView(Vertical):
             out = Path.home() / f"lpic1-progress-{datetime.now().strftime('%Y%m%d')}.json"
             self.post_message(RunCommand([str(LPIC_CHECK), "export", str(out)], cwd=str(CORE_DIR)))
             self.post_message(UpdateContext(f"Exporting progress to {out}"))
+        elif event.button.id == "dash-compact":
+            self.post_message(RunCommand([str(LPIC_CHECK), "compact"], cwd=str(CORE_DIR)))
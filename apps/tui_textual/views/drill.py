@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.screen import Screen
+from textual.widgets import Button, Input, Static, TextLog
+
+from ..services.drills import DrillSession, latency_stats, load_drills, percentile
+from .messages import UpdateContext
+
+
+class DrillScreen(Screen):
+    BINDINGS = [("escape", "close", "Close")]
+
+    def __init__(self, topic: str, rounds: int = 10, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._topic = topic
+        self._rounds = rounds
+        self._session: Optional[DrillSession] = None
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="drill"):
+            yield Static(f"Quick Drill: {self._topic}", classes="panel-title")
+            yield Static("Answer as fast as you can - speed builds automaticity.", id="drill-help")
+            yield Static("", id="drill-prompt")
+            yield Input(placeholder="Answer (Enter to submit)", id="drill-answer")
+            yield TextLog(id="drill-log", wrap=True)
+            with Horizontal(classes="button-row"):
+                yield Button("Restart", id="drill-restart")
+                yield Button("Close", id="drill-close")
+            yield Static("", id="drill-stats")
+
+    def on_mount(self) -> None:
+        self._start()
+
+    def _start(self) -> None:
+        self._session = DrillSession(load_drills(), self._topic, rounds=self._rounds)
+        self.query_one("#drill-log", TextLog).clear()
+        self._show_stats()
+        self._next()
+
+    def _next(self) -> None:
+        session = self._session
+        prompt = self.query_one("#drill-prompt", Static)
+        if session is None:
+            return
+        question = session.next_question()
+        if question is None:
+            self._finish()
+            return
+        prompt.update(f"Q{len(session.results) + 1}/{session.rounds}: {question.prompt}")
+        answer = self.query_one("#drill-answer", Input)
+        answer.value = ""
+        answer.focus()
+
+    def _finish(self) -> None:
+        session = self._session
+        prompt = self.query_one("#drill-prompt", Static)
+        if session is None or not session.results:
+            prompt.update(f"No drill questions for: {self._topic}")
+            return
+        latencies = [result.latency_ms for result in session.results]
+        summary = (
+            f"Done: {session.correct}/{len(session.results)} correct · "
+            f"p50 {percentile(latencies, 50)} ms · p90 {percentile(latencies, 90)} ms"
+        )
+        prompt.update(summary)
+        self.app.post_message(UpdateContext(f"Drill {self._topic}: {summary}"))
+        self._show_stats()
+
+    def _show_stats(self) -> None:
+        lines = []
+        for stat in latency_stats(self._topic if self._topic != "all" else None):
+            trend = ""
+            if stat.trend_ms is not None:
+                trend = f" · {abs(stat.trend_ms)} ms {'faster' if stat.trend_ms < 0 else 'slower'} than last week"
+            lines.append(
+                f"{stat.topic}: {stat.count} answers, {stat.accuracy}% correct · "
+                f"p50 {stat.p50} ms · p90 {stat.p90} ms{trend}"
+            )
+        self.query_one("#drill-stats", Static).update("\n".join(lines) or "No drill history yet.")
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "drill-answer" and event.value and self._session is not None:
+            self._session.keystroke()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id != "drill-answer" or self._session is None:
+            return
+        result = self._session.answer(event.value)
+        if result is None:
+            return
+        log = self.query_one("#drill-log", TextLog)
+        reaction = f", first key {result.first_key_ms} ms" if result.first_key_ms is not None else ""
+        if result.correct:
+            log.write(f"✓ {result.question.prompt} ({result.latency_ms} ms{reaction})")
+        else:
+            log.write(f"✗ {result.question.prompt} Answer: {result.question.answer} ({result.latency_ms} ms{reaction})")
+        self._next()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "drill-restart":
+            self._start()
+        elif event.button.id == "drill-close":
+            self.action_close()
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
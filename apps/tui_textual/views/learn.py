@@ -8,6 +8,7 @@ from textual.widgets import Button, ListItem, ListView, Static
 
 from ..services.content import load_topics
 from ..services.paths import CORE_DIR, LPIC_TRAIN
+from .lesson import LessonScreen
 from .messages import RunCommand, UpdateContext
 
 
@@ -26,6 +27,7 @@ class LearnView(Vertical):
         yield list_view
         with Horizontal(classes="button-row"):
             yield Button("Start Lesson", id="learn-start")
+            yield Button("Run Live", id="learn-live")
             yield Button("List Topics", id="learn-list")
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
@@ -39,6 +41,9 @@ class LearnView(Vertical):
             self.post_message(RunCommand([str(LPIC_TRAIN), "topics"], cwd=str(CORE_DIR)))
             return
         if event.button.id == "learn-start" and self._selected:
+            self.app.push_screen(LessonScreen(self._selected))
+            return
+        if event.button.id == "learn-live" and self._selected:
             self.post_message(RunCommand([str(LPIC_TRAIN), "learn", self._selected], cwd=str(CORE_DIR)))
             return
         self.post_message(UpdateContext("Select a topic first."))
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.screen import Screen
+from textual.widgets import Button, Input, Static, TextLog
+
+from ..services.lessons import CompiledLesson, cached_lesson, compile_lesson
+from ..services.paths import CORE_DIR, LPIC_TRAIN
+from .messages import RunCommand
+
+
+class LessonScreen(Screen):
+    BINDINGS = [
+        ("escape", "close", "Close"),
+        ("right", "next_page", "Next"),
+        ("left", "prev_page", "Previous"),
+        ("n", "next_page", "Next"),
+        ("p", "prev_page", "Previous"),
+        ("l", "live", "Run live"),
+    ]
+
+    def __init__(self, topic: str, query: str = "", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._topic = topic
+        self._query = query
+        self._lesson: Optional[CompiledLesson] = None
+        self._page = 0
+        self._closed = False
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="lesson"):
+            yield Static(self._topic, id="lesson-title", classes="panel-title")
+            yield Static("", id="lesson-section")
+            yield TextLog(id="lesson-page", wrap=True)
+            yield Input(placeholder="Find in lesson", id="lesson-find")
+            with Horizontal(classes="button-row"):
+                yield Button("Previous", id="lesson-prev")
+                yield Button("Next", id="lesson-next")
+                yield Button("Run Live", id="lesson-live")
+                yield Button("Recompile", id="lesson-recompile")
+                yield Button("Close", id="lesson-close")
+            yield Static("", id="lesson-status")
+
+    def on_mount(self) -> None:
+        self._compile(force=False)
+
+    def on_unmount(self) -> None:
+        self._closed = True
+
+    def _compile(self, force: bool) -> None:
+        # The cache check walks the practice tree, so it runs in the worker too
+        self.query_one("#lesson-status", Static).update("Loading lesson...")
+        app = self.app
+
+        def worker() -> None:
+            try:
+                lesson = None if force else cached_lesson(self._topic)
+                if lesson is None:
+                    app.call_from_thread(self._status, "Compiling lesson...")
+                    lesson = compile_lesson(self._topic)
+            except Exception as exc:
+                app.call_from_thread(self._failed, str(exc))
+                return
+            app.call_from_thread(self._show, lesson)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _status(self, text: str) -> None:
+        if not self._closed:
+            self.query_one("#lesson-status", Static).update(text)
+
+    def _failed(self, reason: str) -> None:
+        self._status(f"Could not compile lesson: {reason}")
+
+    def _show(self, lesson: CompiledLesson) -> None:
+        # The user may have closed the screen while the worker ran
+        if self._closed:
+            return
+        self._lesson = lesson
+        self.query_one("#lesson-title", Static).update(lesson.title)
+        self._page = 0
+        if self._query:
+            self._page = lesson.find(self._query) or 0
+        self._render_page()
+
+    def _render_page(self) -> None:
+        if self._lesson is None:
+            return
+        pages = self._lesson.pages
+        log = self.query_one("#lesson-page", TextLog)
+        log.clear()
+        if not pages:
+            self.query_one("#lesson-status", Static).update("Lesson produced no content.")
+            return
+        section, page = pages[self._page]
+        text = Text.from_ansi(page)
+        if self._query:
+            text.highlight_words([self._query], style="reverse", case_sensitive=False)
+        log.write(text)
+        self.query_one("#lesson-section", Static).update(section)
+        examples = sum(len(s.examples) for s in self._lesson.sections)
+        self.query_one("#lesson-status", Static).update(
+            f"Page {self._page + 1}/{len(pages)} · {examples} examples · "
+            f"compiled in {self._lesson.duration * 1000:.0f} ms"
+        )
+
+    def _turn(self, step: int) -> None:
+        if self._lesson is None or not self._lesson.pages:
+            return
+        self._page = max(0, min(len(self._lesson.pages) - 1, self._page + step))
+        self._render_page()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id != "lesson-find" or self._lesson is None:
+            return
+        self._query = event.value.strip()
+        if not self._query:
+            self._render_page()
+            return
+        found = self._lesson.find(self._query, self._page + 1)
+        if found is None:
+            self.query_one("#lesson-status", Static).update(f"No match for '{self._query}'.")
+            return
+        self._page = found
+        self._render_page()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        button_id = event.button.id
+        if button_id == "lesson-prev":
+            self.action_prev_page()
+        elif button_id == "lesson-next":
+            self.action_next_page()
+        elif button_id == "lesson-live":
+            self.action_live()
+        elif button_id == "lesson-recompile":
+            self._compile(force=True)
+        elif button_id == "lesson-close":
+            self.action_close()
+
+    def action_next_page(self) -> None:
+        self._turn(1)
+
+    def action_prev_page(self) -> None:
+        self._turn(-1)
+
+    def action_live(self) -> None:
+        self.app.pop_screen()
+        self.app.post_message(RunCommand([str(LPIC_TRAIN), "learn", self._topic], cwd=str(CORE_DIR)))
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from textual.message import Message
 
+from ..services.search import SearchDoc
+
 
 class RunCommand(Message):
     def __init__(self, cmd: list[str], cwd: str | None = None) -> None:
@@ -14,3 +16,9 @@ class UpdateContext(Message):
     def __init__(self, text: str) -> None:
         super().__init__()
         self.text = text
+
+
+class OpenSearchResult(Message):
+    def __init__(self, doc: SearchDoc) -> None:
+        super().__init__()
+        self.doc = doc
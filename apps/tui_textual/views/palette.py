@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+from typing import List
+
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.screen import Screen
+from textual.widgets import Input, ListItem, ListView, Static
+
+from ..services.search import SearchHit, load_index
+from .messages import OpenSearchResult
+
+
+class CommandPalette(Screen):
+    BINDINGS = [("escape", "close", "Close")]
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._index = load_index()
+        self._hits: List[SearchHit] = []
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="palette"):
+            yield Static("Search", classes="panel-title")
+            yield Input(placeholder="Lessons, exercises, objectives, challenges, scenarios", id="palette-input")
+            yield ListView(id="palette-results")
+            yield Static(f"{len(self._index.docs)} items indexed.", id="palette-status")
+
+    def on_mount(self) -> None:
+        self.query_one("#palette-input", Input).focus()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        started = time.perf_counter()
+        self._hits = self._index.search(event.value, limit=30)
+        elapsed = (time.perf_counter() - started) * 1000
+        results = self.query_one("#palette-results", ListView)
+        results.clear()
+        for hit in self._hits:
+            results.append(ListItem(Static(hit.label)))
+        self.query_one("#palette-status", Static).update(f"{len(self._hits)} matches in {elapsed:.1f} ms")
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if self._hits:
+            self._open(self._hits[0])
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        index = event.list_view.index
+        if index is not None and 0 <= index < len(self._hits):
+            self._open(self._hits[index])
+
+    def _open(self, hit: SearchHit) -> None:
+        self.app.post_message(OpenSearchResult(hit.doc))
+        self.app.pop_screen()
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
@@ -8,6 +8,8 @@ from textual.widgets import Button, Input, ListItem, ListView, Static
 
 from ..services.content import load_topics
 from ..services.paths import CORE_DIR, LPIC_TRAIN
+from ..services.progress import load_due_reviews
+from .drill import DrillScreen
 from .messages import RunCommand, UpdateContext
 
 
@@ -30,6 +32,7 @@ class PracticeView(Vertical):
             yield Button("Drill", id="practice-drill")
             yield Button("Mixed", id="practice-mix")
             yield Button("Smart Review", id="practice-smart")
+            yield Button("Review Due", id="practice-due")
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.item is None:
@@ -47,6 +50,16 @@ class PracticeView(Vertical):
         if event.button.id == "practice-smart":
             self.post_message(RunCommand([str(LPIC_TRAIN), "smart"], cwd=str(CORE_DIR)))
             return
+        if event.button.id == "practice-due":
+            due = load_due_reviews(limit=1)
+            if not due:
+                self.post_message(UpdateContext("Nothing due for review."))
+                return
+            review = due[0]
+            self.post_message(UpdateContext(f"Reviewing {review.exercise_id} (due {review.due_at})"))
+            cmd = [str(LPIC_TRAIN), "exercise", review.topic, review.exercise]
+            self.post_message(RunCommand(cmd, cwd=str(CORE_DIR)))
+            return
         if event.button.id == "practice-mix":
             self.post_message(RunCommand([str(LPIC_TRAIN), "mix"], cwd=str(CORE_DIR)))
             return
@@ -57,5 +70,6 @@ class PracticeView(Vertical):
             cmd = [str(LPIC_TRAIN), "practice", self._selected] + self._count_args()
             self.post_message(RunCommand(cmd, cwd=str(CORE_DIR)))
         elif event.button.id == "practice-drill":
-            cmd = [str(LPIC_TRAIN), "drill", self._selected] + self._count_args()
-            self.post_message(RunCommand(cmd, cwd=str(CORE_DIR)))
+            count = self.query_one("#practice-count", Input).value.strip()
+            rounds = int(count) if count.isdigit() and int(count) > 0 else 10
+            self.app.push_screen(DrillScreen(self._selected, rounds))
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from typing import Optional
+import random
+import time
+from typing import List, Optional
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Input, ListItem, ListView, Static
 
+from ..services.challenges import Challenge, load_bank
 from ..services.content import load_topics
 from ..services.paths import CORE_DIR, LPIC_CHECK, LPIC_TRAIN
+from ..services.progress import record_command_attempt
 from .messages import RunCommand, UpdateContext
 
 
@@ -15,6 +19,11 @@ class TestView(Vertical):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._selected: Optional[str] = None
+        self._skill_queue: List[str] = []
+        self._skill_current: Optional[Challenge] = None
+        self._skill_started = 0.0
+        self._skill_correct = 0
+        self._skill_total = 0
 
     def compose(self) -> ComposeResult:
         yield Static("Test", classes="view-title")
@@ -33,6 +42,8 @@ class TestView(Vertical):
             yield Button("Check Objective", id="test-objective")
             yield Button("Skill Session", id="test-skill-session")
             yield Button("Practice Command", id="test-skill-practice")
+        yield Static("", id="skill-prompt")
+        yield Input(placeholder="Skill session answer (Enter to submit)", id="skill-answer")
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.item is None:
@@ -55,19 +66,18 @@ class TestView(Vertical):
                 self.post_message(UpdateContext("Enter an objective ID."))
             return
         if event.button.id == "test-skill-session":
-            cmd = self.query_one("#skill-command", Input).value.strip()
-            args = [str(LPIC_CHECK.parent / "skill-checker.sh"), "session"]
-            if cmd:
-                args.append(cmd)
-            args += self._count_args()
-            self.post_message(RunCommand(args, cwd=str(CORE_DIR)))
+            selector = self.query_one("#skill-command", Input).value.strip() or "all"
+            ids = load_bank().select(selector)
+            count = self.query_one("#test-count", Input).value.strip()
+            count_n = int(count) if count.isdigit() and int(count) > 0 else 5
+            self.start_skill_session([random.choice(ids) for _ in range(count_n)] if ids else [], selector)
             return
         if event.button.id == "test-skill-practice":
             cmd = self.query_one("#skill-command", Input).value.strip()
             if not cmd:
                 self.post_message(UpdateContext("Enter a command for skill-checker practice."))
                 return
-            self.post_message(RunCommand([str(LPIC_CHECK.parent / "skill-checker.sh"), "practice", cmd], cwd=str(CORE_DIR)))
+            self.start_skill_session(list(load_bank().select(cmd)), cmd)
             return
         if not self._selected:
             self.post_message(UpdateContext("Select a topic first."))
@@ -78,3 +88,45 @@ class TestView(Vertical):
         elif event.button.id == "test-timed":
             cmd = [str(LPIC_TRAIN), "test", self._selected, "--timed"] + self._count_args()
             self.post_message(RunCommand(cmd, cwd=str(CORE_DIR)))
+
+    def start_skill_session(self, ids: List[str], selector: str) -> None:
+        if not ids:
+            self.post_message(UpdateContext(f"No challenges found for: {selector}"))
+            return
+        self._skill_queue = ids
+        self._skill_correct = 0
+        self._skill_total = 0
+        self.post_message(UpdateContext(f"Skill session: {selector} ({len(ids)} questions)"))
+        self._next_challenge()
+
+    def _next_challenge(self) -> None:
+        prompt = self.query_one("#skill-prompt", Static)
+        if not self._skill_queue:
+            self._skill_current = None
+            percent = self._skill_correct * 100 // self._skill_total if self._skill_total else 0
+            prompt.update(f"Session complete: {self._skill_correct}/{self._skill_total} ({percent}%)")
+            return
+        self._skill_current = load_bank().get(self._skill_queue.pop(0))
+        if self._skill_current is None:
+            self._next_challenge()
+            return
+        number = self._skill_total + 1
+        prompt.update(f"Question {number}: {self._skill_current.description}")
+        self.query_one("#skill-answer", Input).focus()
+        self._skill_started = time.monotonic()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id != "skill-answer" or self._skill_current is None:
+            return
+        challenge = self._skill_current
+        elapsed = time.monotonic() - self._skill_started
+        correct = challenge.check(event.value)
+        event.input.value = ""
+        self._skill_total += 1
+        if correct:
+            self._skill_correct += 1
+            self.post_message(UpdateContext(f"Correct! ({elapsed:.1f}s)"))
+        else:
+            self.post_message(UpdateContext(f"Not quite. Expected: {challenge.answer}"))
+        record_command_attempt(challenge.topic, correct)
+        self._next_challenge()
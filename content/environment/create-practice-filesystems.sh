@@ -2,9 +2,17 @@
 # LPIC-1 Training Environment - Practice Filesystems Setup
 # Creates loop devices, filesystems, and LVM for hands-on practice
 # Run as root or with sudo
+#
+# Images are formatted once into sparse golden images; provisioning and
+# --reset clone them (reflink where the filesystem supports it, sparse copy
+# otherwise) and attach/mount everything in parallel.
 
 set -euo pipefail
 
+# Shared helpers (now_ms); the settings below override its defaults
+SCRIPT_DIR="$(cd "$(dirname "$(readlink -f "${BASH_SOURCE[0]}")")" && pwd)"
+source "${SCRIPT_DIR}/../../core/training/common.sh"
+
 # Colors for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -20,26 +28,59 @@ log_error() { echo -e "${RED}[ERROR]${NC} $1"; }
 # Configuration
 PRACTICE_DIR="/opt/lpic1-practice"
 LOOP_DIR="${PRACTICE_DIR}/loop-images"
+GOLDEN_DIR="${PRACTICE_DIR}/golden-images"
+TIMINGS_FILE="${LOOP_DIR}/.provision-times"
 MOUNT_BASE="/mnt/lpic1"
 LVM_VG="lpic1_vg"
 
-# Check if running as root
-if [[ $EUID -ne 0 ]]; then
-    log_error "This script must be run as root (use sudo)"
-    exit 1
-fi
+# Bump when the image recipe below changes so stale golden images are rebuilt
+GOLDEN_VERSION=1
+
+# Practice images in attach order: name, size, loop device ("-" = not attached)
+IMAGES=(
+    "ext4 100M /dev/loop10"
+    "xfs 300M /dev/loop11"       # XFS needs 300MB minimum (Ubuntu 24.04+)
+    "btrfs 300M /dev/loop12"     # Btrfs needs ~256MB minimum
+    "vfat 100M /dev/loop13"
+    "quota 100M /dev/loop14"
+    "lvm-pv1 300M /dev/loop15"   # 300MB each to allow 300MB+ XFS logical volumes
+    "lvm-pv2 300M /dev/loop16"
+    "lvm-pv3 300M /dev/loop17"
+    "raid1 100M /dev/loop18"
+    "raid2 100M /dev/loop19"
+    "raid3 100M -"
+    "swap 128M /dev/loop20"
+)
 
 # Parse arguments
 RESET=false
+STATUS=false
+FROM_SCRATCH=false
+REBUILD_GOLDEN=false
 while [[ $# -gt 0 ]]; do
     case $1 in
         --reset)
             RESET=true
             shift
             ;;
+        --status)
+            STATUS=true
+            shift
+            ;;
+        --from-scratch)
+            FROM_SCRATCH=true
+            shift
+            ;;
+        --rebuild-golden)
+            REBUILD_GOLDEN=true
+            shift
+            ;;
         --help)
-            echo "Usage: $0 [--reset]"
-            echo "  --reset  Remove existing practice filesystems and recreate"
+            echo "Usage: $0 [--reset] [--rebuild-golden] [--from-scratch] [--status]"
+            echo "  --reset           Remove existing practice filesystems and recreate"
+            echo "  --rebuild-golden  Rebuild the golden images before provisioning"
+            echo "  --from-scratch    Format every device in place instead of cloning golden images"
+            echo "  --status          Show image sizes, attachments and provisioning times"
             exit 0
             ;;
         *)
@@ -49,6 +90,46 @@ while [[ $# -gt 0 ]]; do
     esac
 done
 
+# Check if running as root (--status only reads)
+if [[ $EUID -ne 0 ]] && [[ "$STATUS" != true ]]; then
+    log_error "This script must be run as root (use sudo)"
+    exit 1
+fi
+
+# Phase timing (milliseconds via now_ms, recorded for --status)
+PHASE_STARTED=0
+PHASE_TIMES=()
+phase_start() {
+    PHASE_STARTED=$(now_ms)
+}
+
+phase_end() {
+    local phase="$1"
+    local elapsed=$(( $(now_ms) - PHASE_STARTED ))
+    PHASE_TIMES+=("${phase}"$'\t'"${elapsed}")
+    log_info "$phase: ${elapsed} ms"
+}
+
+write_timings() {
+    printf '%s\n' "${PHASE_TIMES[@]}" > "$TIMINGS_FILE"
+}
+
+# Run queued commands concurrently and fail if any of them failed
+PARALLEL_PIDS=()
+parallel_run() {
+    "$@" &
+    PARALLEL_PIDS+=($!)
+}
+
+parallel_wait() {
+    local pid failed=0
+    for pid in "${PARALLEL_PIDS[@]}"; do
+        wait "$pid" || failed=$((failed + 1))
+    done
+    PARALLEL_PIDS=()
+    return "$failed"
+}
+
 # Cleanup function
 cleanup_existing() {
     log_info "Cleaning up existing practice environment..."
@@ -70,15 +151,17 @@ cleanup_existing() {
         vgremove -f "$LVM_VG" 2>/dev/null || true
     fi
 
+    swapoff /dev/loop20 2>/dev/null || true
+
     # Detach loop devices
-    for loop in /dev/loop{10..19}; do
+    for loop in /dev/loop{10..20}; do
         if losetup "$loop" &>/dev/null; then
             losetup -d "$loop" 2>/dev/null || true
         fi
     done
 
-    # Remove old image files
-    rm -rf "${LOOP_DIR:?}"/*
+    # Remove old image files (golden images are kept for the next clone)
+    rm -rf "${LOOP_DIR:?}"/* "$TIMINGS_FILE"
 
     log_success "Cleanup complete"
 }
@@ -96,46 +179,35 @@ setup_directories() {
     log_success "Directories created"
 }
 
-# Create loop device images
+# Create loop device images (sparse: blocks are allocated on first write)
 create_loop_images() {
     log_info "Creating loop device images..."
 
-    # Filesystem practice images
-    # Note: XFS requires minimum 300MB on modern systems (Ubuntu 24.04+)
-    dd if=/dev/zero of="${LOOP_DIR}/ext4.img" bs=1M count=100 status=progress
-    dd if=/dev/zero of="${LOOP_DIR}/xfs.img" bs=1M count=300 status=progress   # XFS needs 300MB minimum
-    dd if=/dev/zero of="${LOOP_DIR}/btrfs.img" bs=1M count=300 status=progress # Btrfs needs ~256MB minimum
-    dd if=/dev/zero of="${LOOP_DIR}/vfat.img" bs=1M count=100 status=progress
-    dd if=/dev/zero of="${LOOP_DIR}/quota.img" bs=1M count=100 status=progress
-
-    # LVM practice images (300MB each to allow 300MB+ XFS logical volumes)
-    dd if=/dev/zero of="${LOOP_DIR}/lvm-pv1.img" bs=1M count=300 status=progress
-    dd if=/dev/zero of="${LOOP_DIR}/lvm-pv2.img" bs=1M count=300 status=progress
-    dd if=/dev/zero of="${LOOP_DIR}/lvm-pv3.img" bs=1M count=300 status=progress
-
-    # RAID practice images (100MB each)
-    dd if=/dev/zero of="${LOOP_DIR}/raid1.img" bs=1M count=100 status=progress
-    dd if=/dev/zero of="${LOOP_DIR}/raid2.img" bs=1M count=100 status=progress
-    dd if=/dev/zero of="${LOOP_DIR}/raid3.img" bs=1M count=100 status=progress
+    local spec name size _loop
+    for spec in "${IMAGES[@]}"; do
+        read -r name size _loop <<< "$spec"
+        truncate -s "$size" "${LOOP_DIR}/${name}.img"
+    done
 
     log_success "Loop images created"
 }
 
-# Setup loop devices
+# Setup loop devices (all at once; each uses a fixed device number)
 setup_loop_devices() {
     log_info "Setting up loop devices..."
 
     # Use specific loop device numbers to avoid conflicts
-    losetup /dev/loop10 "${LOOP_DIR}/ext4.img"
-    losetup /dev/loop11 "${LOOP_DIR}/xfs.img"
-    losetup /dev/loop12 "${LOOP_DIR}/btrfs.img"
-    losetup /dev/loop13 "${LOOP_DIR}/vfat.img"
-    losetup /dev/loop14 "${LOOP_DIR}/quota.img"
-    losetup /dev/loop15 "${LOOP_DIR}/lvm-pv1.img"
-    losetup /dev/loop16 "${LOOP_DIR}/lvm-pv2.img"
-    losetup /dev/loop17 "${LOOP_DIR}/lvm-pv3.img"
-    losetup /dev/loop18 "${LOOP_DIR}/raid1.img"
-    losetup /dev/loop19 "${LOOP_DIR}/raid2.img"
+    local spec name size loop
+    for spec in "${IMAGES[@]}"; do
+        read -r name size loop <<< "$spec"
+        if [[ "$loop" != "-" ]]; then
+            parallel_run losetup "$loop" "${LOOP_DIR}/${name}.img"
+        fi
+    done
+    if ! parallel_wait; then
+        log_error "Failed to attach loop devices"
+        exit 1
+    fi
 
     log_success "Loop devices configured"
     losetup -a | grep lpic1
@@ -164,6 +236,10 @@ create_filesystems() {
     # ext4 for quota testing
     mkfs.ext4 -L lpic1-quota /dev/loop14
     log_success "Quota test filesystem created on /dev/loop14"
+
+    # Swap area (left inactive for swapon/swapoff practice)
+    mkswap -L lpic1-swap /dev/loop20
+    log_success "Swap area created on /dev/loop20"
 }
 
 # Setup LVM
@@ -203,15 +279,19 @@ setup_lvm() {
 mount_filesystems() {
     log_info "Mounting filesystems..."
 
-    mount /dev/loop10 "${MOUNT_BASE}/ext4-practice"
-    mount /dev/loop11 "${MOUNT_BASE}/xfs-practice"
-    mount /dev/loop12 "${MOUNT_BASE}/btrfs-practice"
-    mount /dev/loop13 "${MOUNT_BASE}/vfat-practice"
-    mount -o usrquota,grpquota /dev/loop14 "${MOUNT_BASE}/quota-test"
-
-    mount "/dev/${LVM_VG}/lv_data" "${MOUNT_BASE}/lvm-data"
-    mount "/dev/${LVM_VG}/lv_logs" "${MOUNT_BASE}/lvm-logs"
-    mount "/dev/${LVM_VG}/lv_backup" "${MOUNT_BASE}/lvm-backup"
+    parallel_run mount /dev/loop10 "${MOUNT_BASE}/ext4-practice"
+    parallel_run mount /dev/loop11 "${MOUNT_BASE}/xfs-practice"
+    parallel_run mount /dev/loop12 "${MOUNT_BASE}/btrfs-practice"
+    parallel_run mount /dev/loop13 "${MOUNT_BASE}/vfat-practice"
+    parallel_run mount -o usrquota,grpquota /dev/loop14 "${MOUNT_BASE}/quota-test"
+
+    parallel_run mount "/dev/${LVM_VG}/lv_data" "${MOUNT_BASE}/lvm-data"
+    parallel_run mount "/dev/${LVM_VG}/lv_logs" "${MOUNT_BASE}/lvm-logs"
+    parallel_run mount "/dev/${LVM_VG}/lv_backup" "${MOUNT_BASE}/lvm-backup"
+    if ! parallel_wait; then
+        log_error "Failed to mount practice filesystems"
+        exit 1
+    fi
 
     log_success "Filesystems mounted"
 
@@ -241,6 +321,191 @@ setup_quotas() {
     repquota -a
 }
 
+# Golden images are usable when built by the current recipe
+golden_ready() {
+    [[ -f "${GOLDEN_DIR}/VERSION" ]] || return 1
+    [[ "$(cat "${GOLDEN_DIR}/VERSION")" == "$GOLDEN_VERSION" ]] || return 1
+
+    local spec name _size _loop
+    for spec in "${IMAGES[@]}"; do
+        read -r name _size _loop <<< "$spec"
+        [[ "$name" == raid* ]] && continue
+        [[ -f "${GOLDEN_DIR}/${name}.img" ]] || return 1
+    done
+}
+
+# Volume group, logical volumes and their filesystems on the golden PVs
+format_golden_lvm() {
+    pvcreate "$@" || return 1
+    vgcreate "$LVM_VG" "$@" || return 1
+    lvcreate -L 200M -n lv_data "$LVM_VG" || return 1
+    lvcreate -L 300M -n lv_logs "$LVM_VG" || return 1
+    lvcreate -L 100M -n lv_backup "$LVM_VG" || return 1
+    mkfs.ext4 -q -L lv-data "/dev/${LVM_VG}/lv_data" || return 1
+    mkfs.xfs -q -L lv-logs "/dev/${LVM_VG}/lv_logs" || return 1
+    mkfs.ext4 -q -L lv-backup "/dev/${LVM_VG}/lv_backup" || return 1
+}
+
+# Build every formatted image once. Filesystems are created directly on
+# sparse files, so the golden set only allocates metadata blocks.
+build_golden_images() {
+    log_info "Building golden images in ${GOLDEN_DIR}..."
+
+    if vgdisplay "$LVM_VG" &>/dev/null; then
+        log_error "Volume group '$LVM_VG' is active; run with --reset to rebuild golden images"
+        exit 1
+    fi
+
+    local build="${GOLDEN_DIR}.build"
+    rm -rf "$build"
+    mkdir -p "$build"
+
+    local spec name size _loop
+    for spec in "${IMAGES[@]}"; do
+        read -r name size _loop <<< "$spec"
+        [[ "$name" == raid* ]] && continue
+        truncate -s "$size" "${build}/${name}.img"
+    done
+    chmod 600 "${build}"/*.img   # mkswap refuses world-readable swap files
+
+    parallel_run mkfs.ext4 -q -F -L lpic1-ext4 -m 2 "${build}/ext4.img"
+    parallel_run mkfs.xfs -q -f -L lpic1-xfs "${build}/xfs.img"
+    parallel_run mkfs.btrfs -q -L lpic1-btrfs "${build}/btrfs.img"
+    parallel_run mkfs.vfat -n LPIC1VFAT "${build}/vfat.img"
+    parallel_run mkfs.ext4 -q -F -L lpic1-quota "${build}/quota.img"
+    parallel_run mkswap -L lpic1-swap "${build}/swap.img"
+    if ! parallel_wait; then
+        log_error "Failed to format golden images"
+        rm -rf "$build"
+        exit 1
+    fi
+
+    # LVM needs block devices: attach the PV files on free loop devices,
+    # format, then deactivate and detach so only the clones are ever seen
+    local loops=() pv lvm_ok=true
+    for pv in lvm-pv1 lvm-pv2 lvm-pv3; do
+        loops+=("$(losetup --find --show "${build}/${pv}.img")")
+    done
+    format_golden_lvm "${loops[@]}" || lvm_ok=false
+    vgchange -an "$LVM_VG" &>/dev/null || true
+    for pv in "${loops[@]}"; do
+        if [[ -f /etc/lvm/devices/system.devices ]]; then
+            lvmdevices --deldev "$pv" &>/dev/null || true
+        fi
+        losetup -d "$pv"
+    done
+    if [[ "$lvm_ok" != true ]]; then
+        log_error "Failed to build golden LVM images"
+        rm -rf "$build"
+        exit 1
+    fi
+
+    echo "$GOLDEN_VERSION" > "${build}/VERSION"
+    rm -rf "$GOLDEN_DIR"
+    mv "$build" "$GOLDEN_DIR"
+    log_success "Golden images built ($(du -sh "$GOLDEN_DIR" | cut -f1) allocated)"
+}
+
+# Copy the golden images into place. cp shares extents on reflink-capable
+# filesystems (btrfs, XFS) and otherwise copies only the allocated blocks.
+clone_golden_images() {
+    log_info "Cloning golden images..."
+
+    local spec name size _loop
+    for spec in "${IMAGES[@]}"; do
+        read -r name size _loop <<< "$spec"
+        if [[ -f "${GOLDEN_DIR}/${name}.img" ]]; then
+            parallel_run cp --reflink=auto --sparse=always "${GOLDEN_DIR}/${name}.img" "${LOOP_DIR}/${name}.img"
+        else
+            truncate -s "$size" "${LOOP_DIR}/${name}.img"
+        fi
+    done
+    if ! parallel_wait; then
+        log_error "Failed to clone golden images"
+        exit 1
+    fi
+
+    log_success "Images cloned"
+}
+
+# Activate the volume group found on the cloned PVs
+activate_lvm() {
+    log_info "Activating LVM..."
+
+    # Hosts using an LVM devices file only see PVs listed in it
+    if [[ -f /etc/lvm/devices/system.devices ]]; then
+        local loop
+        for loop in /dev/loop15 /dev/loop16 /dev/loop17; do
+            lvmdevices --adddev "$loop" &>/dev/null || true
+        done
+    fi
+    pvscan --cache &>/dev/null || true
+    vgchange -ay "$LVM_VG"
+    log_success "Volume group '$LVM_VG' activated"
+}
+
+# Report images, attachments and the last provisioning run
+human_size() {
+    numfmt --to=iec --suffix=B "$1" 2>/dev/null || echo "${1}B"
+}
+
+show_status() {
+    log_info "LPIC-1 Practice Filesystems Status"
+    echo
+
+    printf "%-10s %8s %10s %10s  %-12s %s\n" "Image" "Size" "Allocated" "Golden" "Loop" "Mounted on"
+    local spec name _size _loop image golden size alloc golden_alloc loop target
+    local total_size=0 total_alloc=0 total_golden=0
+    for spec in "${IMAGES[@]}"; do
+        read -r name _size _loop <<< "$spec"
+        image="${LOOP_DIR}/${name}.img"
+        golden="${GOLDEN_DIR}/${name}.img"
+        size=0 alloc=0 golden_alloc=0 loop="-" target="-"
+        if [[ -f "$image" ]]; then
+            size=$(stat -c %s "$image")
+            alloc=$(( $(stat -c '%b * %B' "$image") ))
+            loop=$(losetup -n -O NAME -j "$image" 2>/dev/null | head -1)
+            [[ -n "$loop" ]] || loop="-"
+            if [[ "$loop" != "-" ]]; then
+                target=$(findmnt -n -o TARGET "$loop" 2>/dev/null | head -1)
+                [[ -n "$target" ]] || target="-"
+            fi
+        fi
+        if [[ -f "$golden" ]]; then
+            golden_alloc=$(( $(stat -c '%b * %B' "$golden") ))
+        fi
+        total_size=$((total_size + size))
+        total_alloc=$((total_alloc + alloc))
+        total_golden=$((total_golden + golden_alloc))
+        printf "%-10s %8s %10s %10s  %-12s %s\n" "$name" "$(human_size "$size")" "$(human_size "$alloc")" \
+            "$(human_size "$golden_alloc")" "$loop" "$target"
+    done
+    printf "%-10s %8s %10s %10s\n" "total" "$(human_size "$total_size")" "$(human_size "$total_alloc")" \
+        "$(human_size "$total_golden")"
+    echo
+
+    if golden_ready; then
+        log_info "Golden images: v${GOLDEN_VERSION}, built $(date -r "${GOLDEN_DIR}/VERSION" '+%Y-%m-%d %H:%M')"
+    else
+        log_warn "Golden images: not built (next provisioning builds them)"
+    fi
+
+    if [[ -f "$TIMINGS_FILE" ]]; then
+        log_info "Last provisioning ($(date -r "$TIMINGS_FILE" '+%Y-%m-%d %H:%M')):"
+        local phase ms
+        while IFS=$'\t' read -r phase ms; do
+            printf "  %-14s %7d ms\n" "$phase" "$ms"
+        done < "$TIMINGS_FILE"
+    else
+        log_warn "No provisioning run recorded"
+    fi
+
+    if vgdisplay "$LVM_VG" &>/dev/null; then
+        echo
+        lvs "$LVM_VG" 2>/dev/null || true
+    fi
+}
+
 # Create fstab entries (commented for reference)
 create_fstab_reference() {
     log_info "Creating fstab reference file..."
@@ -256,6 +521,7 @@ create_fstab_reference() {
 /dev/loop12    /mnt/lpic1/btrfs-practice   btrfs   defaults        0 2
 /dev/loop13    /mnt/lpic1/vfat-practice    vfat    defaults        0 0
 /dev/loop14    /mnt/lpic1/quota-test       ext4    usrquota,grpquota 0 2
+/dev/loop20    none                        swap    sw              0 0
 
 # LVM logical volumes
 /dev/lpic1_vg/lv_data    /mnt/lpic1/lvm-data    ext4    defaults    0 2
@@ -300,6 +566,7 @@ losetup /dev/loop14 "${LOOP_DIR}/quota.img" 2>/dev/null || true
 losetup /dev/loop15 "${LOOP_DIR}/lvm-pv1.img" 2>/dev/null || true
 losetup /dev/loop16 "${LOOP_DIR}/lvm-pv2.img" 2>/dev/null || true
 losetup /dev/loop17 "${LOOP_DIR}/lvm-pv3.img" 2>/dev/null || true
+losetup /dev/loop20 "${LOOP_DIR}/swap.img" 2>/dev/null || true
 
 # Activate LVM
 vgchange -ay "$LVM_VG"
@@ -328,12 +595,22 @@ SCRIPT
 
 # Main execution
 main() {
+    if [[ "$STATUS" == true ]]; then
+        show_status
+        exit 0
+    fi
+
     log_info "LPIC-1 Practice Filesystems Setup"
     log_info "=================================="
     echo
 
+    local started
+    started=$(now_ms)
+
     if [[ "$RESET" == true ]]; then
+        phase_start
         cleanup_existing
+        phase_end "cleanup"
     fi
 
     # Check if already set up
@@ -344,15 +621,43 @@ main() {
     fi
 
     setup_directories
-    create_loop_images
-    setup_loop_devices
-    create_filesystems
-    setup_lvm
+
+    if [[ "$FROM_SCRATCH" == true ]]; then
+        phase_start
+        create_loop_images
+        setup_loop_devices
+        create_filesystems
+        setup_lvm
+        phase_end "build"
+    else
+        if [[ "$REBUILD_GOLDEN" == true ]] || ! golden_ready; then
+            phase_start
+            build_golden_images
+            phase_end "golden-build"
+        fi
+        phase_start
+        clone_golden_images
+        phase_end "clone"
+        phase_start
+        setup_loop_devices
+        phase_end "attach"
+        phase_start
+        activate_lvm
+        phase_end "lvm"
+    fi
+
+    phase_start
     mount_filesystems
+    phase_end "mount"
+    phase_start
     setup_quotas
+    phase_end "quotas"
     create_fstab_reference
     create_persistence_script
 
+    PHASE_TIMES+=("total"$'\t'"$(( $(now_ms) - started ))")
+    write_timings
+
     echo
     log_success "=================================="
     log_success "Practice Filesystems Setup Complete"
@@ -361,7 +666,9 @@ main() {
     log_info "Summary:"
     echo "  - 5 loop filesystems (ext4, xfs, btrfs, vfat, quota)"
     echo "  - 3 LVM logical volumes"
+    echo "  - 1 swap area on /dev/loop20 (inactive, for swapon practice)"
     echo "  - Disk quotas enabled on /mnt/lpic1/quota-test"
+    echo "  - Provisioned in $(( $(now_ms) - started )) ms (details: $0 --status)"
     echo
     log_info "All mounted at: ${MOUNT_BASE}/"
     echo
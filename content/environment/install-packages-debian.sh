@@ -48,6 +48,7 @@ apt-get install -y \
     usbutils \
     kmod \
     systemd \
+    systemd-sysv \
     sysvinit-utils \
     sysstat \
     lshw \
@@ -66,8 +67,12 @@ apt-get install -y \
     aptitude \
     dpkg \
     dpkg-dev \
+    debconf \
+    rpm \
+    rpm2cpio \
     parted \
     gdisk \
+    fdisk \
     lvm2 \
     dmsetup \
     initramfs-tools \
@@ -77,12 +82,15 @@ apt-get install -y \
 log_info "Installing Topic 103: GNU and Unix Commands packages..."
 apt-get install -y \
     coreutils \
+    dash \
+    bsdutils \
     findutils \
     grep \
     sed \
     gawk \
     mawk \
     tar \
+    cpio \
     gzip \
     bzip2 \
     xz-utils \
@@ -101,6 +109,7 @@ apt-get install -y \
 log_info "Installing Topic 104: Devices, Linux Filesystems, FHS packages..."
 apt-get install -y \
     e2fsprogs \
+    mount \
     xfsprogs \
     btrfs-progs \
     dosfstools \
@@ -114,6 +123,7 @@ apt-get install -y \
     cifs-utils \
     sshfs \
     squashfs-tools \
+    plocate \
     exfatprogs \
     mdadm
 
@@ -156,6 +166,8 @@ apt-get install -y tigervnc-standalone-server 2>/dev/null || \
 log_info "Installing Topic 107: Administrative Tasks packages..."
 apt-get install -y \
     passwd \
+    tzdata \
+    libc-bin \
     login \
     cron \
     anacron \
@@ -172,6 +184,7 @@ log_info "Installing Topic 108: Essential System Services packages..."
 apt-get install -y \
     chrony \
     rsyslog \
+    logrotate \
     systemd-journal-remote \
     postfix \
     bsd-mailx \
@@ -195,6 +208,9 @@ apt-get install -y \
     net-tools \
     dnsutils \
     traceroute \
+    nmap \
+    iputils-ping \
+    iputils-tracepath \
     mtr-tiny \
     whois \
     network-manager \
@@ -219,7 +235,9 @@ log_info "Installing Topic 110: Security packages..."
 apt-get install -y \
     gnupg \
     gnupg2 \
+    gpg-agent \
     sudo \
+    lsof \
     ufw \
     iptables \
     nftables \
@@ -81,6 +81,7 @@ dnf install -y \
     sed \
     gawk \
     tar \
+    cpio \
     gzip \
     bzip2 \
     xz \
@@ -112,6 +113,7 @@ dnf install -y \
     cifs-utils \
     sshfs \
     squashfs-tools \
+    plocate \
     exfatprogs \
     mdadm
 
@@ -124,6 +126,7 @@ dnf install -y \
     tcsh \
     ksh \
     vim-enhanced \
+    vim-minimal \
     nano \
     emacs-nox \
     bc
@@ -139,6 +142,7 @@ dnf install -y \
     tigervnc-server \
     xdpyinfo \
     xwininfo \
+    xhost \
     dbus \
     dbus-daemon \
     mesa-dri-drivers \
@@ -148,6 +152,9 @@ dnf install -y \
 log_info "Installing Topic 107: Administrative Tasks packages..."
 dnf install -y \
     shadow-utils \
+    passwd \
+    glibc \
+    glibc-common \
     util-linux-user \
     cronie \
     cronie-anacron \
@@ -164,6 +171,7 @@ log_info "Installing Topic 108: Essential System Services packages..."
 dnf install -y \
     chrony \
     rsyslog \
+    logrotate \
     systemd-journal-remote \
     postfix \
     mailx \
@@ -181,6 +189,8 @@ dnf install -y \
     net-tools \
     bind-utils \
     traceroute \
+    nmap \
+    iputils \
     mtr \
     whois \
     NetworkManager \
@@ -203,6 +213,7 @@ log_info "Installing Topic 110: Security packages..."
 dnf install -y \
     gnupg2 \
     sudo \
+    lsof \
     firewalld \
     iptables \
     iptables-services \
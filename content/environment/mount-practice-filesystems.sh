@@ -3,9 +3,9 @@
 # Called by systemd at boot to restore practice filesystem mounts
 #
 # This script:
-# 1. Attaches loop devices to existing image files
+# 1. Attaches loop devices to existing image files (in parallel)
 # 2. Activates LVM volume group
-# 3. Mounts all practice filesystems
+# 3. Mounts all practice filesystems (in parallel)
 # 4. Enables disk quotas
 #
 # Usage: sudo /opt/LPIC-1/content/environment/mount-practice-filesystems.sh
@@ -106,7 +106,7 @@ setup_loop_device() {
 
     if [[ ! -f "$image" ]]; then
         log_warn "$name: Image file not found: $image"
-        return 1
+        return 0
     fi
 
     if losetup "$loop" "$image" 2>/dev/null; then
@@ -118,19 +118,46 @@ setup_loop_device() {
     fi
 }
 
+# Run queued attach/mount steps concurrently. Failures are counted here
+# because log_error's counter is lost in the background subshells; steps
+# return non-zero only where they log an error, so warnings stay warnings.
+PARALLEL_PIDS=()
+parallel_run() {
+    "$@" &
+    PARALLEL_PIDS+=($!)
+}
+
+parallel_wait() {
+    local pid
+    for pid in "${PARALLEL_PIDS[@]}"; do
+        wait "$pid" || MOUNT_ERRORS=$((MOUNT_ERRORS + 1))
+    done
+    PARALLEL_PIDS=()
+}
+
 # Setup all loop devices
 log_info "Attaching loop devices..."
-setup_loop_device /dev/loop10 "${LOOP_DIR}/ext4.img" "ext4"
-setup_loop_device /dev/loop11 "${LOOP_DIR}/xfs.img" "xfs"
-setup_loop_device /dev/loop12 "${LOOP_DIR}/btrfs.img" "btrfs"
-setup_loop_device /dev/loop13 "${LOOP_DIR}/vfat.img" "vfat"
-setup_loop_device /dev/loop14 "${LOOP_DIR}/quota.img" "quota"
-setup_loop_device /dev/loop15 "${LOOP_DIR}/lvm-pv1.img" "lvm-pv1"
-setup_loop_device /dev/loop16 "${LOOP_DIR}/lvm-pv2.img" "lvm-pv2"
-setup_loop_device /dev/loop17 "${LOOP_DIR}/lvm-pv3.img" "lvm-pv3"
+parallel_run setup_loop_device /dev/loop10 "${LOOP_DIR}/ext4.img" "ext4"
+parallel_run setup_loop_device /dev/loop11 "${LOOP_DIR}/xfs.img" "xfs"
+parallel_run setup_loop_device /dev/loop12 "${LOOP_DIR}/btrfs.img" "btrfs"
+parallel_run setup_loop_device /dev/loop13 "${LOOP_DIR}/vfat.img" "vfat"
+parallel_run setup_loop_device /dev/loop14 "${LOOP_DIR}/quota.img" "quota"
+parallel_run setup_loop_device /dev/loop15 "${LOOP_DIR}/lvm-pv1.img" "lvm-pv1"
+parallel_run setup_loop_device /dev/loop16 "${LOOP_DIR}/lvm-pv2.img" "lvm-pv2"
+parallel_run setup_loop_device /dev/loop17 "${LOOP_DIR}/lvm-pv3.img" "lvm-pv3"
+if [[ -f "${LOOP_DIR}/swap.img" ]]; then
+    parallel_run setup_loop_device /dev/loop20 "${LOOP_DIR}/swap.img" "swap"
+fi
+parallel_wait
 
 # Activate LVM volume group
 log_info "Activating LVM volume group..."
+# Hosts using an LVM devices file only see PVs listed in it
+if [[ -f /etc/lvm/devices/system.devices ]]; then
+    for loop in /dev/loop15 /dev/loop16 /dev/loop17; do
+        lvmdevices --adddev "$loop" &>/dev/null || true
+    done
+fi
 if vgdisplay "$LVM_VG" &>/dev/null; then
     if vgchange -ay "$LVM_VG" 2>/dev/null; then
         log_success "LVM volume group '$LVM_VG' activated"
@@ -155,7 +182,7 @@ mount_fs() {
 
     if [[ ! -e "$device" ]]; then
         log_warn "$name: Device $device not found"
-        return 1
+        return 0
     fi
 
     if mount -o "$options" "$device" "$mountpoint" 2>/dev/null; then
@@ -169,18 +196,19 @@ mount_fs() {
 
 # Mount filesystems
 log_info "Mounting filesystems..."
-mount_fs /dev/loop10 "${MOUNT_BASE}/ext4-practice" "defaults" "ext4"
-mount_fs /dev/loop11 "${MOUNT_BASE}/xfs-practice" "defaults" "xfs"
-mount_fs /dev/loop12 "${MOUNT_BASE}/btrfs-practice" "defaults" "btrfs"
-mount_fs /dev/loop13 "${MOUNT_BASE}/vfat-practice" "defaults" "vfat"
-mount_fs /dev/loop14 "${MOUNT_BASE}/quota-test" "usrquota,grpquota" "quota"
+parallel_run mount_fs /dev/loop10 "${MOUNT_BASE}/ext4-practice" "defaults" "ext4"
+parallel_run mount_fs /dev/loop11 "${MOUNT_BASE}/xfs-practice" "defaults" "xfs"
+parallel_run mount_fs /dev/loop12 "${MOUNT_BASE}/btrfs-practice" "defaults" "btrfs"
+parallel_run mount_fs /dev/loop13 "${MOUNT_BASE}/vfat-practice" "defaults" "vfat"
+parallel_run mount_fs /dev/loop14 "${MOUNT_BASE}/quota-test" "usrquota,grpquota" "quota"
 
 # Mount LVM logical volumes
 if vgdisplay "$LVM_VG" &>/dev/null; then
-    mount_fs "/dev/${LVM_VG}/lv_data" "${MOUNT_BASE}/lvm-data" "defaults" "lvm-data"
-    mount_fs "/dev/${LVM_VG}/lv_logs" "${MOUNT_BASE}/lvm-logs" "defaults" "lvm-logs"
-    mount_fs "/dev/${LVM_VG}/lv_backup" "${MOUNT_BASE}/lvm-backup" "defaults" "lvm-backup"
+    parallel_run mount_fs "/dev/${LVM_VG}/lv_data" "${MOUNT_BASE}/lvm-data" "defaults" "lvm-data"
+    parallel_run mount_fs "/dev/${LVM_VG}/lv_logs" "${MOUNT_BASE}/lvm-logs" "defaults" "lvm-logs"
+    parallel_run mount_fs "/dev/${LVM_VG}/lv_backup" "${MOUNT_BASE}/lvm-backup" "defaults" "lvm-backup"
 fi
+parallel_wait
 
 # Enable quotas
 log_info "Enabling disk quotas..."
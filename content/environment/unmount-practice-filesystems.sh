@@ -136,6 +136,9 @@ else
     log_info "LVM volume group '$LVM_VG' not found"
 fi
 
+# Release the practice swap area if a lab left it active
+swapoff /dev/loop20 2>/dev/null || true
+
 # Detach loop devices
 log_info "Detaching loop devices..."
 detach_loop() {
@@ -166,6 +169,7 @@ detach_loop /dev/loop16 "lvm-pv2"
 detach_loop /dev/loop17 "lvm-pv3"
 detach_loop /dev/loop18 "raid1"
 detach_loop /dev/loop19 "raid2"
+detach_loop /dev/loop20 "swap"
 
 log_success "Unmount complete"
 log_info "Finished: $(date)"
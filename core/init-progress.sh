@@ -18,9 +18,10 @@ log_warn() { echo -e "${YELLOW}[WARN]${NC} $1"; }
 log_error() { echo -e "${RED}[ERROR]${NC} $1"; }
 
 # Configuration
-LPIC_DIR="/opt/LPIC-1/data"
+LPIC_DIR="${LPIC_DIR:-/opt/LPIC-1/data}"
 DB_FILE="${LPIC_DIR}/progress.db"
 SNAPSHOT_DIR="${LPIC_DIR}/snapshots"
+SCHEMA_FILE="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/progress-schema.sql"
 
 # Check for sqlite3
 if ! command -v sqlite3 &>/dev/null; then
@@ -47,6 +48,10 @@ if [[ -f "$DB_FILE" ]]; then
     fi
     if [[ ! $REPLY =~ ^[Yy]$ ]]; then
         log_info "Keeping existing database"
+        if [[ -f "$SCHEMA_FILE" ]]; then
+            sqlite3 "$DB_FILE" < "$SCHEMA_FILE"
+            log_success "Database schema up to date"
+        fi
         exit 0
     fi
     rm -f "$DB_FILE"
@@ -207,7 +212,8 @@ INSERT INTO objectives (id, topic, number, title, weight) VALUES
 ('110.3', '110', '110.3', 'Securing data with encryption', 4);
 
 -- Insert key commands for each objective
-INSERT INTO commands (command, objective_id) VALUES
+-- Commands listed under several objectives keep the first one
+INSERT OR IGNORE INTO commands (command, objective_id) VALUES
 -- 101.1 Hardware
 ('lspci', '101.1'), ('lsusb', '101.1'), ('lsmod', '101.1'),
 ('modprobe', '101.1'), ('modinfo', '101.1'), ('rmmod', '101.1'),
@@ -396,6 +402,11 @@ ORDER BY topic;
 
 SQL
 
+# Event, drill and review tables shared with the training scripts and TUI
+if [[ -f "$SCHEMA_FILE" ]]; then
+    sqlite3 "$DB_FILE" < "$SCHEMA_FILE"
+fi
+
 log_success "Database created at $DB_FILE"
 
 # Display summary
@@ -0,0 +1,120 @@
+-- LPIC-1 Training - Incremental Progress Rollups
+-- Folds source rows newer than rollup_state.last_id into progress_daily and
+-- progress_weekly. Cost is proportional to the rows added since the last
+-- run, so it is cheap to run before every dashboard/progress read.
+-- Requires progress-schema.sql.
+
+BEGIN IMMEDIATE;
+
+DROP TABLE IF EXISTS temp.rollup_delta;
+CREATE TEMP TABLE rollup_delta (
+    scope TEXT, key TEXT, day TEXT,
+    attempts INTEGER, successes INTEGER,
+    latency_ms_total INTEGER, latency_count INTEGER,
+    hints INTEGER, sessions INTEGER, score_total INTEGER
+);
+
+DROP TABLE IF EXISTS temp.rollup_mark;
+CREATE TEMP TABLE rollup_mark AS
+SELECT 'attempt_events' AS source,
+       (SELECT last_id FROM rollup_state WHERE source = 'attempt_events') AS from_id,
+       (SELECT COALESCE(MAX(id), 0) FROM attempt_events) AS to_id
+UNION ALL
+SELECT 'drill_attempts',
+       (SELECT last_id FROM rollup_state WHERE source = 'drill_attempts'),
+       (SELECT COALESCE(MAX(id), 0) FROM drill_attempts)
+UNION ALL
+SELECT 'command_practice',
+       (SELECT last_id FROM rollup_state WHERE source = 'command_practice'),
+       (SELECT COALESCE(MAX(id), 0) FROM command_practice)
+UNION ALL
+SELECT 'sessions',
+       (SELECT last_id FROM rollup_state WHERE source = 'sessions'),
+       (SELECT COALESCE(MAX(id), 0) FROM sessions)
+UNION ALL
+SELECT 'exam_attempts',
+       (SELECT last_id FROM rollup_state WHERE source = 'exam_attempts'),
+       (SELECT COALESCE(MAX(id), 0) FROM exam_attempts);
+
+-- Exercise attempts per topic
+INSERT INTO rollup_delta
+SELECT 'topic', topic, date(attempted_at), COUNT(*), SUM(correct),
+       COALESCE(SUM(latency_ms), 0), COUNT(latency_ms), SUM(hints_used), 0, 0
+FROM attempt_events, rollup_mark m
+WHERE m.source = 'attempt_events' AND id > m.from_id AND id <= m.to_id
+GROUP BY topic, date(attempted_at);
+
+-- Drill answers per drill topic
+INSERT INTO rollup_delta
+SELECT 'drill', topic, date(answered_at), COUNT(*), SUM(correct),
+       SUM(latency_ms), COUNT(*), 0, 0, 0
+FROM drill_attempts, rollup_mark m
+WHERE m.source = 'drill_attempts' AND id > m.from_id AND id <= m.to_id
+GROUP BY topic, date(answered_at);
+
+-- Command practice per command and per objective
+INSERT INTO rollup_delta
+SELECT 'command', command, date(practiced_at), SUM(attempts), SUM(successes), 0, 0, 0, 0, 0
+FROM command_practice, rollup_mark m
+WHERE m.source = 'command_practice' AND id > m.from_id AND id <= m.to_id
+GROUP BY command, date(practiced_at);
+
+INSERT INTO rollup_delta
+SELECT 'objective', objective_id, date(practiced_at), SUM(attempts), SUM(successes), 0, 0, 0, 0, 0
+FROM command_practice, rollup_mark m
+WHERE m.source = 'command_practice' AND id > m.from_id AND id <= m.to_id
+  AND objective_id IS NOT NULL
+GROUP BY objective_id, date(practiced_at);
+
+-- Lesson and skill-check sessions per topic ("lesson-grep" -> "grep")
+INSERT INTO rollup_delta
+SELECT 'topic', REPLACE(COALESCE(objectives_practiced, 'unknown'), 'lesson-', ''), date(started_at),
+       0, 0, 0, 0, 0, COUNT(*), 0
+FROM sessions, rollup_mark m
+WHERE m.source = 'sessions' AND id > m.from_id AND id <= m.to_id
+GROUP BY 2, date(started_at);
+
+-- Exam simulations per exam type
+INSERT INTO rollup_delta
+SELECT 'exam', exam_type, date(started_at), COUNT(*), SUM(CASE WHEN score >= 65 THEN 1 ELSE 0 END),
+       COALESCE(SUM(time_taken_seconds), 0) * 1000, COUNT(time_taken_seconds), 0, 0, COALESCE(SUM(score), 0)
+FROM exam_attempts, rollup_mark m
+WHERE m.source = 'exam_attempts' AND id > m.from_id AND id <= m.to_id
+GROUP BY exam_type, date(started_at);
+
+INSERT INTO progress_daily
+SELECT scope, key, day, SUM(attempts), SUM(successes), SUM(latency_ms_total),
+       SUM(latency_count), SUM(hints), SUM(sessions), SUM(score_total)
+FROM rollup_delta
+GROUP BY scope, key, day
+ON CONFLICT (scope, key, day) DO UPDATE SET
+    attempts = attempts + excluded.attempts,
+    successes = successes + excluded.successes,
+    latency_ms_total = latency_ms_total + excluded.latency_ms_total,
+    latency_count = latency_count + excluded.latency_count,
+    hints = hints + excluded.hints,
+    sessions = sessions + excluded.sessions,
+    score_total = score_total + excluded.score_total;
+
+INSERT INTO progress_weekly
+SELECT scope, key, date(day, 'weekday 0', '-6 days'), SUM(attempts), SUM(successes),
+       SUM(latency_ms_total), SUM(latency_count), SUM(hints), SUM(sessions), SUM(score_total)
+FROM rollup_delta
+GROUP BY scope, key, date(day, 'weekday 0', '-6 days')
+ON CONFLICT (scope, key, week) DO UPDATE SET
+    attempts = attempts + excluded.attempts,
+    successes = successes + excluded.successes,
+    latency_ms_total = latency_ms_total + excluded.latency_ms_total,
+    latency_count = latency_count + excluded.latency_count,
+    hints = hints + excluded.hints,
+    sessions = sessions + excluded.sessions,
+    score_total = score_total + excluded.score_total;
+
+UPDATE rollup_state
+SET last_id = (SELECT to_id FROM rollup_mark m WHERE m.source = rollup_state.source)
+WHERE source IN (SELECT source FROM rollup_mark);
+
+DROP TABLE temp.rollup_delta;
+DROP TABLE temp.rollup_mark;
+
+COMMIT;
@@ -0,0 +1,147 @@
+-- LPIC-1 Training - Progress Database Additions
+-- Tables added after the initial schema. Every statement is idempotent so
+-- this file is applied both to new databases (init-progress.sh) and lazily
+-- to existing ones (common.sh, the TUI services).
+
+-- Quick drill answers with millisecond reaction times
+CREATE TABLE IF NOT EXISTS drill_attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    question_id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    answered_at TEXT NOT NULL DEFAULT (datetime('now')),
+    correct INTEGER NOT NULL,
+    latency_ms INTEGER NOT NULL,
+    first_key_ms INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_drill_attempts_topic ON drill_attempts(topic, answered_at);
+CREATE INDEX IF NOT EXISTS idx_drill_attempts_question ON drill_attempts(question_id);
+
+-- Append-only log of exercise attempts ("topic:exercise_function")
+CREATE TABLE IF NOT EXISTS attempt_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    exercise_id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    attempted_at TEXT NOT NULL DEFAULT (datetime('now')),
+    correct INTEGER NOT NULL,
+    latency_ms INTEGER,
+    hints_used INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_attempt_events_exercise ON attempt_events(exercise_id, attempted_at);
+CREATE INDEX IF NOT EXISTS idx_attempt_events_topic ON attempt_events(topic, attempted_at);
+
+CREATE TRIGGER IF NOT EXISTS attempt_events_append_only
+BEFORE UPDATE ON attempt_events
+BEGIN
+    SELECT RAISE(ABORT, 'attempt_events is append-only');
+END;
+
+CREATE TRIGGER IF NOT EXISTS attempt_events_keep
+BEFORE DELETE ON attempt_events
+BEGIN
+    SELECT RAISE(ABORT, 'attempt_events is append-only');
+END;
+
+-- SM-2 schedule per exercise, maintained by the trigger below
+CREATE TABLE IF NOT EXISTS review_queue (
+    exercise_id TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    interval_days REAL NOT NULL DEFAULT 0,
+    ease REAL NOT NULL DEFAULT 2.5,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    last_attempt TEXT,
+    due_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_review_queue_due ON review_queue(due_at);
+CREATE INDEX IF NOT EXISTS idx_review_queue_topic ON review_queue(topic, due_at);
+
+-- Answer quality (SM-2 "q"): 5 unaided, 4 after one hint, 3 after more,
+-- 1 when the solution had to be shown. A failure resets the repetition
+-- count and brings the exercise back the next day.
+CREATE TRIGGER IF NOT EXISTS attempt_events_schedule
+AFTER INSERT ON attempt_events
+BEGIN
+    INSERT OR IGNORE INTO review_queue (exercise_id, topic, due_at)
+    VALUES (NEW.exercise_id, NEW.topic, NEW.attempted_at);
+
+    UPDATE review_queue SET
+        topic = NEW.topic,
+        repetitions = CASE WHEN NEW.correct THEN repetitions + 1 ELSE 0 END,
+        interval_days = CASE
+            WHEN NOT NEW.correct OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE ROUND(interval_days * ease, 1)
+        END,
+        ease = MAX(1.3, ease + 0.1 - (5 - (CASE
+            WHEN NOT NEW.correct THEN 1 WHEN NEW.hints_used = 0 THEN 5 WHEN NEW.hints_used = 1 THEN 4 ELSE 3
+        END)) * (0.08 + (5 - (CASE
+            WHEN NOT NEW.correct THEN 1 WHEN NEW.hints_used = 0 THEN 5 WHEN NEW.hints_used = 1 THEN 4 ELSE 3
+        END)) * 0.02)),
+        attempts = attempts + 1,
+        successes = successes + (CASE WHEN NEW.correct THEN 1 ELSE 0 END),
+        last_attempt = NEW.attempted_at,
+        due_at = datetime(julianday(NEW.attempted_at) + CASE
+            WHEN NOT NEW.correct OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE ROUND(interval_days * ease, 1)
+        END)
+    WHERE exercise_id = NEW.exercise_id;
+END;
+
+-- Practice deltas on the commands counters, so per-command and per-objective
+-- activity can be rolled up like the other append-only sources
+CREATE TABLE IF NOT EXISTS command_practice (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    command TEXT NOT NULL,
+    objective_id TEXT,
+    practiced_at TEXT NOT NULL DEFAULT (datetime('now')),
+    attempts INTEGER NOT NULL,
+    successes INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS commands_practice_log
+AFTER UPDATE OF attempts, successes ON commands
+WHEN NEW.attempts != OLD.attempts OR NEW.successes != OLD.successes
+BEGIN
+    INSERT INTO command_practice (command, objective_id, attempts, successes)
+    VALUES (NEW.command, NEW.objective_id, NEW.attempts - OLD.attempts, NEW.successes - OLD.successes);
+END;
+
+-- Daily and weekly activity per scope ('topic', 'objective', 'command',
+-- 'drill', 'exam'), filled by progress-rollup.sql. Weeks start on Monday.
+CREATE TABLE IF NOT EXISTS progress_daily (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    day TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    latency_ms_total INTEGER NOT NULL DEFAULT 0,
+    latency_count INTEGER NOT NULL DEFAULT 0,
+    hints INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    score_total INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, key, day)
+);
+
+CREATE TABLE IF NOT EXISTS progress_weekly (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    week TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    latency_ms_total INTEGER NOT NULL DEFAULT 0,
+    latency_count INTEGER NOT NULL DEFAULT 0,
+    hints INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    score_total INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, key, week)
+);
+
+-- Highest source row already folded into the rollups
+CREATE TABLE IF NOT EXISTS rollup_state (
+    source TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO rollup_state (source) VALUES
+    ('attempt_events'), ('drill_attempts'), ('command_practice'), ('sessions'), ('exam_attempts');
@@ -5,6 +5,10 @@
 
 set -euo pipefail
 
+# Get script directory (resolve symlinks)
+SCRIPT_DIR="$(cd "$(dirname "$(readlink -f "${BASH_SOURCE[0]}")")" && pwd)"
+APPS_DIR="$(cd "${SCRIPT_DIR}/.." && pwd)/apps"
+
 # Configuration
 LPIC_DIR="/opt/LPIC-1/data"
 DB_FILE="${LPIC_DIR}/progress.db"
@@ -34,7 +38,7 @@ declare -A CHALLENGES
 # Topic 103 - GNU and Unix Commands
 CHALLENGES["grep-basic"]="Find lines containing 'error' in a log file|grep 'error' FILE|grep error /var/log/syslog"
 CHALLENGES["grep-count"]="Count lines containing 'warning' in a file|grep -c 'warning' FILE|grep -c warning"
-CHALLENGES["grep-recursive"]="Recursively search for 'TODO' in current directory|grep -r 'TODO' .|grep -rn TODO"
+CHALLENGES["grep-recursive"]="Recursively search for 'TODO' in current directory|grep -r 'TODO' . OR grep -rn 'TODO' .|grep -rn TODO"
 CHALLENGES["grep-invert"]="Show lines NOT containing 'comment'|grep -v 'comment' FILE|grep -v comment"
 
 CHALLENGES["find-name"]="Find all .conf files in /etc|find /etc -name '*.conf'|find /etc -name *.conf"
@@ -46,9 +50,9 @@ CHALLENGES["sed-replace"]="Replace 'old' with 'new' in a file|sed 's/old/new/g'
 CHALLENGES["sed-delete"]="Delete lines containing 'remove'|sed '/remove/d' FILE|sed /remove/d"
 CHALLENGES["sed-line"]="Print only line 5 of a file|sed -n '5p' FILE|sed -n 5p"
 
-CHALLENGES["awk-print"]="Print second column of a file|awk '{print \$2}' FILE|awk {print \$2}"
-CHALLENGES["awk-sum"]="Sum the first column of a file|awk '{sum+=\$1} END{print sum}' FILE|awk sum"
-CHALLENGES["awk-filter"]="Print lines where column 3 > 100|awk '\$3 > 100' FILE|awk \$3 > 100"
+CHALLENGES["awk-print"]="Print second column of a file|awk '{print \$2}' FILE|awk '{print \$2}'"
+CHALLENGES["awk-sum"]="Sum the first column of a file|awk '{sum+=\$1} END{print sum}' FILE|awk '{sum+=\$1} END{print sum}'"
+CHALLENGES["awk-filter"]="Print lines where column 3 > 100|awk '\$3 > 100' FILE|awk '\$3 > 100'"
 
 CHALLENGES["tar-create"]="Create a gzipped archive of /home/user|tar -czvf archive.tar.gz /home/user|tar -czvf"
 CHALLENGES["tar-extract"]="Extract a tar.gz archive|tar -xzvf archive.tar.gz|tar -xzvf"
@@ -65,7 +69,7 @@ CHALLENGES["chmod-numeric"]="Set file permissions to rwxr-xr--|chmod 754 FILE|ch
 CHALLENGES["chmod-symbolic"]="Add execute permission for owner|chmod u+x FILE|chmod u+x"
 CHALLENGES["chown-both"]="Change owner to bob and group to staff|chown bob:staff FILE|chown bob:staff"
 
-CHALLENGES["ln-symbolic"]="Create symbolic link 'link' pointing to 'target'|ln -s target link|ln -s"
+CHALLENGES["ln-symbolic"]="Create symbolic link 'link' pointing to 'target'|ln -s target link OR ln -sf target link|ln -s"
 CHALLENGES["ln-hard"]="Create hard link 'hardlink' to 'file'|ln file hardlink|ln file"
 
 # Topic 107 - Administrative Tasks
@@ -73,21 +77,60 @@ CHALLENGES["useradd-home"]="Create user 'john' with home directory|useradd -m jo
 CHALLENGES["usermod-group"]="Add user 'john' to group 'docker'|usermod -aG docker john|usermod -aG"
 CHALLENGES["passwd-expire"]="Force user to change password on next login|passwd -e USERNAME|passwd -e"
 
-CHALLENGES["cron-minute"]="Run script every 5 minutes|*/5 * * * * /path/script.sh|*/5"
-CHALLENGES["cron-daily"]="Run script daily at 3:30 AM|30 3 * * * /path/script.sh|30 3"
-CHALLENGES["cron-weekday"]="Run script every Monday at 9 AM|0 9 * * 1 /path/script.sh|* * 1"
+CHALLENGES["cron-minute"]="Run script every 5 minutes|*/5 * * * * SCRIPT|*/5"
+CHALLENGES["cron-daily"]="Run script daily at 3:30 AM|30 3 * * * SCRIPT|30 3"
+CHALLENGES["cron-weekday"]="Run script every Monday at 9 AM|0 9 * * 1 SCRIPT|0 9 * * 1"
 
 # Topic 109 - Networking
 CHALLENGES["ip-addr"]="Show all IP addresses|ip addr OR ip a|ip addr"
 CHALLENGES["ip-route"]="Show routing table|ip route OR ip r|ip route"
-CHALLENGES["ss-listen"]="Show listening TCP ports|ss -tlnp|ss -tln"
+CHALLENGES["ss-listen"]="Show listening TCP ports|ss -tlnp OR ss -tln|ss -tln"
 
 CHALLENGES["dig-simple"]="Query DNS for example.com|dig example.com|dig"
 CHALLENGES["ping-count"]="Send exactly 3 pings to a host|ping -c 3 HOST|ping -c 3"
 
-# Get random challenge
+# Objective for each challenge topic (topic = challenge ID up to the first '-')
+# Upper-case words in answers (FILE, HOST, USERNAME, SCRIPT) match any argument
+declare -A CHALLENGE_OBJECTIVES
+CHALLENGE_OBJECTIVES["grep"]="103.7"
+CHALLENGE_OBJECTIVES["find"]="104.7"
+CHALLENGE_OBJECTIVES["sed"]="103.2"
+CHALLENGE_OBJECTIVES["awk"]="103.2"
+CHALLENGE_OBJECTIVES["tar"]="103.3"
+CHALLENGE_OBJECTIVES["ps"]="103.5"
+CHALLENGE_OBJECTIVES["kill"]="103.5"
+CHALLENGE_OBJECTIVES["chmod"]="104.5"
+CHALLENGE_OBJECTIVES["chown"]="104.5"
+CHALLENGE_OBJECTIVES["ln"]="104.6"
+CHALLENGE_OBJECTIVES["useradd"]="107.1"
+CHALLENGE_OBJECTIVES["usermod"]="107.1"
+CHALLENGE_OBJECTIVES["passwd"]="107.1"
+CHALLENGE_OBJECTIVES["cron"]="107.2"
+CHALLENGE_OBJECTIVES["ip"]="109.2"
+CHALLENGE_OBJECTIVES["ss"]="109.3"
+CHALLENGE_OBJECTIVES["dig"]="109.4"
+CHALLENGE_OBJECTIVES["ping"]="109.3"
+
+# Compiled challenge bank (apps/tui_textual/services/challenges.py)
+# Indexes the CHALLENGES above by topic and objective and matches answers on
+# canonical token form, so flag order and combined short flags don't matter.
+bank_available() {
+    command -v python3 &>/dev/null && [[ -f "${APPS_DIR}/tui_textual/cli.py" ]]
+}
+
+challenge_bank() {
+    PYTHONPATH="${APPS_DIR}${PYTHONPATH:+:$PYTHONPATH}" python3 -m tui_textual.cli challenge "$@"
+}
+
+# Get random challenge (topic prefix, objective ID, or "all")
 get_random_challenge() {
     local topic="${1:-all}"
+
+    if bank_available; then
+        challenge_bank pick "$topic" 2>/dev/null || echo ""
+        return
+    fi
+
     local keys=()
 
     for key in "${!CHALLENGES[@]}"; do
@@ -143,33 +186,36 @@ run_challenge() {
     end_time=$(date +%s)
     local time_taken=$((end_time - start_time))
 
-    # Normalize answers for comparison
-    local normalized_user normalized_answer
-    normalized_user=$(echo "$user_answer" | tr -s ' ' | sed 's/^ *//;s/ *$//')
-    normalized_answer=$(echo "$answer" | tr -s ' ' | sed 's/^ *//;s/ *$//')
-
-    # Check if answer is correct (flexible matching)
+    # Check answer against the compiled bank (canonical token matching)
     local correct=false
 
-    # Exact match
-    if [[ "$normalized_user" == "$normalized_answer" ]]; then
-        correct=true
-    fi
+    if bank_available; then
+        if challenge_bank check "$challenge_id" "$user_answer" 2>/dev/null; then
+            correct=true
+        fi
+    else
+        # Fallback without python3: whitespace-normalized exact match or key elements
+        local normalized_user normalized_answer
+        normalized_user=$(echo "$user_answer" | tr -s ' ' | sed 's/^ *//;s/ *$//')
+        normalized_answer=$(echo "$answer" | tr -s ' ' | sed 's/^ *//;s/ *$//')
 
-    # Check if user answer contains key elements
-    if [[ "$correct" == "false" ]]; then
-        # Split hint into key parts and check if all are present
-        local hint_parts
-        IFS=' ' read -ra hint_parts <<< "$hint"
-        local matches=0
-        for part in "${hint_parts[@]}"; do
-            if [[ "$normalized_user" == *"$part"* ]]; then
-                ((matches++)) || true
-            fi
-        done
-        if [[ $matches -eq ${#hint_parts[@]} ]]; then
+        if [[ "$normalized_user" == "$normalized_answer" ]]; then
             correct=true
         fi
+
+        if [[ "$correct" == "false" ]]; then
+            local hint_parts
+            IFS=' ' read -ra hint_parts <<< "$hint"
+            local matches=0
+            for part in "${hint_parts[@]}"; do
+                if [[ "$normalized_user" == *"$part"* ]]; then
+                    ((matches++)) || true
+                fi
+            done
+            if [[ $matches -eq ${#hint_parts[@]} ]]; then
+                correct=true
+            fi
+        fi
     fi
 
     echo
@@ -293,8 +339,19 @@ practice_command() {
 
     # Find challenges for this command
     local found=false
-    for key in "${!CHALLENGES[@]}"; do
-        if [[ "$key" == "$cmd"* ]]; then
+    local keys=()
+    if bank_available; then
+        mapfile -t keys < <(challenge_bank list "$cmd" 2>/dev/null | cut -f1)
+    else
+        for key in "${!CHALLENGES[@]}"; do
+            if [[ "$key" == "$cmd"* ]]; then
+                keys+=("$key")
+            fi
+        done
+    fi
+
+    for key in "${keys[@]}"; do
+        if [[ -n "$key" ]]; then
             found=true
             echo "Challenge: $key"
             run_challenge "$key" false
@@ -319,6 +376,7 @@ Usage: skill-checker.sh [command] [options]
 
 Commands:
   session [topic]     Run a practice session (default: 5 questions)
+                      topic may also be an objective (103.7) or area (103)
   practice <cmd>      Practice a specific command
   list                List available topics
   challenge <id>      Run a specific challenge
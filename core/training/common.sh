@@ -38,6 +38,7 @@ fi
 LPIC_DIR="/opt/LPIC-1/data"
 DB_FILE="${LPIC_DIR}/progress.db"
 PRACTICE_DIR="/opt/LPIC-1/practice"
+PROGRESS_SCHEMA="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/progress-schema.sql"
 
 # ============================================================================
 # Output Functions
@@ -155,6 +156,9 @@ show_progress_bar() {
 
 print_exercise() {
     local title="$1"
+    # Per-exercise counters picked up by record_exercise_attempt
+    EXERCISE_STARTED_MS=$(now_ms)
+    EXERCISE_HINTS=0
     echo
     echo -e "${BOLD}${GREEN}═══ Exercise: $title ═══${NC}"
     echo
@@ -175,6 +179,7 @@ print_task() {
 show_hint() {
     local level="$1"
     local hint="$2"
+    EXERCISE_HINTS=$(( ${EXERCISE_HINTS:-0} + 1 ))
     echo -e "\n${YELLOW}Hint $level:${NC}"
     echo -e "  $hint"
 }
@@ -258,19 +263,61 @@ validate_command_pattern() {
 # Progress Tracking
 # ============================================================================
 
+# Milliseconds since the epoch (EPOCHREALTIME avoids a fork on bash 5+)
+now_ms() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local now="${EPOCHREALTIME/[.,]/}"
+        echo $(( 10#$now / 1000 ))
+    else
+        date +%s%3N
+    fi
+}
+
+# Apply progress-schema.sql once per process so older databases gain the
+# event and review tables
+ensure_progress_schema() {
+    [[ -n "${PROGRESS_SCHEMA_READY:-}" ]] && return 0
+    [[ -f "$DB_FILE" && -f "$PROGRESS_SCHEMA" ]] || return 1
+    sqlite3 "$DB_FILE" < "$PROGRESS_SCHEMA" 2>/dev/null || return 1
+    PROGRESS_SCHEMA_READY=1
+}
+
+# Append an attempt event; the attempt_events_schedule trigger updates the
+# spaced-repetition queue. The exercise ID and topic come from the calling
+# exercise_* function and its exercises file ("permissions:exercise_chmod_add").
 record_exercise_attempt() {
-    local topic="$1"
+    local command="$1"
     local exercise="$2"
     local success="${3:-0}"
 
-    [[ ! -f "$DB_FILE" ]] && return
+    ensure_progress_schema || return 0
+
+    local topic="$command"
+    local exercise_id="${command}:${exercise}"
+    local i
+    for ((i = 1; i < ${#FUNCNAME[@]}; i++)); do
+        if [[ "${FUNCNAME[$i]}" == exercise_* ]]; then
+            local source_file="${BASH_SOURCE[$i]##*/}"
+            [[ "$source_file" == *-exercises.sh ]] && topic="${source_file%-exercises.sh}"
+            exercise_id="${topic}:${FUNCNAME[$i]}"
+            break
+        fi
+    done
 
-    local cmd_name="${topic}"
-    if [[ $success -eq 1 ]]; then
-        sqlite3 "$DB_FILE" "UPDATE commands SET successes = successes + 1, attempts = attempts + 1, last_practiced = datetime('now') WHERE command LIKE '%$cmd_name%' LIMIT 1;" 2>/dev/null || true
-    else
-        sqlite3 "$DB_FILE" "UPDATE commands SET attempts = attempts + 1, last_practiced = datetime('now') WHERE command LIKE '%$cmd_name%' LIMIT 1;" 2>/dev/null || true
+    local latency="NULL"
+    if [[ -n "${EXERCISE_STARTED_MS:-}" ]]; then
+        latency=$(( $(now_ms) - EXERCISE_STARTED_MS ))
     fi
+    local correct=0
+    [[ $success -eq 1 ]] && correct=1
+
+    sqlite3 "$DB_FILE" << SQL 2>/dev/null || true
+INSERT INTO attempt_events (exercise_id, topic, correct, latency_ms, hints_used)
+VALUES ('${exercise_id//\'/\'\'}', '${topic//\'/\'\'}', $correct, $latency, ${EXERCISE_HINTS:-0});
+UPDATE commands SET attempts = attempts + 1, successes = successes + $correct,
+       last_practiced = datetime('now')
+WHERE command = '${command//\'/\'\'}';
+SQL
 }
 
 record_lesson_complete() {
@@ -285,9 +332,11 @@ get_mastery_level() {
     local topic="$1"
 
     [[ ! -f "$DB_FILE" ]] && echo "unknown" && return
+    ensure_progress_schema || { echo "unknown"; return; }
 
+    # One review_queue row per exercise, found through idx_review_queue_topic
     local stats
-    stats=$(sqlite3 "$DB_FILE" "SELECT SUM(successes), SUM(attempts) FROM commands WHERE command LIKE '%$topic%';" 2>/dev/null) || {
+    stats=$(sqlite3 "$DB_FILE" "SELECT SUM(successes), SUM(attempts) FROM review_queue WHERE topic = '${topic//\'/\'\'}';" 2>/dev/null) || {
         echo "unknown"
         return
     }
@@ -601,18 +601,19 @@ _expert_thinking_generic() {
 # ============================================================================
 # Spaced Repetition Helpers
 # ============================================================================
-# Identifies weak commands and suggests optimal review timing
+# Reads the SM-2 review_queue that the attempt_events trigger keeps up to
+# date, so each lookup is an index seek rather than a scan of the history
 
-get_weak_commands() {
+get_weak_exercises() {
     local limit="${1:-5}"
 
-    [[ ! -f "$DB_FILE" ]] && return
+    ensure_progress_schema || return
 
-    # Get commands with attempts but low success rate
+    # Exercises with attempts but low success rate
     sqlite3 "$DB_FILE" << SQL
-SELECT command, successes, attempts,
+SELECT exercise_id, successes, attempts,
        ROUND(100.0 * successes / attempts, 0) as rate
-FROM commands
+FROM review_queue
 WHERE attempts >= 2
   AND (100.0 * successes / attempts) < 70
 ORDER BY rate ASC, attempts DESC
@@ -620,44 +621,40 @@ LIMIT $limit;
 SQL
 }
 
-get_stale_commands() {
-    local days="${1:-7}"
+get_due_exercises() {
+    local limit="${1:-5}"
 
-    [[ ! -f "$DB_FILE" ]] && return
+    ensure_progress_schema || return
 
-    # Get commands not practiced recently
+    # Exercises whose review date has passed, most overdue first
     sqlite3 "$DB_FILE" << SQL
-SELECT command,
-       COALESCE(julianday('now') - julianday(last_practiced), 999) as days_ago
-FROM commands
-WHERE attempts > 0
-  AND (last_practiced IS NULL
-       OR julianday('now') - julianday(last_practiced) > $days)
-ORDER BY days_ago DESC
-LIMIT 5;
+SELECT exercise_id, topic,
+       ROUND(julianday('now') - julianday(due_at), 1) as days_overdue
+FROM review_queue
+WHERE due_at <= datetime('now')
+ORDER BY due_at
+LIMIT $limit;
 SQL
 }
 
 suggest_review_topic() {
     [[ ! -f "$DB_FILE" ]] && echo "grep" && return
 
-    # Priority 1: Weak commands (low success rate)
-    local weak
-    weak=$(get_weak_commands 1)
-    if [[ -n "$weak" ]]; then
-        local cmd
-        cmd=$(echo "$weak" | cut -d'|' -f1)
-        _command_to_topic "$cmd"
+    # Priority 1: Most overdue exercise in the review queue
+    local due
+    due=$(get_due_exercises 1)
+    if [[ -n "$due" ]]; then
+        echo "$due" | cut -d'|' -f2
         return
     fi
 
-    # Priority 2: Stale commands (not practiced recently)
-    local stale
-    stale=$(get_stale_commands 1)
-    if [[ -n "$stale" ]]; then
-        local cmd
-        cmd=$(echo "$stale" | cut -d'|' -f1)
-        _command_to_topic "$cmd"
+    # Priority 2: Weak exercises (low success rate)
+    local weak
+    weak=$(get_weak_exercises 1)
+    if [[ -n "$weak" ]]; then
+        local exercise_id
+        exercise_id=$(echo "$weak" | cut -d'|' -f1)
+        echo "${exercise_id%%:*}"
         return
     fi
 
@@ -665,54 +662,35 @@ suggest_review_topic() {
     echo "grep"
 }
 
-_command_to_topic() {
-    local cmd="$1"
-
-    case "$cmd" in
-        grep|egrep|fgrep) echo "grep" ;;
-        sed) echo "sed" ;;
-        awk|gawk) echo "awk" ;;
-        find|locate) echo "find" ;;
-        tar|gzip|bzip2|xz) echo "tar" ;;
-        chmod|chown|chgrp|umask) echo "permissions" ;;
-        ps|kill|jobs|bg|fg|nice|nohup) echo "processes" ;;
-        useradd|usermod|userdel|groupadd|passwd) echo "users" ;;
-        ip|ss|ping|dig|netstat|traceroute) echo "networking" ;;
-        mount|umount|df|du|fdisk|lsblk|mkfs*) echo "filesystems" ;;
-        systemctl|journalctl) echo "systemd" ;;
-        *) echo "grep" ;;  # Default
-    esac
-}
-
 show_review_recommendation() {
     echo
     echo -e "${BOLD}${CYAN}Smart Review Recommendation${NC}"
     echo
 
     local weak
-    weak=$(get_weak_commands 3)
+    weak=$(get_weak_exercises 3)
     if [[ -n "$weak" ]]; then
-        echo -e "${YELLOW}Commands needing practice:${NC}"
-        while IFS='|' read -r cmd successes attempts rate; do
-            [[ -z "$cmd" ]] && continue
-            echo -e "  ${RED}•${NC} $cmd ($successes/$attempts = $rate%)"
+        echo -e "${YELLOW}Exercises needing practice:${NC}"
+        while IFS='|' read -r exercise_id successes attempts rate; do
+            [[ -z "$exercise_id" ]] && continue
+            echo -e "  ${RED}•${NC} $exercise_id ($successes/$attempts = $rate%)"
         done <<< "$weak"
         echo
     fi
 
-    local stale
-    stale=$(get_stale_commands 3)
-    if [[ -n "$stale" ]]; then
-        echo -e "${YELLOW}Haven't practiced recently:${NC}"
-        while IFS='|' read -r cmd days; do
-            [[ -z "$cmd" ]] && continue
+    local due
+    due=$(get_due_exercises 3)
+    if [[ -n "$due" ]]; then
+        echo -e "${YELLOW}Due for review:${NC}"
+        while IFS='|' read -r exercise_id topic days; do
+            [[ -z "$exercise_id" ]] && continue
             local days_int="${days%.*}"
-            if [[ "$days_int" -gt 30 ]]; then
-                echo -e "  ${RED}•${NC} $cmd (${days_int} days ago)"
+            if [[ "$days_int" -gt 7 ]]; then
+                echo -e "  ${RED}•${NC} $exercise_id (${days_int} days overdue)"
             else
-                echo -e "  ${YELLOW}•${NC} $cmd (${days_int} days ago)"
+                echo -e "  ${YELLOW}•${NC} $exercise_id (due)"
             fi
-        done <<< "$stale"
+        done <<< "$due"
         echo
     fi
 
@@ -28,6 +28,10 @@ pass() { echo "[OK] $1"; }
 python3 -c "import textual" &>/dev/null || fail "python3 or textual not available"
 pass "textual import"
 
+python3 -m unittest discover -s "$APPS_DIR/tests" -t "$(dirname "$APPS_DIR")" &>/dev/null \
+    || fail "service unit tests failed"
+pass "service unit tests"
+
 "$CORE_DIR/lpic-check" --help >/dev/null || fail "lpic-check help failed"
 pass "lpic-check"
 